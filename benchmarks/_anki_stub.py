@@ -0,0 +1,125 @@
+"""Minimal stand-in for Anki's ``aqt`` package so benchmarks run outside Anki.
+
+``install(data_root)`` registers a fake ``aqt`` module whose ``mw`` keeps the
+add-on's data under ``data_root``. With ``qt=True`` (requires PyQt6),
+``aqt.qt`` re-exports PyQt6 the way Anki does so the GUI modules import too.
+
+``load_addon()`` then imports the add-on folder as the ``languageforge``
+package without running its ``__init__`` (which would register menu actions
+and hooks on the real Anki main window).
+"""
+
+from __future__ import annotations
+
+import sys
+import types
+from pathlib import Path
+from concurrent.futures import Future
+from typing import Any, Callable, List
+
+ADDON_ROOT = Path(__file__).resolve().parent.parent
+PACKAGE = "languageforge"
+
+
+class _Hook(list):
+    """gui_hooks entries are lists of callbacks with ``append``/``remove``."""
+
+
+class _GuiHooks(types.ModuleType):
+    def __getattr__(self, name: str) -> _Hook:
+        hook = _Hook()
+        setattr(self, name, hook)
+        return hook
+
+
+class _AddonManager:
+    def __init__(self, root: Path) -> None:
+        self._root = root
+
+    def addonsFolder(self) -> str:
+        return str(self._root)
+
+
+class _ProfileManager:
+    def __init__(self) -> None:
+        self.dark = False
+
+    def night_mode(self) -> bool:
+        return self.dark
+
+
+class _TaskManager:
+    """Runs "background" tasks inline so benchmark timings stay deterministic.
+
+    The GUI only uses ``run_in_background(task, on_done(future))`` and
+    ``run_on_main(fn)``; the callbacks run before the call returns.
+    """
+
+    def run_in_background(self, task: Callable[[], Any], on_done: Callable[[Future], None]) -> None:
+        future: Future = Future()
+        try:
+            future.set_result(task())
+        except Exception as exc:
+            future.set_exception(exc)
+        on_done(future)
+
+    def run_on_main(self, fn: Callable[[], None]) -> None:
+        fn()
+
+
+class FakeMainWindow:
+    """The parts of ``aqt.mw`` the add-on touches."""
+
+    def __init__(self, root: Path) -> None:
+        self.addonManager = _AddonManager(root)
+        self.pm = _ProfileManager()
+        self.taskman = _TaskManager()
+        # No collection: deck lookups fall back to their empty results.
+        self.col = None
+
+    def findChild(self, *_args: Any) -> None:
+        return None
+
+    def reset(self) -> None:
+        pass
+
+
+def install(data_root: Path, qt: bool = False) -> FakeMainWindow:
+    data_root = Path(data_root)
+    data_root.mkdir(parents=True, exist_ok=True)
+    mw = FakeMainWindow(data_root)
+
+    aqt = types.ModuleType("aqt")
+    aqt.mw = mw  # type: ignore[attr-defined]
+    aqt.gui_hooks = _GuiHooks("aqt.gui_hooks")  # type: ignore[attr-defined]
+    aqt.__path__ = []  # type: ignore[attr-defined]
+    sys.modules["aqt"] = aqt
+    sys.modules["aqt.gui_hooks"] = aqt.gui_hooks  # type: ignore[attr-defined]
+
+    if qt:
+        from PyQt6 import QtCore, QtGui, QtWidgets
+
+        qt_module = types.ModuleType("aqt.qt")
+        for source in (QtCore, QtGui, QtWidgets):
+            for name in dir(source):
+                if not name.startswith("_"):
+                    setattr(qt_module, name, getattr(source, name))
+        qt_module.pyqtSignal = QtCore.pyqtSignal  # type: ignore[attr-defined]
+        aqt.qt = qt_module  # type: ignore[attr-defined]
+        sys.modules["aqt.qt"] = qt_module
+    return mw
+
+
+def load_addon() -> types.ModuleType:
+    """Import the add-on folder as a package, skipping its ``__init__``."""
+
+    package = sys.modules.get(PACKAGE)
+    if package is None:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [str(ADDON_ROOT)]  # type: ignore[attr-defined]
+        sys.modules[PACKAGE] = package
+    return package
+
+
+def submodules() -> List[str]:
+    return sorted(name for name in sys.modules if name.startswith(PACKAGE + "."))
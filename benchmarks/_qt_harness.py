@@ -0,0 +1,71 @@
+"""Helpers for benchmarks that drive the add-on's Qt widgets offscreen.
+
+Import after ``_anki_stub.install(..., qt=True)``. The offscreen platform
+is selected here unless QT_QPA_PLATFORM is already set.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Dict
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEvent, QObject  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+
+def application() -> QApplication:
+    return QApplication.instance() or QApplication([])
+
+
+def settle(app: QApplication) -> float:
+    """Run deferred layouts, deletes and paints; return the busy seconds.
+
+    The offscreen platform delivers paints from a timer, so the event loop
+    is given a few idle gaps (not counted in the returned time). Without a
+    running exec() loop deleteLater() never fires, so deferred deletes are
+    flushed by hand.
+    """
+
+    busy = 0.0
+    for _ in range(4):
+        start = time.perf_counter()
+        app.processEvents()
+        app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        busy += time.perf_counter() - start
+        time.sleep(0.02)
+    return busy
+
+
+class EventCounter(QObject):
+    """Application-wide event filter counting layout passes and paints.
+
+    A "layout pass" is a LayoutRequest event delivered to a widget, i.e.
+    one QLayout activation.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.layouts = 0
+        self.paints = 0
+
+    def eventFilter(self, _obj, event) -> bool:  # type: ignore[override]
+        kind = event.type()
+        if kind == QEvent.Type.Paint:
+            self.paints += 1
+        elif kind == QEvent.Type.LayoutRequest:
+            self.layouts += 1
+        return False
+
+    def reset(self) -> None:
+        self.layouts = 0
+        self.paints = 0
+
+    def snapshot(self) -> Dict[str, int]:
+        return {"layouts": self.layouts, "paints": self.paints}
+
+
+def widget_count(app: QApplication) -> int:
+    return len(app.allWidgets())
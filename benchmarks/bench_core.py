@@ -0,0 +1,211 @@
+"""Time the core logic layer against synthetic profiles of growing size.
+
+Run from the add-on folder (no Anki required; ``aqt`` is stubbed):
+
+    python benchmarks/bench_core.py                      # all presets, table
+    python benchmarks/bench_core.py --preset small --json results.json
+    python benchmarks/bench_core.py --format binary      # storage format
+
+Each operation is timed ``--repeat`` times. "cold" loads drop the shared
+document cache first (core.store.invalidate_documents), so they include
+reading and parsing the file; "warm" loads hit the cache. Saves include
+encoding and writing the file in the ``--format`` storage format (see
+core/codec.py); the synthetic profile is converted to it before timing.
+
+``--json`` writes a machine-readable report (``-`` for stdout) with one
+record per (preset, operation) plus environment metadata, so results from
+different releases can be compared.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import _anki_stub  # noqa: E402
+import synthetic  # noqa: E402
+
+SCHEMA_VERSION = 1
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=_anki_stub.ADDON_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def _measure(fn: Callable[[], Any], repeat: int, setup: Optional[Callable[[], Any]] = None) -> Dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(samples), 4),
+        "median_ms": round(statistics.median(samples), 4),
+        "max_ms": round(max(samples), 4),
+    }
+
+
+def _operations(lf: str) -> Dict[str, Dict[str, Callable[[], Any]]]:
+    """Return ``{name: {"run": fn, "setup": fn?}}`` for the loaded add-on."""
+
+    store = import_module(lf + ".core.store")
+    goals = import_module(lf + ".core.logic_goals")
+    tracker = import_module(lf + ".core.logic_tracker")
+    radar = import_module(lf + ".core.logic_radar")
+    resources = import_module(lf + ".core.logic_resources")
+    models = import_module(lf + ".core.models")
+
+    month = "2025-12"
+    state: Dict[str, Any] = {}
+
+    def toggle_today() -> None:
+        activity = state.setdefault("activity", tracker.load_daily_activity())
+        tracker.toggle_skill(activity, "2025-12-31", 0)
+        tracker.save_daily_activity(activity)
+
+    def edit_goals() -> None:
+        current = goals.load_goals_for_month(month)
+        current.completed[0] = not current.completed[0]
+        goals.save_goals_for_month(current)
+
+    def snapshot() -> None:
+        state["radar"] = state.get("radar", 0) % 5 + 1
+        radar.save_radar_snapshot(models.RadarSnapshot(month, [state["radar"], 3, 2, 4]))
+
+    def save_all_resources() -> None:
+        items = state.get("resources")
+        if items is None:
+            items = [models.ResourceItem.from_dict(raw) for raw in resources.load_resources()]
+            state["resources"] = items
+        resources.save_resources(items)
+
+    cold = store.invalidate_documents
+    return {
+        "load_daily_activity (cold)": {"run": tracker.load_daily_activity, "setup": cold},
+        "load_daily_activity (warm)": {"run": tracker.load_daily_activity},
+        "save_daily_activity (1 day)": {"run": toggle_today},
+        "load_goals_for_month (cold)": {"run": lambda: goals.load_goals_for_month(month), "setup": cold},
+        "load_goals_for_month (warm)": {"run": lambda: goals.load_goals_for_month(month)},
+        "save_goals_for_month": {"run": edit_goals},
+        "load_radar_snapshots (cold)": {"run": radar.load_radar_snapshots, "setup": cold},
+        "save_radar_snapshot": {"run": snapshot},
+        "load_resources (cold)": {"run": resources.load_resources, "setup": cold},
+        "load_recent_resources (warm)": {"run": lambda: resources.load_recent_resources(5)},
+        "save_resources": {"run": save_all_resources},
+    }
+
+
+def run(presets: List[str], repeat: int, fmt: str = "pretty") -> Dict[str, Any]:
+    records = []
+    with tempfile.TemporaryDirectory() as tmp:
+        mw = _anki_stub.install(Path(tmp) / "unused")
+        lf = _anki_stub.load_addon().__name__
+        store = import_module(lf + ".core.store")
+        storage = import_module(lf + ".core.storage")
+        profiles = import_module(lf + ".core.logic_profiles")
+        storage.set_storage_format(fmt)
+
+        for preset in presets:
+            size = synthetic.PRESETS[preset]
+            # A fresh add-on folder per preset; the active profile id stays
+            # "default" so only the cached documents need dropping.
+            mw.addonManager._root = Path(tmp) / preset
+            profile_dir = profiles.get_profile_data_dir(profiles.get_active_profile_id())
+            synthetic.write_profile(profile_dir, **size)
+            storage.convert_profile_files(profiles.get_active_profile_id(), fmt)
+            file_sizes = {path.name: path.stat().st_size for path in sorted(profile_dir.glob("*.json"))}
+            store.invalidate_documents()
+
+            for name, op in _operations(lf).items():
+                # One untimed call so lazy imports and first saves do not
+                # skew the first sample.
+                if "setup" in op:
+                    op["setup"]()
+                op["run"]()
+                timing = _measure(op["run"], repeat, op.get("setup"))
+                records.append(
+                    {"preset": preset, "format": fmt, "operation": name, "repeat": repeat, **timing}
+                )
+            records.append(
+                {"preset": preset, "format": fmt, "operation": "(profile)", "size": size, "bytes": file_sizes}
+            )
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": records,
+    }
+
+
+def _print_table(report: Dict[str, Any]) -> None:
+    print(f"{'preset':<8}{'operation':<32}{'min (ms)':>12}{'median (ms)':>14}")
+    for record in report["results"]:
+        if "median_ms" not in record:
+            sizes = ", ".join(f"{k} {v // 1024} KiB" for k, v in record["bytes"].items())
+            print(f"{record['preset']:<8}{'files: ' + sizes}")
+            continue
+        print(
+            f"{record['preset']:<8}{record['operation']:<32}"
+            f"{record['min_ms']:>12.3f}{record['median_ms']:>14.3f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--preset",
+        action="append",
+        choices=sorted(synthetic.PRESETS),
+        help="profile size to run (repeatable; default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="samples per operation")
+    parser.add_argument(
+        "--format",
+        choices=("pretty", "compact", "binary"),
+        default="pretty",
+        help="storage format for profile documents",
+    )
+    parser.add_argument("--json", metavar="PATH", help="write JSON results ('-' for stdout)")
+    args = parser.parse_args()
+
+    presets = args.preset or list(synthetic.PRESETS)
+    report = run(presets, max(1, args.repeat), args.format)
+
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    _print_table(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Count layout passes and paints for the dock's bulk widget updates.
+
+Run from the add-on folder (needs PyQt6, no Anki):
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_layout.py
+
+Each scenario runs with ``gui.widgets.suspended_updates`` replaced by a
+no-op ("none"), as shipped ("batched"), and with an extra
+``setUpdatesEnabled(False)`` around the block ("no-paint"). The last mode
+is why the shipped helper leaves painting alone: re-enabling updates
+repaints the whole subtree. A "layout pass" is a LayoutRequest event
+delivered to a widget, i.e. one QLayout activation.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import _anki_stub  # noqa: E402
+
+ITERATIONS = 10
+
+
+def _seed(lf) -> None:
+    from importlib import import_module
+
+    goals = import_module(lf + ".core.logic_goals")
+    models = import_module(lf + ".core.models")
+    resources = import_module(lf + ".core.logic_resources")
+
+    month = goals.get_current_month_id()
+    goals.save_goals_for_month(
+        models.MonthlyGoals(
+            month,
+            [f"Goal {i}" for i in range(3)],
+            [False, True, False],
+            subtasks=[[f"Step {i}.{j}" for j in range(8)] for i in range(3)],
+            subtasks_done=[[j % 2 == 0 for j in range(8)] for _ in range(3)],
+        )
+    )
+    resources.save_resources(
+        [
+            models.ResourceItem(str(i), "Book", f"Resource {i}", "", "", None)
+            for i in range(20)
+        ]
+    )
+
+
+@contextlib.contextmanager
+def _noop_suspended_updates(_widget, *_quiet):
+    yield
+
+
+def _no_paint(shipped):
+    @contextlib.contextmanager
+    def suspended(widget, *quiet):
+        enabled = widget.updatesEnabled()
+        widget.setUpdatesEnabled(False)
+        try:
+            with shipped(widget, *quiet):
+                yield
+        finally:
+            widget.setUpdatesEnabled(enabled)
+
+    return suspended
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        _anki_stub.install(Path(tmp), qt=True)
+        lf = _anki_stub.load_addon().__name__
+
+        from importlib import import_module
+
+        from _qt_harness import EventCounter, application, settle
+
+        app = application()
+        _seed(lf)
+
+        main_window = import_module(lf + ".gui.main_window")
+        shipped = import_module(lf + ".gui.widgets").suspended_updates
+        modes = {
+            "none": _noop_suspended_updates,
+            "batched": shipped,
+            "no-paint": _no_paint(shipped),
+        }
+        patched = [
+            import_module(lf + ".gui." + name)
+            for name in ("main_window", "tracker_view", "goals_view", "dashboard_view")
+        ]
+
+        window = main_window.LanguageForgeWindow()
+        window.resize(600, 900)
+        window.show()
+        settle(app)
+
+        counter = EventCounter()
+        app.installEventFilter(counter)
+
+        themes = import_module(lf + ".core.themes")
+        palettes = [themes.get_theme_colors("light"), themes.get_theme_colors("dark")]
+
+        def switch_theme() -> None:
+            # Alternate palettes so every call really restyles the views.
+            palettes.reverse()
+            window._current_theme_colors = palettes[0]
+            window._apply_theme_to_all_views()
+
+        def show_tab(view) -> Callable[[], None]:
+            return lambda: window.tabs.setCurrentWidget(view)
+
+        scenarios: Dict[str, Tuple[Callable[[], None], Callable[[], None]]] = {
+            "tracker _load_month": (
+                show_tab(window.tracker_view), window.tracker_view._load_month
+            ),
+            "goals _load_month": (
+                show_tab(window.goals_view), window.goals_view._load_month
+            ),
+            "dashboard resources preview": (
+                show_tab(window.dashboard_view),
+                window.dashboard_view._populate_resources_preview,
+            ),
+            "_apply_theme_to_all_views": (
+                show_tab(window.dashboard_view), switch_theme
+            ),
+        }
+
+        print(f"{'scenario':32} {'mode':9} {'layouts':>8} {'paints':>8} {'ms/iter':>8}")
+        for name, (setup, action) in scenarios.items():
+            for mode, replacement in modes.items():
+                for module in patched:
+                    module.suspended_updates = replacement
+                try:
+                    setup()
+                    # One untimed call so first-use costs (style polish,
+                    # font caches) do not land on whichever mode runs first.
+                    action()
+                    settle(app)
+                    counter.reset()
+                    busy = 0.0
+                    for _ in range(ITERATIONS):
+                        start = time.perf_counter()
+                        action()
+                        busy += time.perf_counter() - start + settle(app)
+                    elapsed = busy * 1000 / ITERATIONS
+                    layouts, paints = counter.layouts, counter.paints
+                finally:
+                    for module in patched:
+                        module.suspended_updates = shipped
+                print(
+                    f"{name:32} {mode:9} {layouts / ITERATIONS:8.1f} "
+                    f"{paints / ITERATIONS:8.1f} {elapsed:8.2f}"
+                )
+
+        window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Microbenchmark: model serialization vs. the old ``dataclasses.asdict`` path.
+
+Run from the add-on folder:
+
+    python benchmarks/bench_models.py
+
+Only ``core.models`` is imported, so no Anki installation is required.
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+from dataclasses import dataclass, asdict, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.models import MonthlyGoals, RadarSnapshot, ResourceItem  # noqa: E402
+
+
+# Mirrors of the previous dataclass models, kept here only for comparison.
+@dataclass
+class _LegacyResourceItem:
+    id: str
+    type: str
+    name: str
+    link: str
+    notes: str
+    deck_name: Optional[str]
+    tags: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class _LegacyMonthlyGoals:
+    month: str
+    goals: List[str]
+    completed: List[bool]
+    notes: str = ""
+    archived: bool = False
+    categories: List[str] = field(default_factory=list)
+    reflections: List[str] = field(default_factory=list)
+    subtasks: List[List[str]] = field(default_factory=list)
+    subtasks_done: List[List[bool]] = field(default_factory=list)
+    created_at: List[str] = field(default_factory=list)
+    completed_at: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class _LegacyRadarSnapshot:
+    month: str
+    reading: int
+    listening: int
+    speaking: int
+    writing: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _resource_kwargs(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"id-{i}",
+        "type": "Book",
+        "name": f"Resource {i}",
+        "link": f"https://example.com/{i}",
+        "notes": "Some notes",
+        "deck_name": "Japanese::Core",
+        "tags": ["listening", "JLPT", "grammar"],
+    }
+
+
+def _goals_kwargs(month: str) -> Dict[str, Any]:
+    return {
+        "month": month,
+        "goals": ["Read a book", "Shadow 10 episodes", "Write a diary"],
+        "completed": [True, False, False],
+        "categories": ["Reading", "Listening", "Writing"],
+        "reflections": ["Went well", "", ""],
+        "subtasks": [["ch 1", "ch 2", "ch 3"], ["ep 1", "ep 2"], []],
+        "subtasks_done": [[True, True, False], [True, False], []],
+        "created_at": ["2025-01-01T10:00:00"] * 3,
+        "completed_at": ["2025-01-10T10:00:00", "", ""],
+    }
+
+
+def _time(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5))
+
+
+def main() -> None:
+    n_resources = 1000
+    new_res = [ResourceItem(**_resource_kwargs(i)) for i in range(n_resources)]
+    old_res = [_LegacyResourceItem(**_resource_kwargs(i)) for i in range(n_resources)]
+
+    months = [f"{2000 + y}-{m:02d}" for y in range(20) for m in range(1, 13)]
+    new_goals = [MonthlyGoals(**_goals_kwargs(m)) for m in months]
+    old_goals = [_LegacyMonthlyGoals(**_goals_kwargs(m)) for m in months]
+
+    new_radar = [RadarSnapshot(m, [3, 4, 2, 5]) for m in months]
+    old_radar = [_LegacyRadarSnapshot(m, 3, 4, 2, 5) for m in months]
+
+    cases = [
+        (f"ResourceItem.to_dict x{n_resources}", old_res, new_res),
+        (f"MonthlyGoals.to_dict x{len(months)}", old_goals, new_goals),
+        (f"RadarSnapshot.to_dict x{len(months)}", old_radar, new_radar),
+    ]
+
+    print(f"{'case':<34}{'asdict (ms)':>14}{'slots (ms)':>14}{'speedup':>10}")
+    for label, old, new in cases:
+        assert [o.to_dict() for o in old] == [n.to_dict() for n in new]
+        t_old = _time(lambda: [o.to_dict() for o in old], number=20) / 20
+        t_new = _time(lambda: [n.to_dict() for n in new], number=20) / 20
+        print(
+            f"{label:<34}{t_old * 1000:>14.3f}{t_new * 1000:>14.3f}"
+            f"{t_old / t_new:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""Drive the LanguageForge dock offscreen and measure UI hot paths.
+
+Run from the add-on folder (needs PyQt6, no Anki):
+
+    python benchmarks/bench_ui.py                         # medium profile
+    python benchmarks/bench_ui.py --preset large --json ui.json
+
+The window and each view are built against a synthetic profile (see
+synthetic.py) with a stubbed ``aqt``. Scripted scenarios then run against
+the live window: month navigation, tracker toggles, theme switches, font
+changes, resource searches and profile switches. For every scenario the
+harness reports:
+
+- wall time: time spent in the scenario and in the event loop it
+  triggered, leaving out the idle gaps the offscreen platform needs before
+  it delivers paints;
+- paint events and layout passes delivered to any widget;
+- widgets alive afterwards and the change over the scenario. A growing
+  count means widgets leak.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import date
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import _anki_stub  # noqa: E402
+import synthetic  # noqa: E402
+
+SCHEMA_VERSION = 1
+THEMES = ("light", "dark", "zen", "high_contrast", "japanese_pastel", "anki_auto")
+FONT_SIZES = ("9", "11", "13", "15", "medium")
+SEARCHES = ("res", "resource 1", "tag:jlpt", "book", "no such resource", "")
+TRACKER_TOGGLES = 100
+
+
+class Harness:
+    def __init__(self, lf: str, app, counter, settle: Callable, widget_count: Callable) -> None:
+        self.lf = lf
+        self.app = app
+        self.counter = counter
+        self._settle = settle
+        self._widget_count = widget_count
+        self.busy = 0.0
+        self.records: List[Dict[str, Any]] = []
+
+    def module(self, name: str):
+        return import_module(f"{self.lf}.{name}")
+
+    def step(self, action: Callable[[], Any]) -> Any:
+        """Run one scripted action and let the event loop catch up."""
+
+        start = time.perf_counter()
+        result = action()
+        self.busy += time.perf_counter() - start + self._settle(self.app)
+        return result
+
+    def scenario(self, name: str, run: Callable[["Harness"], int]) -> None:
+        self._settle(self.app)
+        before = self._widget_count(self.app)
+        self.counter.reset()
+        self.busy = 0.0
+        actions = run(self)
+        counts = self.counter.snapshot()
+        after = self._widget_count(self.app)
+        self.records.append(
+            {
+                "scenario": name,
+                "actions": actions,
+                "wall_ms": round(self.busy * 1000, 3),
+                "paints": counts["paints"],
+                "layouts": counts["layouts"],
+                "widgets": after,
+                "widgets_delta": after - before,
+            }
+        )
+
+
+# Scenarios -----------------------------------------------------------------
+# Each takes the harness (and the window where relevant) and returns the
+# number of scripted actions it performed.
+
+def _construct_view(class_path: str) -> Callable[[Harness], int]:
+    module_name, class_name = class_path.rsplit(".", 1)
+
+    def run(h: Harness) -> int:
+        cls = getattr(h.module(module_name), class_name)
+        view = h.step(cls)
+        h.step(view.show)
+        # Keep the view alive until counted, then drop it.
+        h._built = view  # type: ignore[attr-defined]
+        return 1
+
+    return run
+
+
+def _discard_built(h: Harness) -> None:
+    view = getattr(h, "_built", None)
+    if view is not None:
+        view.close()
+        view.deleteLater()
+        h._built = None  # type: ignore[attr-defined]
+        h._settle(h.app)
+
+
+def _month_navigation(window, view_name: str) -> Callable[[Harness], int]:
+    def run(h: Harness) -> int:
+        view = getattr(window, view_name)
+        h.step(lambda: window.tabs.setCurrentWidget(view))
+        if hasattr(view, "show_archived_checkbox"):
+            h.step(lambda: view.show_archived_checkbox.setChecked(True))
+        combo = view.month_combo
+        steps = min(12, combo.count())
+        for i in range(steps):
+            h.step(lambda i=i: combo.setCurrentIndex(combo.count() - 1 - i))
+        return steps
+
+    return run
+
+
+def _tracker_toggles(window) -> Callable[[Harness], int]:
+    def run(h: Harness) -> int:
+        circle_cls = h.module("gui.widgets").CircleIndicator
+        view = window.tracker_view
+        h.step(lambda: window.tabs.setCurrentWidget(view))
+        circles = view.grid_container.findChildren(circle_cls)
+        if not circles:
+            return 0
+
+        def toggle_batch(start: int) -> None:
+            for i in range(start, min(start + 10, TRACKER_TOGGLES)):
+                circles[i % len(circles)].clicked.emit()
+
+        # Let the event loop run every ten clicks, roughly a fast user.
+        for start in range(0, TRACKER_TOGGLES, 10):
+            h.step(lambda start=start: toggle_batch(start))
+        return TRACKER_TOGGLES
+
+    return run
+
+
+def _settings_changes(window, field: str, values) -> Callable[[Harness], int]:
+    def run(h: Harness) -> int:
+        settings_cls = h.module("core.logic_settings").Settings
+        h.step(lambda: window.tabs.setCurrentWidget(window.dashboard_view))
+        for value in values:
+            current = window._settings.to_dict()
+            current[field] = value
+            h.step(lambda c=current: window._on_settings_changed(settings_cls(**c)))
+        return len(values)
+
+    return run
+
+
+def _resource_searches(window) -> Callable[[Harness], int]:
+    def run(h: Harness) -> int:
+        view = window.resources_view
+        h.step(lambda: window.tabs.setCurrentWidget(view))
+        for query in SEARCHES:
+            h.step(lambda q=query: view.search_edit.setText(q))
+        return len(SEARCHES)
+
+    return run
+
+
+def _profile_switches(window, switches: int = 6) -> Callable[[Harness], int]:
+    def run(h: Harness) -> int:
+        h.step(lambda: window.tabs.setCurrentWidget(window.dashboard_view))
+        combo = window.profile_combo
+        for i in range(switches):
+            h.step(lambda i=i: combo.setCurrentIndex((combo.currentIndex() + 1) % combo.count()))
+        return switches
+
+    return run
+
+
+def run(preset: str) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        _anki_stub.install(Path(tmp), qt=True)
+        lf = _anki_stub.load_addon().__name__
+
+        from _qt_harness import EventCounter, application, settle, widget_count
+
+        app = application()
+        profiles = import_module(lf + ".core.logic_profiles")
+        size = synthetic.PRESETS[preset]
+        today = date.today()
+
+        # Two profiles with the same amount of data so switches do real work.
+        profiles.initialize_profiles_system()
+        profiles.create_profile("Bench B")
+        for seed, profile in enumerate(profiles.list_profiles()):
+            synthetic.write_profile(
+                profiles.get_profile_data_dir(profile["id"]), seed=seed, end=today, **size
+            )
+
+        counter = EventCounter()
+        app.installEventFilter(counter)
+        h = Harness(lf, app, counter, settle, widget_count)
+
+        for class_path in (
+            "gui.tracker_view.TrackerView",
+            "gui.goals_view.GoalsView",
+            "gui.resources_view.ResourcesView",
+            "gui.radar_view.RadarView",
+            "gui.dashboard_view.DashboardView",
+        ):
+            h.scenario(f"construct {class_path.rsplit('.', 1)[1]}", _construct_view(class_path))
+            _discard_built(h)
+
+        h.scenario("construct LanguageForgeWindow", _construct_view("gui.main_window.LanguageForgeWindow"))
+        window = h._built  # type: ignore[attr-defined]
+        window.resize(600, 900)
+
+        h.scenario("tracker month navigation", _month_navigation(window, "tracker_view"))
+        h.scenario("goals month navigation", _month_navigation(window, "goals_view"))
+        h.scenario(f"tracker toggles x{TRACKER_TOGGLES}", _tracker_toggles(window))
+        h.scenario("theme switches", _settings_changes(window, "theme", THEMES))
+        h.scenario("font changes", _settings_changes(window, "font_size", FONT_SIZES))
+        h.scenario("resource searches", _resource_searches(window))
+        h.scenario("profile switches", _profile_switches(window))
+        _discard_built(h)
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "preset": preset,
+        "size": size,
+        "results": h.records,
+    }
+
+
+def _print_table(report: Dict[str, Any]) -> None:
+    print(f"preset: {report['preset']} {report['size']}")
+    print(
+        f"{'scenario':<32}{'actions':>8}{'wall (ms)':>11}{'paints':>8}"
+        f"{'layouts':>9}{'widgets':>9}{'delta':>7}"
+    )
+    for r in report["results"]:
+        print(
+            f"{r['scenario']:<32}{r['actions']:>8}{r['wall_ms']:>11.1f}{r['paints']:>8}"
+            f"{r['layouts']:>9}{r['widgets']:>9}{r['widgets_delta']:>+7}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--preset", choices=sorted(synthetic.PRESETS), default="medium")
+    parser.add_argument("--json", metavar="PATH", help="write JSON results ('-' for stdout)")
+    args = parser.parse_args()
+
+    report = run(args.preset)
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+        return
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    _print_table(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Synthetic LanguageForge profiles for benchmarks.
+
+Data is generated directly in the on-disk JSON layout (not through
+``core.models``) so a profile built here stays comparable across releases
+even when the in-memory models change. Generation is seeded and
+deterministic.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List
+
+SKILL_KEYS = ("reading", "listening", "speaking", "writing")
+RESOURCE_TYPES = ("Book", "Podcast", "Video", "Website", "App", "Course")
+
+# name -> (tracker years, goal months, radar months, resources)
+PRESETS: Dict[str, Dict[str, int]] = {
+    "small": {"years": 1, "goal_months": 12, "radar_months": 12, "resources": 500},
+    "medium": {"years": 5, "goal_months": 120, "radar_months": 60, "resources": 5000},
+    "large": {"years": 20, "goal_months": 600, "radar_months": 240, "resources": 50000},
+}
+
+
+def _months(count: int, end: date) -> List[str]:
+    year, month = end.year, end.month
+    months = []
+    for _ in range(count):
+        months.append(f"{year:04d}-{month:02d}")
+        month -= 1
+        if month == 0:
+            year, month = year - 1, 12
+    months.reverse()
+    return months
+
+
+def tracker_document(years: int, rng: random.Random, end: date) -> Dict[str, Dict[str, bool]]:
+    start = end - timedelta(days=365 * years)
+    data = {}
+    day = start
+    while day <= end:
+        # Roughly two active days out of three, as in a real study habit.
+        if rng.random() < 0.66:
+            data[day.isoformat()] = {key: rng.random() < 0.5 for key in SKILL_KEYS}
+        day += timedelta(days=1)
+    return data
+
+
+def goals_document(months: int, rng: random.Random, end: date) -> Dict[str, Dict[str, Any]]:
+    data = {}
+    for month in _months(months, end):
+        subtasks = [[f"Step {i}.{j}" for j in range(rng.randint(0, 6))] for i in range(3)]
+        data[month] = {
+            "month": month,
+            "goals": [f"Goal {i} for {month}" for i in range(3)],
+            "completed": [rng.random() < 0.5 for _ in range(3)],
+            "notes": "",
+            "archived": month != end.strftime("%Y-%m"),
+            "categories": [rng.choice(SKILL_KEYS).capitalize() for _ in range(3)],
+            "reflections": ["Went well" if rng.random() < 0.3 else "" for _ in range(3)],
+            "subtasks": subtasks,
+            "subtasks_done": [[rng.random() < 0.5 for _ in s] for s in subtasks],
+            "created_at": [f"{month}-01T10:00:00"] * 3,
+            "completed_at": ["", "", ""],
+        }
+    return data
+
+
+def radar_document(months: int, rng: random.Random, end: date) -> Dict[str, Dict[str, Any]]:
+    data = {}
+    for month in _months(months, end):
+        entry: Dict[str, Any] = {"month": month}
+        entry.update({key: rng.randint(1, 5) for key in SKILL_KEYS})
+        data[month] = entry
+    return data
+
+
+def resources_document(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": f"res-{i}",
+            "type": rng.choice(RESOURCE_TYPES),
+            "name": f"Resource {i}",
+            "link": f"https://example.com/{i}" if rng.random() < 0.7 else "",
+            "notes": "Some notes" if rng.random() < 0.4 else "",
+            "deck_name": "Japanese::Core" if rng.random() < 0.2 else None,
+            "tags": rng.sample(("grammar", "JLPT", "listening", "kanji", "news"), 2),
+        }
+        for i in range(count)
+    ]
+
+
+def write_profile(
+    profile_dir: Path,
+    years: int,
+    goal_months: int,
+    radar_months: int,
+    resources: int,
+    seed: int = 0,
+    end: date = date(2025, 12, 31),
+) -> Dict[str, int]:
+    """Write a synthetic profile and return the on-disk size of each file."""
+
+    rng = random.Random(seed)
+    documents = {
+        "tracker.json": tracker_document(years, rng, end),
+        "goals_v2.json": goals_document(goal_months, rng, end),
+        "radar.json": radar_document(radar_months, rng, end),
+        "resources.json": resources_document(resources, rng),
+    }
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    sizes = {}
+    for filename, data in documents.items():
+        path = profile_dir / filename
+        # Readable JSON without a revision wrapper, like files written
+        # before core.storage embedded revisions (they load as revision 0).
+        with path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        sizes[filename] = path.stat().st_size
+    return sizes
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import json
+import struct
+from typing import Any, Dict, List, Tuple
+
+
+# On-disk encodings for profile documents. Files keep their .json names in
+# every format; decode() tells the formats apart by their first bytes, so a
+# profile can hold a mix of formats after the setting changes and every file
+# still loads.
+#
+# "binary" is a small tagged encoding of the same JSON values:
+#
+#   header   b"LFB" + version byte
+#   value    tag byte + payload
+#
+#   tag  payload
+#   0-2  none (null, false, true)
+#   3    signed varint (zigzag)
+#   4    float64, little endian
+#   5    varint byte length + UTF-8; the string joins the string table
+#   6    varint index into the string table (a repeated string)
+#   7    varint count + values (list)
+#   8    varint count + (string, value) pairs (object)
+#   9    flag table, see _Encoder.flag_table
+#
+# Varints are unsigned LEB128. Object keys, dates and other repeated strings
+# are written once and then referenced by index, and objects of
+# ``{name: bool}`` objects (tracker.json's ``{date: {skill: bool}}``) become
+# two bitmasks per row.
+
+PRETTY = "pretty"
+COMPACT = "compact"
+BINARY = "binary"
+FORMATS: Tuple[str, ...] = (PRETTY, COMPACT, BINARY)
+DEFAULT_FORMAT = PRETTY
+
+_FORMAT_LABELS: Dict[str, str] = {
+    PRETTY: "Readable JSON",
+    COMPACT: "Compact JSON",
+    BINARY: "Compact binary",
+}
+
+MAGIC = b"LFB"
+VERSION = 1
+
+_NULL, _FALSE, _TRUE, _INT, _FLOAT, _STR, _STR_REF, _LIST, _OBJECT, _FLAGS = range(10)
+_FLOAT64 = struct.Struct("<d")
+
+
+def get_format_display_name(fmt: str) -> str:
+    return _FORMAT_LABELS.get(fmt, fmt)
+
+
+def detect_format(raw: bytes) -> str:
+    """Return the format ``raw`` was written in (pretty/compact are both JSON)."""
+
+    if raw[:3] == MAGIC:
+        return BINARY
+    return PRETTY if b"\n" in raw[:64] else COMPACT
+
+
+def encode(data: Any, fmt: str = DEFAULT_FORMAT) -> bytes:
+    if fmt == BINARY:
+        return _encode_binary(data)
+    if fmt == COMPACT:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def decode(raw: bytes) -> Any:
+    """Parse a document written in any of the formats.
+
+    Raises ValueError for malformed input or an unknown binary version.
+    """
+
+    if raw[:3] == MAGIC:
+        return _decode_binary(raw)
+    return json.loads(raw)
+
+
+# Binary encoder ----------------------------------------------------------
+
+def _varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _is_flag_table(value: Dict) -> bool:
+    if not value:
+        return False
+    for row in value.values():
+        if type(row) is not dict or not row:
+            return False
+        for flag in row.values():
+            if flag is not True and flag is not False:
+                return False
+    return True
+
+
+class _Encoder:
+    __slots__ = ("out", "strings")
+
+    def __init__(self) -> None:
+        self.out = bytearray(MAGIC)
+        self.out.append(VERSION)
+        self.strings: Dict[str, int] = {}
+
+    def string(self, value: str) -> None:
+        out = self.out
+        index = self.strings.get(value)
+        if index is not None:
+            out.append(_STR_REF)
+            _varint(out, index)
+            return
+        self.strings[value] = len(self.strings)
+        payload = value.encode("utf-8")
+        out.append(_STR)
+        _varint(out, len(payload))
+        out += payload
+
+    def value(self, value: Any) -> None:
+        out = self.out
+        if value is None:
+            out.append(_NULL)
+        elif value is True:
+            out.append(_TRUE)
+        elif value is False:
+            out.append(_FALSE)
+        elif isinstance(value, str):
+            self.string(value)
+        elif isinstance(value, int):
+            out.append(_INT)
+            _varint(out, value * 2 if value >= 0 else -value * 2 - 1)
+        elif isinstance(value, float):
+            out.append(_FLOAT)
+            out += _FLOAT64.pack(value)
+        elif isinstance(value, (list, tuple)):
+            out.append(_LIST)
+            _varint(out, len(value))
+            for item in value:
+                self.value(item)
+        elif isinstance(value, dict):
+            if _is_flag_table(value):
+                self.flag_table(value)
+                return
+            out.append(_OBJECT)
+            _varint(out, len(value))
+            for key, item in value.items():
+                if not isinstance(key, str):
+                    raise TypeError(f"object keys must be str, not {type(key).__name__}")
+                self.string(key)
+                self.value(item)
+        else:
+            raise TypeError(f"cannot encode {type(value).__name__}")
+
+    def flag_table(self, table: Dict[str, Dict[str, bool]]) -> None:
+        """Write ``{row: {column: bool}}`` as a column list plus two masks per row.
+
+        Bit ``i`` of the first mask says column ``i`` is present in the row,
+        bit ``i`` of the second that it is true.
+        """
+
+        columns: Dict[str, int] = {}
+        for row in table.values():
+            for name in row:
+                if name not in columns:
+                    columns[name] = len(columns)
+
+        out = self.out
+        out.append(_FLAGS)
+        _varint(out, len(columns))
+        for name in columns:
+            self.string(name)
+        _varint(out, len(table))
+        for key, row in table.items():
+            if not isinstance(key, str):
+                raise TypeError(f"object keys must be str, not {type(key).__name__}")
+            present = 0
+            true = 0
+            for name, flag in row.items():
+                bit = 1 << columns[name]
+                present |= bit
+                if flag:
+                    true |= bit
+            self.string(key)
+            _varint(out, present)
+            _varint(out, true)
+
+
+def _encode_binary(data: Any) -> bytes:
+    encoder = _Encoder()
+    encoder.value(data)
+    return bytes(encoder.out)
+
+
+# Binary decoder ----------------------------------------------------------
+
+def _decode_value(raw: bytes) -> Any:
+    """Decode the single value following the header.
+
+    Written as closures over ``raw`` and ``pos`` rather than methods: this
+    is the load path for every binary file and attribute lookups dominate
+    otherwise.
+    """
+
+    pos = 4
+    strings: List[str] = []
+    add_string = strings.append
+    unpack_float = _FLOAT64.unpack_from
+
+    def varint() -> int:
+        nonlocal pos
+        byte = raw[pos]
+        pos += 1
+        if byte < 0x80:
+            return byte
+        result = byte & 0x7F
+        shift = 7
+        while True:
+            byte = raw[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def new_string() -> str:
+        nonlocal pos
+        length = varint()
+        end = pos + length
+        if end > len(raw):
+            raise ValueError("truncated string")
+        value = raw[pos:end].decode("utf-8")
+        pos = end
+        add_string(value)
+        return value
+
+    def string() -> str:
+        nonlocal pos
+        tag = raw[pos]
+        pos += 1
+        if tag == _STR_REF:
+            return strings[varint()]
+        if tag != _STR:
+            raise ValueError(f"expected a string at byte {pos - 1}")
+        return new_string()
+
+    def value() -> Any:
+        nonlocal pos
+        tag = raw[pos]
+        pos += 1
+        if tag == _STR_REF:
+            return strings[varint()]
+        if tag == _STR:
+            return new_string()
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _NULL:
+            return None
+        if tag == _INT:
+            zigzag = varint()
+            return zigzag >> 1 if not zigzag & 1 else -((zigzag + 1) >> 1)
+        if tag == _FLOAT:
+            (number,) = unpack_float(raw, pos)
+            pos += 8
+            return number
+        if tag == _LIST:
+            return [value() for _ in range(varint())]
+        if tag == _OBJECT:
+            result = {}
+            for _ in range(varint()):
+                key = string()
+                result[key] = value()
+            return result
+        if tag == _FLAGS:
+            return flag_table()
+        raise ValueError(f"unknown tag {tag} at byte {pos - 1}")
+
+    def flag_table() -> Dict[str, Dict[str, bool]]:
+        columns = [string() for _ in range(varint())]
+        bits = [(1 << i, name) for i, name in enumerate(columns)]
+        table = {}
+        for _ in range(varint()):
+            key = string()
+            present = varint()
+            true = varint()
+            table[key] = {name: bool(true & bit) for bit, name in bits if present & bit}
+        return table
+
+    result = value()
+    if pos != len(raw):
+        raise ValueError("trailing bytes after binary document")
+    return result
+
+
+def _decode_binary(raw: bytes) -> Any:
+    if len(raw) < 5:
+        raise ValueError("truncated binary document")
+    if raw[3] != VERSION:
+        raise ValueError(f"unsupported binary document version {raw[3]}")
+    try:
+        return _decode_value(raw)
+    except (IndexError, struct.error) as exc:
+        raise ValueError("truncated binary document") from exc
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Dict, Optional
+
+
+# Per-file I/O accounting for core.storage. Counters are always on (file I/O
+# is rare and a few dict updates are negligible next to it). Operations
+# slower than SLOW_OP_MS, and every failed one, are also appended as JSON
+# lines to io_log.jsonl in the directory of the file involved, so slow or
+# broken storage can be diagnosed after the fact. Reads also happen on worker
+# threads, so the counters are updated and copied under a lock.
+
+SLOW_OP_MS = 50.0
+LOG_FILENAME = "io_log.jsonl"
+# The log is rotated to io_log.jsonl.1 once it grows past this size.
+LOG_MAX_BYTES = 512 * 1024
+
+
+class FileStats:
+    """Counters for one file name (aggregated across profiles)."""
+
+    __slots__ = (
+        "reads",
+        "writes",
+        "bytes_read",
+        "bytes_written",
+        "read_ms",
+        "write_ms",
+        "errors",
+        "last_error",
+        "writers",
+    )
+
+    def __init__(self) -> None:
+        self.reads = 0
+        self.writes = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.read_ms = 0.0
+        self.write_ms = 0.0
+        self.errors = 0
+        self.last_error = ""
+        # "module:function" of the caller outside core -> number of writes,
+        # to see which views cause whole-file rewrites.
+        self.writers: Dict[str, int] = {}
+
+    def copy(self) -> "FileStats":
+        other = FileStats()
+        for name in self.__slots__:
+            value = getattr(self, name)
+            setattr(other, name, dict(value) if isinstance(value, dict) else value)
+        return other
+
+
+_stats: Dict[str, FileStats] = {}
+_lock = threading.Lock()
+
+
+def get_file_stats() -> Dict[str, FileStats]:
+    with _lock:
+        return {name: stats.copy() for name, stats in _stats.items()}
+
+
+def reset_file_stats() -> None:
+    with _lock:
+        _stats.clear()
+
+
+def _caller() -> str:
+    """Return ``module:function`` of the nearest caller outside core."""
+
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if ".core." not in module and not module.startswith("core."):
+            return f"{module.rsplit('.', 2)[-1]}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return "?"
+
+
+def record(
+    op: str,
+    filename: str,
+    directory: Path,
+    start: float,
+    size: int = 0,
+    error: Optional[BaseException] = None,
+) -> None:
+    """Account one ``"read"``/``"write"`` of ``directory / filename``.
+
+    ``start`` is the perf_counter() value taken before the operation.
+    """
+
+    elapsed_ms = (perf_counter() - start) * 1000
+    caller = _caller() if op != "read" else None
+    last_error = f"{type(error).__name__}: {error}" if error is not None else ""
+    with _lock:
+        stats = _stats.get(filename)
+        if stats is None:
+            stats = _stats[filename] = FileStats()
+        if op == "read":
+            stats.reads += 1
+            stats.bytes_read += size
+            stats.read_ms += elapsed_ms
+        else:
+            stats.writes += 1
+            stats.bytes_written += size
+            stats.write_ms += elapsed_ms
+            stats.writers[caller] = stats.writers.get(caller, 0) + 1
+        if error is not None:
+            stats.errors += 1
+            stats.last_error = last_error
+
+    if error is None and elapsed_ms < SLOW_OP_MS:
+        return
+    entry = {
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "op": op,
+        "file": filename,
+        "ms": round(elapsed_ms, 2),
+        "bytes": size,
+    }
+    if caller is not None:
+        entry["caller"] = caller
+    if error is not None:
+        entry["error"] = last_error
+    _append_log(directory, entry)
+
+
+def _append_log(directory: Path, entry: Dict) -> None:
+    path = directory / LOG_FILENAME
+    try:
+        if path.exists() and path.stat().st_size > LOG_MAX_BYTES:
+            path.replace(path.with_name(LOG_FILENAME + ".1"))
+        with path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    except Exception:
+        # Logging must never break the storage call it describes.
+        pass
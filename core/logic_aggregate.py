@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import os
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .logic_goals import GOALS_DOCUMENT
+from .logic_profiles import get_active_profile_id, get_profiles_dir, list_profiles
+from .logic_tracker import TRACKER_DOCUMENT
+from .skills import SKILL_COUNT, mask_from_mapping
+from .storage import load_profile_json
+from .store import get_document, get_document_revision
+
+
+# Statistics across all profiles (combined streaks, per-skill totals, goal
+# completion) for polyglots with one profile per language.
+#
+# Each profile is boiled down to a ProfileSummary that is cached until its
+# tracker/goals files change. Inactive profiles are keyed by the files'
+# (mtime_ns, size) and re-read from disk on a thread pool; the active
+# profile is summarized from the store's in-memory documents and keyed by
+# their revisions, so a save never causes a disk read here. With every
+# profile cached, refreshing the combined numbers costs two stat() calls
+# per inactive profile. The GUI reads stale profiles in the background
+# (stale_profile_summaries / read_profile_summaries /
+# cache_profile_summaries) and only calls combined_stats once none are.
+
+# Upper bound on reader threads; most time is spent parsing JSON under the
+# GIL, so more threads mostly add overhead.
+MAX_WORKERS = 8
+
+
+class ProfileSummary:
+    """Per-profile numbers the combined statistics are built from.
+
+    ``days`` holds the ordinals (date.toordinal) of days with any practice,
+    ascending; ``skill_days[i]`` counts days on which skill ``i`` was done.
+    """
+
+    __slots__ = ("profile_id", "days", "skill_days", "goals_set", "goals_done")
+
+    def __init__(self, profile_id: str) -> None:
+        self.profile_id = profile_id
+        self.days = array("l")
+        self.skill_days = [0] * SKILL_COUNT
+        self.goals_set = 0
+        self.goals_done = 0
+
+
+class CombinedStats:
+    __slots__ = (
+        "profiles",
+        "active_days",
+        "current_streak",
+        "longest_streak",
+        "skill_days",
+        "goals_set",
+        "goals_done",
+    )
+
+    def __init__(self) -> None:
+        # (profile id, display name, summary) in registry order
+        self.profiles: List[Tuple[str, str, ProfileSummary]] = []
+        self.active_days = 0
+        self.current_streak = 0
+        self.longest_streak = 0
+        self.skill_days = [0] * SKILL_COUNT
+        self.goals_set = 0
+        self.goals_done = 0
+
+    @property
+    def completion_rate(self) -> float:
+        return self.goals_done / self.goals_set if self.goals_set else 0.0
+
+
+def summarize(profile_id: str, tracker: Any, goals: Any) -> ProfileSummary:
+    """Build a summary from a profile's raw tracker and goals documents."""
+
+    summary = ProfileSummary(profile_id)
+    if isinstance(tracker, dict):
+        days = []
+        skill_days = summary.skill_days
+        for day, skills in tracker.items():
+            if not isinstance(skills, dict):
+                continue
+            mask = mask_from_mapping(skills)
+            if not mask:
+                continue
+            try:
+                days.append(date.fromisoformat(day).toordinal())
+            except (TypeError, ValueError):
+                continue
+            for i in range(SKILL_COUNT):
+                if mask >> i & 1:
+                    skill_days[i] += 1
+        days.sort()
+        summary.days = array("l", days)
+
+    if isinstance(goals, dict):
+        for month in goals.values():
+            if not isinstance(month, dict):
+                continue
+            texts = month.get("goals") or []
+            completed = month.get("completed") or []
+            for i, text in enumerate(texts):
+                if str(text).strip():
+                    summary.goals_set += 1
+                    if i < len(completed) and completed[i]:
+                        summary.goals_done += 1
+    return summary
+
+
+def _read_summary(profile_id: str) -> ProfileSummary:
+    return summarize(
+        profile_id,
+        load_profile_json(TRACKER_DOCUMENT, {}, profile_id),
+        load_profile_json(GOALS_DOCUMENT, {}, profile_id),
+    )
+
+
+# profile id -> (signature, summary)
+_cache: Dict[str, Tuple[Any, ProfileSummary]] = {}
+
+
+# Last combined_stats() result and what it was built from: the day, and
+# (profile id, display name, summary object) per profile.
+_combined: Optional[CombinedStats] = None
+_combined_source: Tuple[Any, ...] = ()
+
+
+def invalidate_profile_summaries(profile_ids: Optional[Iterable[str]] = None) -> None:
+    """Forget cached summaries of ``profile_ids`` (default: all profiles).
+
+    For files replaced wholesale (restore) or profiles deleted, where a
+    reused (mtime_ns, size) signature or id must not resurrect old numbers.
+    """
+
+    global _combined
+    if profile_ids is None:
+        _cache.clear()
+    else:
+        for profile_id in profile_ids:
+            _cache.pop(profile_id, None)
+    _combined = None
+
+
+def _disk_signature(profile_dir: str) -> Tuple[Any, ...]:
+    # Plain os.stat on string paths: storage.get_profile_file_signature
+    # creates the profile folder and builds Path objects on every call,
+    # which dominates when fifty profiles are checked per refresh.
+    signature = []
+    for name in (TRACKER_DOCUMENT, GOALS_DOCUMENT):
+        try:
+            st = os.stat(os.path.join(profile_dir, name))
+        except OSError:
+            signature.append(None)
+            continue
+        signature.append((st.st_mtime_ns, st.st_size))
+    return tuple(signature)
+
+
+def _collect(profile_ids: Sequence[str]) -> Tuple[Dict[str, ProfileSummary], List[Tuple[str, Any]]]:
+    """Return (cached summaries, [(profile id, signature)] needing a read)."""
+
+    active_id = get_active_profile_id()
+    profiles_dir = str(get_profiles_dir())
+    result: Dict[str, ProfileSummary] = {}
+    stale: List[Tuple[str, Any]] = []
+
+    for profile_id in profile_ids:
+        if profile_id == active_id:
+            tracker = get_document(TRACKER_DOCUMENT, {})
+            goals = get_document(GOALS_DOCUMENT, {})
+            signature: Any = (
+                "store",
+                get_document_revision(TRACKER_DOCUMENT),
+                get_document_revision(GOALS_DOCUMENT),
+            )
+            cached = _cache.get(profile_id)
+            if cached is None or cached[0] != signature:
+                cached = _cache[profile_id] = (signature, summarize(profile_id, tracker, goals))
+            result[profile_id] = cached[1]
+            continue
+
+        signature = _disk_signature(os.path.join(profiles_dir, profile_id))
+        cached = _cache.get(profile_id)
+        if cached is not None and cached[0] == signature:
+            result[profile_id] = cached[1]
+        else:
+            stale.append((profile_id, signature))
+    return result, stale
+
+
+def stale_profile_summaries() -> List[Tuple[str, Any]]:
+    """Return ``[(profile id, signature)]`` of profiles whose files changed.
+
+    Only stats files; pass the result to read_profile_summaries (e.g. on a
+    background thread) and then cache_profile_summaries.
+    """
+
+    return _collect([p["id"] for p in list_profiles()])[1]
+
+
+def read_profile_summaries(stale: Sequence[Tuple[str, Any]]) -> List[Tuple[str, Any, ProfileSummary]]:
+    """Read and summarize ``stale`` profiles from disk.
+
+    Touches no shared state, so it is safe off the main thread.
+    """
+
+    if len(stale) == 1:
+        profile_id, signature = stale[0]
+        return [(profile_id, signature, _read_summary(profile_id))]
+    if not stale:
+        return []
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(stale))) as pool:
+        summaries = pool.map(_read_summary, [profile_id for profile_id, _ in stale])
+        return [
+            (profile_id, signature, summary)
+            for (profile_id, signature), summary in zip(stale, summaries)
+        ]
+
+
+def cache_profile_summaries(read: Sequence[Tuple[str, Any, ProfileSummary]]) -> None:
+    for profile_id, signature, summary in read:
+        _cache[profile_id] = (signature, summary)
+
+
+def get_profile_summaries(profile_ids: Sequence[str]) -> Dict[str, ProfileSummary]:
+    """Return a summary per profile, recomputing only stale ones."""
+
+    result, stale = _collect(profile_ids)
+    for profile_id, signature, summary in read_profile_summaries(stale):
+        _cache[profile_id] = (signature, summary)
+        result[profile_id] = summary
+
+    for profile_id in list(_cache):
+        if profile_id not in result:
+            del _cache[profile_id]
+    return result
+
+
+def _streaks(days: Sequence[int], today: int) -> Tuple[int, int]:
+    """Return (current, longest) runs of consecutive days in sorted ``days``.
+
+    The current streak still counts if today has no practice yet but
+    yesterday did.
+    """
+
+    longest = run = 0
+    previous = None
+    for day in days:
+        run = run + 1 if previous is not None and day == previous + 1 else 1
+        longest = max(longest, run)
+        previous = day
+    if previous is None or previous < today - 1:
+        return 0, longest
+    return run, longest
+
+
+def combined_stats(today: Optional[date] = None) -> CombinedStats:
+    """Aggregate every registered profile.
+
+    The result is reused as long as no profile summary changed.
+    """
+
+    global _combined, _combined_source
+    profiles = list_profiles()
+    summaries = get_profile_summaries([p["id"] for p in profiles])
+    entries = [
+        (p["id"], p.get("display_name", p["id"]), summaries[p["id"]])
+        for p in profiles
+        if p["id"] in summaries
+    ]
+    day = (today or date.today()).toordinal()
+    source = (day, *((pid, name, id(summary)) for pid, name, summary in entries))
+    # Summaries compare by identity: a changed profile gets a new object, and
+    # holding the previous result keeps the old ones (and their ids) alive.
+    if _combined is not None and source == _combined_source:
+        return _combined
+
+    stats = CombinedStats()
+    all_days = set()
+    for entry in entries:
+        summary = entry[2]
+        stats.profiles.append(entry)
+        all_days.update(summary.days)
+        for i, count in enumerate(summary.skill_days):
+            stats.skill_days[i] += count
+        stats.goals_set += summary.goals_set
+        stats.goals_done += summary.goals_done
+
+    stats.active_days = len(all_days)
+    stats.current_streak, stats.longest_streak = _streaks(sorted(all_days), day)
+    _combined = stats
+    _combined_source = source
+    return stats
+
+
+def profile_streaks(summary: ProfileSummary, today: Optional[date] = None) -> Tuple[int, int]:
+    return _streaks(summary.days, (today or date.today()).toordinal())
@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import csv
+import json
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .logic_dailyplan import DAILY_PLAN_DOCUMENT
+from .logic_goals import GOALS_DOCUMENT
+from .logic_import import ProgressCallback
+from .logic_profiles import MAX_PROFILES, get_profile_data_dir, list_profiles, sanitize_profile_name
+from .logic_radar import RADAR_DOCUMENT
+from .logic_resources import RESOURCES_DOCUMENT
+from .logic_tracker import TRACKER_DOCUMENT
+from .models import MonthlyGoals, RadarSnapshot
+from .skills import SKILL_KEYS, mask_from_mapping
+from .storage import list_profile_documents, load_profile_json, profile_lock
+
+
+# Whole-profile backups and per-dataset CSV exports.
+#
+# Archives are zip files with a manifest and each profile's documents copied
+# byte for byte under ``profiles/<id>/`` (whatever storage format they are
+# in; loads detect it). Copies are streamed in CHUNK_SIZE blocks, so neither
+# export nor restore holds a whole file in memory or parses anything.
+#
+# All functions here only touch files and are meant to run on a background
+# thread; the caller re-registers restored profiles and drops the store's
+# cached documents on the main thread afterwards.
+
+ARCHIVE_FORMAT = "languageforge-archive"
+ARCHIVE_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+CHUNK_SIZE = 256 * 1024
+_PART_SUFFIX = ".part"
+
+
+class ArchiveCancelled(Exception):
+    pass
+
+
+class ArchiveError(Exception):
+    pass
+
+
+def _copy(src, dst, done: int, total: int, progress: Optional[ProgressCallback]) -> int:
+    while True:
+        block = src.read(CHUNK_SIZE)
+        if not block:
+            return done
+        dst.write(block)
+        done += len(block)
+        if progress is not None and progress(done, total) is False:
+            raise ArchiveCancelled()
+
+
+# Archive export ----------------------------------------------------------
+
+def export_archive(
+    target: Path,
+    profiles: Sequence[Dict[str, Any]],
+    progress: Optional[ProgressCallback] = None,
+) -> int:
+    """Write ``profiles`` (registry entries) into a zip archive at ``target``.
+
+    The archive is assembled next to ``target`` and only renamed into place
+    when complete. Returns the number of documents written.
+    """
+
+    files: List[Tuple[str, Path]] = []
+    entries = []
+    for profile in profiles:
+        profile_id = profile["id"]
+        paths = list_profile_documents(profile_id)
+        files.extend((profile_id, path) for path in paths)
+        entries.append(
+            {
+                "id": profile_id,
+                "display_name": profile.get("display_name", profile_id),
+                "files": [path.name for path in paths],
+            }
+        )
+    manifest = {
+        "format": ARCHIVE_FORMAT,
+        "version": ARCHIVE_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "profiles": entries,
+    }
+
+    total = sum(path.stat().st_size for _, path in files) or 1
+    done = 0
+    partial = target.with_name(target.name + _PART_SUFFIX)
+    try:
+        with zipfile.ZipFile(partial, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=2))
+            for profile_id, path in files:
+                with path.open("rb") as src, archive.open(f"profiles/{profile_id}/{path.name}", "w") as dst:
+                    done = _copy(src, dst, done, total, progress)
+        partial.replace(target)
+    finally:
+        if partial.exists():
+            partial.unlink()
+    return len(files)
+
+
+# Restore -----------------------------------------------------------------
+
+def read_manifest(path: Path) -> Dict[str, Any]:
+    """Return a validated archive manifest; raises ArchiveError otherwise."""
+
+    try:
+        with zipfile.ZipFile(path) as archive:
+            manifest = json.loads(archive.read(MANIFEST_NAME))
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as exc:
+        raise ArchiveError(f"Not a LanguageForge archive: {exc}") from exc
+    if not isinstance(manifest, dict) or manifest.get("format") != ARCHIVE_FORMAT:
+        raise ArchiveError("Not a LanguageForge archive.")
+    if manifest.get("version") != ARCHIVE_VERSION:
+        raise ArchiveError(f"Unsupported archive version {manifest.get('version')!r}.")
+    for entry in manifest.get("profiles", []):
+        profile_id = entry.get("id") if isinstance(entry, dict) else None
+        if not profile_id or sanitize_profile_name(profile_id) != profile_id:
+            raise ArchiveError(f"Invalid profile id {profile_id!r} in archive.")
+        for name in entry.get("files", []):
+            if not isinstance(name, str) or "/" in name or "\\" in name or not name.endswith(".json"):
+                raise ArchiveError(f"Invalid file name {name!r} in archive.")
+    return manifest
+
+
+def restore_archive(path: Path, progress: Optional[ProgressCallback] = None) -> List[Dict[str, Any]]:
+    """Replace the documents of every profile in the archive with its copy.
+
+    Files are first extracted next to their targets and only swapped in
+    once all of them were read intact, so a damaged archive, a cancel or a
+    full profile registry (ArchiveError) leaves every profile untouched.
+    Documents a restored profile has but the archive does not are
+    removed. Returns the manifest's profile entries.
+    """
+
+    manifest = read_manifest(path)
+    profiles = manifest.get("profiles", [])
+    # Check the registry has room before any file is swapped in: a profile
+    # restored on disk but not registered would be invisible.
+    added = {entry["id"] for entry in profiles} - {p["id"] for p in list_profiles()}
+    if len(list_profiles()) + len(added) > MAX_PROFILES:
+        raise ArchiveError(
+            f"Restoring would add {len(added)} profile(s), more than the limit of "
+            f"{MAX_PROFILES} allows. Delete unused profiles first."
+        )
+    staged: List[Tuple[Path, Path]] = []
+    try:
+        with zipfile.ZipFile(path) as archive:
+            try:
+                members = [
+                    (entry, name, archive.getinfo(f"profiles/{entry['id']}/{name}"))
+                    for entry in profiles
+                    for name in entry.get("files", [])
+                ]
+            except KeyError as exc:
+                raise ArchiveError(f"The archive is incomplete: {exc}") from exc
+            total = sum(info.file_size for _, _, info in members) or 1
+            done = 0
+            for entry, name, info in members:
+                target = get_profile_data_dir(entry["id"]) / name
+                partial = target.with_name(name + _PART_SUFFIX)
+                staged.append((partial, target))
+                with archive.open(info) as src, partial.open("wb") as dst:
+                    done = _copy(src, dst, done, total, progress)
+    except BaseException:
+        for partial, _ in staged:
+            if partial.exists():
+                partial.unlink()
+        raise
+
+    for entry in profiles:
+        # Swap under the profile's write lock so a save from another Anki
+        # instance cannot land between the new files.
+        folder = get_profile_data_dir(entry["id"])
+        keep = set(entry.get("files", []))
+        with profile_lock(entry["id"]):
+            for partial, target in staged:
+                if target.parent == folder:
+                    partial.replace(target)
+            for existing in list_profile_documents(entry["id"]):
+                if existing.name not in keep:
+                    existing.unlink()
+    return profiles
+
+
+# CSV export --------------------------------------------------------------
+
+def _tracker_rows(data: Any) -> Iterator[List[Any]]:
+    # Same layout the importer reads (core.logic_import).
+    yield ["date", *SKILL_KEYS]
+    if not isinstance(data, dict):
+        return
+    for day in sorted(data):
+        skills = data[day]
+        if isinstance(skills, dict):
+            mask = mask_from_mapping(skills)
+            yield [day, *(1 if mask & (1 << i) else 0 for i in range(len(SKILL_KEYS)))]
+
+
+def _goals_rows(data: Any) -> Iterator[List[Any]]:
+    yield [
+        "month", "goal", "text", "completed", "category", "reflection",
+        "subtasks", "created_at", "completed_at", "archived", "notes",
+    ]
+    if not isinstance(data, dict):
+        return
+    for month in sorted(data):
+        goals = MonthlyGoals.from_dict(month, data[month])
+        for i, text in enumerate(goals.goals):
+            subtasks = "; ".join(
+                f"[{'x' if done else ' '}] {task}"
+                for task, done in zip(goals.subtasks[i], goals.subtasks_done[i])
+            )
+            yield [
+                month, i + 1, text, int(goals.completed[i]), goals.categories[i],
+                goals.reflections[i], subtasks, goals.created_at[i], goals.completed_at[i],
+                int(goals.archived), goals.notes if i == 0 else "",
+            ]
+
+
+def _radar_rows(data: Any) -> Iterator[List[Any]]:
+    yield ["month", *SKILL_KEYS]
+    if not isinstance(data, dict):
+        return
+    for month in sorted(data):
+        yield [month, *RadarSnapshot.from_dict(month, data[month]).values]
+
+
+def _resources_rows(data: Any) -> Iterator[List[Any]]:
+    # Same columns the importer reads; tags are ";"-separated.
+    yield ["id", "type", "name", "link", "notes", "deck_name", "tags"]
+    if not isinstance(data, list):
+        return
+    for raw in data:
+        if isinstance(raw, dict):
+            yield [
+                raw.get("id", ""), raw.get("type", ""), raw.get("name", ""),
+                raw.get("link", ""), raw.get("notes", ""), raw.get("deck_name") or "",
+                ";".join(str(tag) for tag in raw.get("tags") or []),
+            ]
+
+
+def _dailyplan_rows(data: Any) -> Iterator[List[Any]]:
+    yield ["task", "text"]
+    tasks = data.get("tasks") if isinstance(data, dict) else None
+    for i, text in enumerate(tasks if isinstance(tasks, list) else [], 1):
+        yield [i, text]
+
+
+_CSV_DATASETS = (
+    ("tracker.csv", TRACKER_DOCUMENT, {}, _tracker_rows),
+    ("goals.csv", GOALS_DOCUMENT, {}, _goals_rows),
+    ("radar.csv", RADAR_DOCUMENT, {}, _radar_rows),
+    ("resources.csv", RESOURCES_DOCUMENT, [], _resources_rows),
+    ("dailyplan.csv", DAILY_PLAN_DOCUMENT, {}, _dailyplan_rows),
+)
+
+
+def _write_csv(path: Path, rows: Iterable[List[Any]]) -> None:
+    with path.open("w", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerows(rows)
+
+
+def export_csv(
+    target_dir: Path, profile_id: str, progress: Optional[ProgressCallback] = None
+) -> List[Path]:
+    """Write one CSV per dataset of ``profile_id`` into ``target_dir``.
+
+    Each document is read straight from disk (not from the store) and its
+    rows are generated while the CSV is written. Progress counts datasets.
+    """
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for done, (filename, document, default, rows) in enumerate(_CSV_DATASETS):
+        if progress is not None and progress(done, len(_CSV_DATASETS)) is False:
+            raise ArchiveCancelled()
+        data = load_profile_json(document, default, profile_id)
+        path = target_dir / filename
+        _write_csv(path, rows(data))
+        written.append(path)
+    if progress is not None:
+        progress(len(_CSV_DATASETS), len(_CSV_DATASETS))
+    return written
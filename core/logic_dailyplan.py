@@ -3,10 +3,11 @@ from __future__ import annotations
 from typing import Dict, Any
 
 from .models import DailyPlan
-from .storage import load_profile_json, save_profile_json
+from .store import get_document, put_document
 
 
 _FILENAME = "dailyplan.json"
+DAILY_PLAN_DOCUMENT = _FILENAME
 
 
 def _default() -> Dict[str, Any]:
@@ -17,7 +18,7 @@ def _default() -> Dict[str, Any]:
 
 
 def load_daily_plan() -> DailyPlan:
-    data = load_profile_json(_FILENAME, _default())
+    data = get_document(_FILENAME, _default())
     if not isinstance(data, dict):
         data = _default()
     # Backward compatibility: if legacy morning/afternoon/evening exist,
@@ -49,4 +50,4 @@ def load_daily_plan() -> DailyPlan:
 
 
 def save_daily_plan(plan: DailyPlan) -> None:
-    save_profile_json(_FILENAME, plan.to_dict())
+    put_document(_FILENAME, plan.to_dict())
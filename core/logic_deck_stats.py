@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from aqt import mw
+
+from .logic_decks import get_deck_id, get_deck_names, get_deck_spelling
+
+
+# Reviews are counted over this many trailing days.
+REVIEW_WINDOW_DAYS = 30
+
+
+class DeckActivity:
+    """Aggregated review activity for a deck (including its subdecks)."""
+
+    __slots__ = ("reviews", "due")
+
+    def __init__(self, reviews: int = 0, due: int = 0) -> None:
+        self.reviews = reviews
+        self.due = due
+
+    def sort_key(self) -> Tuple[int, int]:
+        return self.reviews, self.due
+
+    def __repr__(self) -> str:
+        return f"DeckActivity(reviews={self.reviews}, due={self.due})"
+
+
+# Per-deck-id stats as last queried from the collection. Filled by a
+# background QueryOp; only decks marked dirty (e.g. after a review) are
+# re-queried on the next refresh.
+_stats_by_did: Dict[int, DeckActivity] = {}
+_loaded = False
+_dirty_dids: Set[int] = set()
+_refresh_in_flight = False
+_refresh_pending = False
+# Bumped by invalidate_deck_activity so late results from a previous
+# collection are discarded.
+_generation = 0
+# Aggregated (deck + subdecks) results by deck name; cleared on any update.
+_activity_by_name: Dict[str, Optional[DeckActivity]] = {}
+_listeners: List[Callable[[], None]] = []
+
+
+def add_deck_activity_listener(callback: Callable[[], None]) -> None:
+    """Call ``callback`` on the main thread whenever stats are updated."""
+
+    if callback not in _listeners:
+        _listeners.append(callback)
+
+
+def remove_deck_activity_listener(callback: Callable[[], None]) -> None:
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+def invalidate_deck_activity() -> None:
+    """Drop all cached stats, e.g. when a different collection is loaded."""
+
+    global _loaded, _generation
+    _generation += 1
+    _stats_by_did.clear()
+    _activity_by_name.clear()
+    _dirty_dids.clear()
+    _loaded = False
+
+
+def mark_deck_dirty(did: int) -> None:
+    """Flag one deck for re-query on the next refresh (e.g. after a review)."""
+
+    if did:
+        _dirty_dids.add(int(did))
+
+
+def get_deck_activity(deck_name: Optional[str]) -> Optional[DeckActivity]:
+    """Return cached activity for a deck and its subdecks.
+
+    Returns None if the deck is unknown or stats have not been loaded yet;
+    never touches the collection database.
+    """
+
+    name = (deck_name or "").strip()
+    if not name or not _loaded:
+        return None
+    if name in _activity_by_name:
+        return _activity_by_name[name]
+
+    result: Optional[DeckActivity] = None
+    # Resource deck names are typed freely; match them like Anki does,
+    # ignoring case, and walk children under the collection's spelling.
+    deck = get_deck_spelling(name)
+    if deck is not None:
+        prefix = deck + "::"
+        result = DeckActivity()
+        for child in get_deck_names():
+            if child != deck and not child.startswith(prefix):
+                continue
+            child_id = get_deck_id(child)
+            stats = _stats_by_did.get(child_id) if child_id is not None else None
+            if stats is not None:
+                result.reviews += stats.reviews
+                result.due += stats.due
+    _activity_by_name[name] = result
+    return result
+
+
+def _query_stats(col, dids: Optional[List[int]]) -> Dict[int, DeckActivity]:
+    """Run the batched per-deck queries. Executed on a background thread."""
+
+    # Cards in filtered decks are attributed to their home deck.
+    did_expr = "(case when c.odid then c.odid else c.did end)"
+    where = ""
+    if dids is not None:
+        where = f" and {did_expr} in ({','.join(str(int(d)) for d in dids)})"
+
+    cutoff_ms = int((time.time() - REVIEW_WINDOW_DAYS * 86400) * 1000)
+    result: Dict[int, DeckActivity] = {int(d): DeckActivity() for d in dids or []}
+
+    for did, count in col.db.all(
+        f"select {did_expr}, count() from revlog r join cards c on r.cid = c.id "
+        f"where r.id > ?{where} group by 1",
+        cutoff_ms,
+    ):
+        result.setdefault(int(did), DeckActivity()).reviews = int(count)
+
+    today = col.sched.today
+    now = int(time.time())
+    for did, count in col.db.all(
+        f"select {did_expr}, count() from cards c where "
+        f"((c.queue in (2, 3) and c.due <= ?) or (c.queue = 1 and c.due <= ?)){where} "
+        f"group by 1",
+        today,
+        now,
+    ):
+        result.setdefault(int(did), DeckActivity()).due = int(count)
+
+    return result
+
+
+def request_deck_activity_refresh() -> None:
+    """Refresh stats in the background without blocking the UI.
+
+    The first call queries every deck; later calls only re-query decks that
+    were marked dirty. Listeners are notified when new stats arrive.
+    """
+
+    global _refresh_in_flight, _refresh_pending
+    if mw is None or getattr(mw, "col", None) is None:
+        return
+    if _refresh_in_flight:
+        _refresh_pending = True
+        return
+    if _loaded and not _dirty_dids:
+        return
+
+    dids: Optional[List[int]] = None if not _loaded else sorted(_dirty_dids)
+    _dirty_dids.clear()
+    _refresh_in_flight = True
+    generation = _generation
+
+    try:
+        from aqt.operations import QueryOp
+
+        op = QueryOp(
+            parent=mw,
+            op=lambda col: _query_stats(col, dids),
+            success=lambda stats: _on_stats_loaded(stats, dids is None, generation),
+        )
+        op.failure(lambda _exc: _on_stats_failed(dids))
+        op.run_in_background()
+    except Exception:
+        _on_stats_failed(dids)
+
+
+def _on_stats_loaded(
+    stats: Dict[int, DeckActivity], full: bool, generation: int
+) -> None:
+    global _loaded, _refresh_in_flight, _refresh_pending
+    if generation != _generation:
+        # The collection changed while we were querying; start over.
+        _refresh_in_flight = False
+        _refresh_pending = False
+        request_deck_activity_refresh()
+        return
+    if full:
+        _stats_by_did.clear()
+    _stats_by_did.update(stats)
+    _activity_by_name.clear()
+    _loaded = True
+    _refresh_in_flight = False
+
+    for callback in list(_listeners):
+        try:
+            callback()
+        except Exception:
+            pass
+
+    if _refresh_pending:
+        _refresh_pending = False
+        request_deck_activity_refresh()
+
+
+def _on_stats_failed(dids: Optional[List[int]]) -> None:
+    global _refresh_in_flight, _refresh_pending
+    # Keep partial refreshes queued so they are retried next time.
+    if dids:
+        _dirty_dids.update(dids)
+    _refresh_in_flight = False
+    _refresh_pending = False
+
+
+def on_card_answered(card) -> None:
+    """Hook helper: mark the answered card's home deck as dirty."""
+
+    did = getattr(card, "odid", 0) or getattr(card, "did", 0)
+    mark_deck_dirty(did)
+
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+from aqt import mw
+
+
+# Cached deck names/ids from the open collection. Filled lazily from Anki's
+# lightweight name/id listing and cleared by collection-change hooks (see
+# main.init_addon), so opening a resource dialog does not walk every deck's
+# full config dict.
+_deck_names: Optional[List[str]] = None
+_deck_names_lower: List[str] = []
+# Keyed by casefolded name: Anki's own lookups ignore case, so a typed
+# "japanese core" still resolves to "Japanese Core".
+_deck_ids: Dict[str, int] = {}
+_deck_spellings: Dict[str, str] = {}
+
+
+def invalidate_deck_cache() -> None:
+    """Forget cached deck names; they are re-read on next access."""
+
+    global _deck_names
+    _deck_names = None
+
+
+def _ensure_loaded() -> List[str]:
+    global _deck_names, _deck_names_lower, _deck_ids, _deck_spellings
+    if _deck_names is not None:
+        return _deck_names
+
+    entries: List[Tuple[str, int]] = []
+    try:
+        if mw is None or mw.col is None:
+            # No collection yet: don't cache, try again next time.
+            return []
+        decks = mw.col.decks
+        if hasattr(decks, "all_names_and_ids"):
+            entries = [(str(d.name), int(d.id)) for d in decks.all_names_and_ids()]
+        else:
+            # Older Anki versions only offer the full deck dicts.
+            entries = [(str(d.get("name", "")), int(d.get("id", 0))) for d in decks.all()]
+    except Exception:
+        entries = []
+
+    entries = [(name.strip(), did) for name, did in entries if name.strip()]
+    entries.sort(key=lambda e: e[0].lower())
+    _deck_names = [name for name, _did in entries]
+    _deck_names_lower = [name.lower() for name in _deck_names]
+    _deck_ids = {name.casefold(): did for name, did in entries}
+    _deck_spellings = {name.casefold(): name for name, _did in entries}
+    return _deck_names
+
+
+def get_deck_names() -> List[str]:
+    """Return all deck names in the current collection, sorted."""
+
+    return list(_ensure_loaded())
+
+
+def get_deck_id(name: str) -> Optional[int]:
+    """Resolve a deck name (case-insensitively) to its id using the cache."""
+
+    _ensure_loaded()
+    return _deck_ids.get((name or "").strip().casefold())
+
+
+def get_deck_spelling(name: str) -> Optional[str]:
+    """Return the collection's spelling of a deck name matched ignoring case."""
+
+    _ensure_loaded()
+    return _deck_spellings.get((name or "").strip().casefold())
+
+
+def _subsequence_span(query: str, text: str) -> Optional[int]:
+    """Return how spread out query's characters are in text, or None."""
+
+    pos = -1
+    start = -1
+    for ch in query:
+        pos = text.find(ch, pos + 1)
+        if pos < 0:
+            return None
+        if start < 0:
+            start = pos
+    return pos - start
+
+
+def match_deck_names(query: str, limit: int = 50) -> List[str]:
+    """Return up to ``limit`` deck names fuzzily matching ``query``.
+
+    Substring matches rank first (earlier and shorter is better), followed
+    by subsequence matches such as "jpcore" for "Japanese::Core".
+    """
+
+    names = _ensure_loaded()
+    q = (query or "").strip().lower()
+    if not q:
+        return names[:limit]
+
+    scored: List[Tuple[int, int, int, str]] = []
+    for name, lower in zip(names, _deck_names_lower):
+        idx = lower.find(q)
+        if idx >= 0:
+            scored.append((0, idx, len(name), name))
+            continue
+        span = _subsequence_span(q, lower)
+        if span is not None:
+            scored.append((1, span, len(name), name))
+
+    scored.sort()
+    return [s[3] for s in scored[:limit]]
@@ -4,12 +4,14 @@ from typing import Dict, List
 from datetime import datetime
 
 from .models import MonthlyGoals
-from .storage import load_profile_json, save_profile_json
+from .store import get_document, put_document
 
 
 # New storage filename for goals to avoid interference with any legacy
 # writers that still touch the old goals.json.
 _FILENAME = "goals_v2.json"
+# Store document name; change notifications carry the affected month ids.
+GOALS_DOCUMENT = _FILENAME
 _LEGACY_FILENAME = "goals.json"
 
 
@@ -18,10 +20,10 @@ def _default() -> Dict[str, Dict]:
 
 
 def load_goals() -> Dict[str, Dict]:
-    data = load_profile_json(_FILENAME, {})
+    data = get_document(_FILENAME, {})
     if not isinstance(data, dict):
         return {}
-    return data
+    return dict(data)
 
 
 def get_current_month_id() -> str:
@@ -36,84 +38,7 @@ def load_goals_for_month(month: str) -> MonthlyGoals:
     Backwards compatible with older JSON that may not have the archived field.
     """
 
-    data = load_goals()
-    raw = data.get(month)
-    if not isinstance(raw, dict):
-        # Completely new month: return blank goals with default metadata.
-        return MonthlyGoals(
-            month=month,
-            goals=["", "", ""],
-            completed=[False, False, False],
-            notes="",
-            archived=False,
-            categories=["General", "General", "General"],
-            reflections=["", "", ""],
-            subtasks=[[], [], []],
-            subtasks_done=[[], [], []],
-            created_at=["", "", ""],
-            completed_at=["", "", ""],
-        )
-
-    goals = raw.get("goals") or ["", "", ""]
-    completed = raw.get("completed") or [False, False, False]
-    notes = raw.get("notes") or ""
-    archived = bool(raw.get("archived", False))
-
-    categories = raw.get("categories") or []
-    reflections = raw.get("reflections") or []
-    subtasks = raw.get("subtasks") or []
-    subtasks_done = raw.get("subtasks_done") or []
-    created_at = raw.get("created_at") or []
-    completed_at = raw.get("completed_at") or []
-
-    # Normalise lengths to exactly three goals.
-    def _pad_list(lst, default, target_len: int = 3):
-        lst = list(lst)
-        while len(lst) < target_len:
-            lst.append(default)
-        return lst[:target_len]
-
-    goals = _pad_list(goals, "")
-    completed = _pad_list(completed, False)
-    categories = _pad_list(categories, "General")
-    reflections = _pad_list(reflections, "")
-    created_at = _pad_list(created_at, "")
-    completed_at = _pad_list(completed_at, "")
-
-    # Subtasks are lists-of-lists; ensure outer list has 3 entries and
-    # each inner list has matching length for done flags.
-    subtasks = list(subtasks) if isinstance(subtasks, list) else []
-    subtasks_done = list(subtasks_done) if isinstance(subtasks_done, list) else []
-    while len(subtasks) < 3:
-        subtasks.append([])
-    while len(subtasks_done) < 3:
-        subtasks_done.append([])
-
-    norm_subtasks: List[List[str]] = []
-    norm_subtasks_done: List[List[bool]] = []
-    for i in range(3):
-        st_list = subtasks[i] if isinstance(subtasks[i], list) else []
-        done_list = subtasks_done[i] if isinstance(subtasks_done[i], list) else []
-        # Pad done_list to length of st_list.
-        done_list = list(done_list)
-        while len(done_list) < len(st_list):
-            done_list.append(False)
-        norm_subtasks.append([str(s) for s in st_list])
-        norm_subtasks_done.append([bool(d) for d in done_list[: len(st_list)]])
-
-    return MonthlyGoals(
-        month=month,
-        goals=goals,
-        completed=completed,
-        notes=notes,
-        archived=archived,
-        categories=categories,
-        reflections=reflections,
-        subtasks=norm_subtasks,
-        subtasks_done=norm_subtasks_done,
-        created_at=created_at,
-        completed_at=completed_at,
-    )
+    return MonthlyGoals.from_dict(month, load_goals().get(month))
 
 
 # Backwards-compatible aliases
@@ -164,7 +89,7 @@ def save_goals_for_month(goals: MonthlyGoals, source: str = "") -> None:
             return
 
     data[goals.month] = new_obj
-    save_profile_json(_FILENAME, data)
+    put_document(_FILENAME, data, [goals.month])
 
 
 def save_month_goals(goals: MonthlyGoals, source: str | None = None) -> None:
@@ -189,14 +114,13 @@ def auto_archive_past_goals(current_month_id: str) -> None:
     """
 
     data = load_goals()
-    changed = False
+    changed: List[str] = []
     for month, raw in list(data.items()):
         if not isinstance(raw, dict):
             continue
         if month < current_month_id:
             if not raw.get("archived", False):
-                raw["archived"] = True
-                data[month] = raw
-                changed = True
+                data[month] = dict(raw, archived=True)
+                changed.append(month)
     if changed:
-        save_profile_json(_FILENAME, data)
+        put_document(_FILENAME, data, changed)
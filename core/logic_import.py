@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+import re
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .skills import SKILL_KEYS, SKILLS
+
+
+# Bulk import of practice history and resources from CSV or JSON lines.
+#
+# Files are read row by row and never loaded whole. Tracker rows are folded
+# into one ``{date: skill mask}`` dict as they arrive, so memory grows with
+# the number of distinct days, not with the number of rows. The read_*
+# functions only touch the file (safe on a background thread); the caller
+# then merges the result with one store write via
+# logic_tracker.merge_daily_activity / logic_resources.add_resources.
+#
+# Accepted tracker layouts (column names are case-insensitive):
+#
+#   date,reading,listening,speaking,writing   one row per day, flag per skill
+#   date,skill[,done]                         one row per (day, skill)
+#   {"date": "...", "skills": {"reading": true}}     JSON lines
+#   {"date": "...", "skills": ["reading", ...]}
+#
+# Resource rows need a ``name``; ``type``, ``link``, ``notes``, ``deck_name``
+# (or ``deck``), ``tags`` (";" or "," separated, or a JSON list) and ``id``
+# are optional.
+
+# progress(bytes_done, bytes_total) -> False to cancel.
+ProgressCallback = Callable[[int, int], Optional[bool]]
+
+# Rows between progress callbacks (and cancel checks).
+PROGRESS_EVERY = 4096
+# Row errors kept verbatim in the report; the rest are only counted.
+MAX_REPORTED_ERRORS = 50
+
+_JSON_LINES_SUFFIXES = (".jsonl", ".ndjson", ".json")
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_TRUE_VALUES = {"1", "true", "yes", "y", "x", "✓", "done"}
+_FALSE_VALUES = {"", "0", "false", "no", "n", "-"}
+# Accept skill labels and keys alike ("Reading" / "reading").
+_SKILL_BITS: Dict[str, int] = {}
+for _skill in SKILLS:
+    _SKILL_BITS[_skill.key] = 1 << _skill.index
+    _SKILL_BITS[_skill.label.lower()] = 1 << _skill.index
+
+
+class ImportCancelled(Exception):
+    pass
+
+
+class ImportReport:
+    """Outcome of reading one import file."""
+
+    __slots__ = ("rows", "accepted", "skipped", "errors", "error_count", "cancelled")
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.accepted = 0
+        self.skipped = 0
+        self.errors: List[str] = []
+        self.error_count = 0
+        self.cancelled = False
+
+    def reject(self, line: int, message: str) -> None:
+        self.skipped += 1
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"line {line}: {message}")
+
+    def summary(self) -> str:
+        text = f"{self.accepted:,} of {self.rows:,} rows imported"
+        if self.skipped:
+            text += f", {self.skipped:,} skipped"
+        if self.cancelled:
+            text += " (cancelled)"
+        return text
+
+
+# Row sources -------------------------------------------------------------
+
+def _is_json_lines(path: Path, head: bytes) -> bool:
+    if path.suffix.lower() in _JSON_LINES_SUFFIXES:
+        return True
+    return head.lstrip(b"\xef\xbb\xbf \t\r\n")[:1] == b"{"
+
+
+def iter_rows(
+    path: Path, progress: Optional[ProgressCallback] = None
+) -> Iterator[Tuple[int, Any]]:
+    """Yield ``(line_number, row)`` from a CSV or JSON-lines file.
+
+    Rows that are objects come back as dicts with lower-cased keys (CSV
+    rows always do). Other JSON values are yielded as parsed, and lines
+    that do not parse as a ValueError instance. Raises ImportCancelled if
+    ``progress`` returns False.
+    """
+
+    total = path.stat().st_size
+    with path.open("rb") as raw:
+        head = raw.peek(4096)[:4096] if hasattr(raw, "peek") else b""
+        text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+
+        def tick() -> None:
+            if progress is not None and progress(raw.tell(), total) is False:
+                raise ImportCancelled()
+
+        if _is_json_lines(path, head):
+            for line_no, line in enumerate(text, 1):
+                if line_no % PROGRESS_EVERY == 0:
+                    tick()
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                except ValueError as exc:
+                    yield line_no, ValueError(f"invalid JSON ({exc})")
+                    continue
+                if isinstance(row, dict):
+                    row = {str(key).strip().lower(): value for key, value in row.items()}
+                yield line_no, row
+        else:
+            sample = head.decode("utf-8", errors="ignore")
+            try:
+                dialect: Any = csv.Sniffer().sniff(sample, delimiters=",;\t")
+            except csv.Error:
+                dialect = csv.excel
+            reader = csv.reader(text, dialect)
+            header: Optional[List[str]] = None
+            for row in reader:
+                if header is None:
+                    header = [name.strip().lower() for name in row]
+                    continue
+                line_no = reader.line_num
+                if line_no % PROGRESS_EVERY == 0:
+                    tick()
+                if not any(cell.strip() for cell in row):
+                    continue
+                yield line_no, dict(zip(header, row))
+        if progress is not None:
+            progress(total, total)
+
+
+def _normalize_date(value: Any, cache: Dict[str, str]) -> Optional[str]:
+    key = str(value).strip()
+    known = cache.get(key)
+    if known is not None:
+        return known
+    day = key.replace("/", "-")[:10]
+    if not _DATE_RE.match(day):
+        return None
+    try:
+        date.fromisoformat(day)
+    except ValueError:
+        return None
+    cache[key] = day
+    return day
+
+
+def _flag(value: Any) -> Optional[bool]:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return bool(value)
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    return None
+
+
+# Tracker -----------------------------------------------------------------
+
+def _row_mask(row: Dict[str, Any]) -> Tuple[Optional[int], str]:
+    """Return ``(mask, "")`` or ``(None, reason)`` for one tracker row."""
+
+    skills = row.get("skills")
+    if isinstance(skills, dict):
+        row = {str(key).strip().lower(): value for key, value in skills.items()}
+    elif isinstance(skills, list):
+        mask = 0
+        for name in skills:
+            bit = _SKILL_BITS.get(str(name).strip().lower())
+            if bit is None:
+                return None, f"unknown skill {name!r}"
+            mask |= bit
+        return mask, ""
+
+    skill = row.get("skill")
+    if skill is not None:
+        bit = _SKILL_BITS.get(str(skill).strip().lower())
+        if bit is None:
+            return None, f"unknown skill {skill!r}"
+        done = _flag(row.get("done", True))
+        if done is None:
+            return None, f"bad done value {row.get('done')!r}"
+        return (bit if done else 0), ""
+
+    mask = 0
+    seen = False
+    for key in SKILL_KEYS:
+        if key not in row:
+            continue
+        seen = True
+        done = _flag(row[key])
+        if done is None:
+            return None, f"bad value {row[key]!r} for {key}"
+        if done:
+            mask |= _SKILL_BITS[key]
+    if not seen:
+        return None, "no skill columns"
+    return mask, ""
+
+
+def read_tracker_file(
+    path: Path, progress: Optional[ProgressCallback] = None
+) -> Tuple[Dict[str, int], ImportReport]:
+    """Read practice history as ``{date: skill mask}``.
+
+    Rows for the same day are OR-ed together. On cancel the partial result
+    is discarded and ``report.cancelled`` is set.
+    """
+
+    report = ImportReport()
+    masks: Dict[str, int] = {}
+    dates: Dict[str, str] = {}
+    try:
+        for line_no, row in iter_rows(path, progress):
+            report.rows += 1
+            if isinstance(row, ValueError):
+                report.reject(line_no, str(row))
+                continue
+            if not isinstance(row, dict):
+                report.reject(line_no, "not an object")
+                continue
+            raw_day = row.get("date", row.get("day"))
+            day = _normalize_date(raw_day, dates) if raw_day is not None else None
+            if day is None:
+                report.reject(line_no, f"bad date {raw_day!r}")
+                continue
+            mask, reason = _row_mask(row)
+            if mask is None:
+                report.reject(line_no, reason)
+                continue
+            masks[day] = masks.get(day, 0) | mask
+            report.accepted += 1
+    except ImportCancelled:
+        report.cancelled = True
+        masks = {}
+    return masks, report
+
+
+# Resources ---------------------------------------------------------------
+
+def _tags(value: Any) -> List[str]:
+    if isinstance(value, list):
+        items = value
+    else:
+        text = str(value or "")
+        items = text.split(";") if ";" in text else text.split(",")
+    return [str(tag).strip() for tag in items if str(tag).strip()]
+
+
+def read_resources_file(
+    path: Path, progress: Optional[ProgressCallback] = None
+) -> Tuple[List[Dict[str, Any]], ImportReport]:
+    """Read resources as stored dicts (see ResourceItem.to_dict).
+
+    Rows without an ``id`` get none here; add_resources assigns ids to the
+    rows it keeps.
+    """
+
+    report = ImportReport()
+    items: List[Dict[str, Any]] = []
+    try:
+        for line_no, row in iter_rows(path, progress):
+            report.rows += 1
+            if isinstance(row, ValueError):
+                report.reject(line_no, str(row))
+                continue
+            if not isinstance(row, dict):
+                report.reject(line_no, "not an object")
+                continue
+            name = str(row.get("name") or "").strip()
+            if not name:
+                report.reject(line_no, "missing name")
+                continue
+            deck_name = str(row.get("deck_name") or row.get("deck") or "").strip()
+            items.append(
+                {
+                    "id": str(row.get("id") or "").strip(),
+                    "type": str(row.get("type") or "Other").strip(),
+                    "name": name,
+                    "link": str(row.get("link") or "").strip(),
+                    "notes": str(row.get("notes") or ""),
+                    "deck_name": deck_name or None,
+                    "tags": _tags(row.get("tags")),
+                }
+            )
+            report.accepted += 1
+    except ImportCancelled:
+        report.cancelled = True
+        items = []
+    return items, report
@@ -3,9 +3,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-import json
 
-from .storage import get_data_dir
+from .storage import get_data_dir, load_json, save_json
 
 
 # Profile constraints
@@ -85,31 +84,19 @@ def _default_profiles_data() -> Dict[str, Any]:
 
 def _load_profiles_registry() -> Dict[str, Any]:
     """Load the profiles registry from disk."""
-    path = get_data_dir() / _PROFILES_FILENAME
-    if not path.exists():
+    # load_json/save_json account the I/O and log read errors (core.io_stats).
+    data = load_json(_PROFILES_FILENAME, None)
+    if not isinstance(data, dict):
         return _default_profiles_data()
-    
-    try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            if not isinstance(data, dict):
-                return _default_profiles_data()
-            # Ensure required keys exist
-            if "profiles" not in data or "active_profile" not in data:
-                return _default_profiles_data()
-            return data
-    except Exception:
+    # Ensure required keys exist
+    if "profiles" not in data or "active_profile" not in data:
         return _default_profiles_data()
+    return data
 
 
 def _save_profiles_registry(data: Dict[str, Any]) -> None:
     """Save the profiles registry to disk."""
-    path = get_data_dir() / _PROFILES_FILENAME
-    try:
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except Exception:
-        pass
+    save_json(_PROFILES_FILENAME, data)
 
 
 def list_profiles() -> List[Dict[str, Any]]:
@@ -243,6 +230,35 @@ def create_profile(display_name: str) -> tuple[bool, str]:
     return True, f"Profile '{display_name}' created successfully."
 
 
+def register_profile(profile_id: str, display_name: str) -> bool:
+    """Add an existing profile folder to the registry (e.g. after a restore).
+
+    Returns False if the id is unusable or the profile limit is reached;
+    True if the profile is registered afterwards (including when it
+    already was).
+    """
+    if not profile_id or sanitize_profile_name(profile_id) != profile_id:
+        return False
+    if profile_exists(profile_id):
+        return True
+
+    registry = _load_profiles_registry()
+    if len(registry["profiles"]) >= MAX_PROFILES:
+        return False
+
+    now = datetime.now().isoformat(timespec="seconds")
+    registry["profiles"].append(
+        {
+            "id": profile_id,
+            "display_name": (display_name or profile_id)[:MAX_PROFILE_NAME_LENGTH],
+            "created_at": now,
+            "last_used": now,
+        }
+    )
+    _save_profiles_registry(registry)
+    return True
+
+
 def delete_profile(profile_id: str) -> tuple[bool, str]:
     """Delete a profile.
     
@@ -1,64 +1,92 @@
 from __future__ import annotations
 
 from datetime import datetime, date
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
+from .logic_radar_analytics import balance_index, invalidate_radar_history
 from .models import RadarSnapshot
-from .storage import load_profile_json, save_profile_json
+from .skills import SKILL_KEYS
+from .store import get_document, put_document
 
 
 _FILENAME = "radar.json"
+RADAR_DOCUMENT = _FILENAME
+
+
+# Parsed snapshots of the active profile. Rebuilt only when the store hands
+# back a different radar.json object (first load, profile switch, external
+# reload), so a save is a single write and later reads never touch the disk.
+_snapshots: Dict[str, RadarSnapshot] = {}
+_snapshots_source: Any = None
+_latest_month: Optional[str] = None
 
 
 def _default() -> Dict[str, Dict]:
     return {}
 
 
-def load_radar_snapshots() -> Dict[str, Dict]:
-    data = load_profile_json(_FILENAME, _default())
+def _ensure_loaded() -> Dict[str, RadarSnapshot]:
+    global _snapshots, _snapshots_source, _latest_month
+    data = get_document(_FILENAME, _default())
+    if data is _snapshots_source:
+        return _snapshots
+
+    _snapshots_source = data
     if not isinstance(data, dict):
-        return _default()
-    return data
+        data = _default()
+    _snapshots = {
+        month: RadarSnapshot.from_dict(month, raw)
+        for month, raw in data.items()
+        if isinstance(raw, dict)
+    }
+    _latest_month = max(_snapshots.keys()) if _snapshots else None
+    invalidate_radar_history()
+    return _snapshots
 
 
-def save_radar_snapshot(snapshot: RadarSnapshot) -> None:
-    data = load_radar_snapshots()
-    data[snapshot.month] = snapshot.to_dict()
-    save_profile_json(_FILENAME, data)
+def load_radar_snapshots() -> Dict[str, RadarSnapshot]:
+    return dict(_ensure_loaded())
 
 
-def compute_balance_index(snapshot: Dict) -> Optional[int]:
+def save_radar_snapshot(snapshot: RadarSnapshot) -> Dict[str, RadarSnapshot]:
+    """Store a snapshot and return the updated month -> snapshot map."""
+
+    global _snapshots_source, _latest_month
+    _ensure_loaded()
+    data = dict(_snapshots_source) if isinstance(_snapshots_source, dict) else _default()
+    data[snapshot.month] = snapshot.to_dict()
+    if put_document(_FILENAME, data, [snapshot.month]) is None:
+        # Not written: keep the snapshots that are on disk.
+        return dict(_snapshots)
+
+    if _snapshots_source is not data:
+        # Listeners notified by put_document may already have reparsed it.
+        _snapshots[snapshot.month] = snapshot
+        if _latest_month is None or snapshot.month > _latest_month:
+            _latest_month = snapshot.month
+        _snapshots_source = data
+        invalidate_radar_history()
+    # After a merge the store holds more than ``data``; this picks it up.
+    return load_radar_snapshots()
+
+
+def compute_balance_index(snapshot: RadarSnapshot) -> Optional[int]:
     """Compute a 0–100 balance score for a single snapshot.
 
     The idea: the closer all skills are to each other, the higher the score.
-    We compute the average absolute deviation from the mean and map it so that
-    0 deviation -> 100, and a deviation of 2 (roughly the maximum for 1–5
-    ratings) maps to 0.
+    See ``logic_radar_analytics.balance_index`` for the mapping.
     """
 
-    values = [
-        float(snapshot.get("reading", 0)),
-        float(snapshot.get("listening", 0)),
-        float(snapshot.get("speaking", 0)),
-        float(snapshot.get("writing", 0)),
-    ]
-    if not any(values):
-        return None
-
-    avg = sum(values) / len(values)
-    deviations = sum(abs(v - avg) for v in values) / len(values)
-    max_deviation = 2.0
-    score = 100.0 * (1.0 - min(deviations, max_deviation) / max_deviation)
-    return max(0, min(100, int(round(score))))
+    return balance_index(snapshot.values)
 
 
-def compute_trends(current: Dict, previous: Dict) -> Dict[str, str]:
+def compute_trends(current: RadarSnapshot, previous: RadarSnapshot) -> Dict[str, str]:
     """Return per-skill trend between two snapshots: 'up', 'down', or 'same'."""
 
     trends: Dict[str, str] = {}
-    for key in ("reading", "listening", "speaking", "writing"):
-        cur = int(current.get(key, 0))
-        prev = int(previous.get(key, 0))
+    for i, key in enumerate(SKILL_KEYS):
+        cur = current.values[i]
+        prev = previous.values[i]
         if cur > prev:
             trends[key] = "up"
         elif cur < prev:
@@ -71,11 +99,11 @@ def compute_trends(current: Dict, previous: Dict) -> Dict[str, str]:
 def get_days_since_last_snapshot() -> Optional[int]:
     """Return days since the most recent snapshot, or None if no data."""
 
-    snapshots = load_radar_snapshots()
-    if not snapshots:
+    _ensure_loaded()
+    last_month = _latest_month
+    if last_month is None:
         return None
 
-    last_month = max(snapshots.keys())
     try:
         last_date = datetime.strptime(f"{last_month}-01", "%Y-%m-%d").date()
     except Exception:
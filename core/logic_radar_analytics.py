@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+from .skills import SKILL_COUNT, SKILL_KEYS
+
+if TYPE_CHECKING:
+    from .models import RadarSnapshot
+
+
+# Number of months in the trailing moving-average window.
+MOVING_AVERAGE_WINDOW = 3
+
+
+class RadarHistory:
+    """All radar snapshots of a profile as month-indexed numeric arrays.
+
+    ``values``, ``moving_avg`` and ``deltas`` are flat arrays with one row of
+    ``SKILL_COUNT`` entries (in ``Skill.index`` order) per month, in ``months`` order (oldest first).
+    ``deltas`` for the first month are zero.
+    """
+
+    __slots__ = (
+        "months",
+        "values",
+        "balance",
+        "balance_avg",
+        "moving_avg",
+        "deltas",
+        "slopes",
+        "_index",
+    )
+
+    def __init__(self) -> None:
+        self.months: List[str] = []
+        self.values = array("b")
+        self.balance: List[Optional[int]] = []
+        self.balance_avg: List[Optional[float]] = []
+        self.moving_avg = array("d")
+        self.deltas = array("b")
+        # Least-squares trend per skill, in rating points per month.
+        self.slopes: Dict[str, float] = {s: 0.0 for s in SKILL_KEYS}
+        self._index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.months)
+
+    def index_of(self, month: str) -> Optional[int]:
+        return self._index.get(month)
+
+    def skill_values(self, i: int) -> Dict[str, int]:
+        base = i * SKILL_COUNT
+        return {s: self.values[base + k] for k, s in enumerate(SKILL_KEYS)}
+
+    def skill_deltas(self, i: int) -> Dict[str, int]:
+        base = i * SKILL_COUNT
+        return {s: self.deltas[base + k] for k, s in enumerate(SKILL_KEYS)}
+
+    def trends(self, i: int) -> Dict[str, str]:
+        """Per-skill 'up'/'down'/'same' versus the previous snapshot."""
+
+        return {
+            s: "up" if d > 0 else "down" if d < 0 else "same"
+            for s, d in self.skill_deltas(i).items()
+        }
+
+
+def _month_ordinal(month: str) -> Optional[int]:
+    try:
+        year, mon = month.split("-")
+        return int(year) * 12 + int(mon) - 1
+    except (ValueError, AttributeError):
+        return None
+
+
+def balance_index(values: Sequence[int]) -> Optional[int]:
+    """Map per-skill ratings to a 0–100 balance score (None if all zero).
+
+    The average absolute deviation from the mean is mapped so that 0
+    deviation -> 100 and a deviation of 2 (roughly the maximum for 1–5
+    ratings) -> 0.
+    """
+
+    if not any(values):
+        return None
+    avg = sum(values) / len(values)
+    deviation = sum(abs(v - avg) for v in values) / len(values)
+    score = 100.0 * (1.0 - min(deviation, 2.0) / 2.0)
+    return max(0, min(100, int(round(score))))
+
+
+def build_radar_history(
+    snapshots: Dict[str, "RadarSnapshot"], window: int = MOVING_AVERAGE_WINDOW
+) -> RadarHistory:
+    """Compute balance, moving averages, deltas and slopes in one pass."""
+
+    history = RadarHistory()
+    n_skills = SKILL_COUNT
+    window = max(1, window)
+
+    months = sorted(m for m in snapshots if _month_ordinal(m) is not None)
+
+    window_sums = [0.0] * n_skills
+    balance_window: List[Optional[int]] = []
+    # Running sums for least-squares slopes over the month ordinal.
+    sx = sxx = 0.0
+    sy = [0.0] * n_skills
+    sxy = [0.0] * n_skills
+
+    for i, month in enumerate(months):
+        row = [max(0, min(127, v)) for v in snapshots[month].values]
+        history._index[month] = i
+        history.months.append(month)
+        history.values.extend(row)
+
+        history.balance.append(balance_index(row))
+
+        # Month-over-month deltas.
+        if i == 0:
+            history.deltas.extend([0] * n_skills)
+        else:
+            prev_base = (i - 1) * n_skills
+            history.deltas.extend(
+                row[k] - history.values[prev_base + k] for k in range(n_skills)
+            )
+
+        # Trailing moving averages.
+        span = min(i + 1, window)
+        for k in range(n_skills):
+            window_sums[k] += row[k]
+            if i >= window:
+                window_sums[k] -= history.values[(i - window) * n_skills + k]
+        history.moving_avg.extend(s / span for s in window_sums)
+
+        balance_window.append(history.balance[-1])
+        if len(balance_window) > window:
+            balance_window.pop(0)
+        scored = [b for b in balance_window if b is not None]
+        history.balance_avg.append(sum(scored) / len(scored) if scored else None)
+
+        x = float(_month_ordinal(month))  # type: ignore[arg-type]
+        sx += x
+        sxx += x * x
+        for k in range(n_skills):
+            sy[k] += row[k]
+            sxy[k] += x * row[k]
+
+    n = len(months)
+    denom = n * sxx - sx * sx
+    if n >= 2 and denom:
+        for k, skill in enumerate(SKILL_KEYS):
+            history.slopes[skill] = (n * sxy[k] - sx * sy[k]) / denom
+
+    return history
+
+
+# Cached history, keyed by the store revision of radar.json and dropped by
+# save_radar_snapshot.
+_cache_key: Optional[int] = None
+_cache: Optional[RadarHistory] = None
+
+
+def invalidate_radar_history() -> None:
+    global _cache_key, _cache
+    _cache_key = None
+    _cache = None
+
+
+def get_radar_history() -> RadarHistory:
+    """Return analytics for the active profile's snapshots (cached)."""
+
+    global _cache_key, _cache
+    from .logic_radar import RADAR_DOCUMENT, load_radar_snapshots
+    from .store import get_document_revision
+
+    snapshots = load_radar_snapshots()
+    key = get_document_revision(RADAR_DOCUMENT)
+    if _cache is not None and key == _cache_key:
+        return _cache
+
+    _cache = build_radar_history(snapshots)
+    _cache_key = key
+    return _cache
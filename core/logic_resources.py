@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-from typing import List, Dict, Any
+import uuid
+from typing import List, Dict, Any, Optional, Tuple
 
 from .models import ResourceItem
-from .storage import load_profile_json, save_profile_json
+from .store import get_document, get_document_revision, put_document
 
 
 _FILENAME = "resources.json"
+RESOURCES_DOCUMENT = _FILENAME
+
+# Cache for load_recent_resources: (store revision, limit) -> newest-first
+# list of (index, ResourceItem), so the dashboard preview is only rebuilt
+# after resources.json changes.
+_recent_cache_key: Optional[Tuple[int, int]] = None
+_recent_cache: List[Tuple[int, ResourceItem]] = []
 
 
 def _default() -> List[Dict[str, Any]]:
@@ -14,12 +22,76 @@ def _default() -> List[Dict[str, Any]]:
 
 
 def load_resources() -> List[Dict[str, Any]]:
-    data = load_profile_json(_FILENAME, _default())
+    data = get_document(_FILENAME, _default())
     if not isinstance(data, list):
         return _default()
-    return data
+    return list(data)
 
 
 def save_resources(items: List[ResourceItem]) -> None:
     data = [item.to_dict() for item in items]
-    save_profile_json(_FILENAME, data)
+    put_document(_FILENAME, data)
+
+
+def add_resources(rows: List[Dict[str, Any]]) -> int:
+    """Append stored-form resource dicts in a single write.
+
+    Rows whose id, or whose (name, link) pair, is already present (in the
+    profile or earlier in ``rows``) are skipped; rows without an id get a
+    new one. Returns the number of resources added.
+    """
+
+    data = load_resources()
+    ids = set()
+    seen = set()
+    for raw in data:
+        if isinstance(raw, dict):
+            ids.add(str(raw.get("id", "")))
+            seen.add((str(raw.get("name", "")).strip().lower(), str(raw.get("link", "")).strip()))
+
+    added = 0
+    for row in rows:
+        key = (row["name"].strip().lower(), row["link"].strip())
+        if (row["id"] and row["id"] in ids) or key in seen:
+            continue
+        if not row["id"]:
+            row = dict(row, id=str(uuid.uuid4()))
+        ids.add(row["id"])
+        seen.add(key)
+        data.append(row)
+        added += 1
+    if added:
+        put_document(_FILENAME, data)
+    return added
+
+
+def load_recent_resources(limit: int) -> List[Tuple[int, ResourceItem]]:
+    """Return up to ``limit`` most recently added resources, newest first.
+
+    Each entry is ``(index, item)`` where ``index`` is the position of the
+    resource in the full list returned by :func:`load_resources`. The result
+    is cached until resources.json changes.
+    """
+
+    global _recent_cache_key, _recent_cache
+
+    if limit <= 0:
+        return []
+
+    raw = load_resources()
+    key = (get_document_revision(_FILENAME), limit)
+    if key == _recent_cache_key:
+        return list(_recent_cache)
+
+    recent: List[Tuple[int, ResourceItem]] = []
+    for index in range(len(raw) - 1, -1, -1):
+        item = ResourceItem.from_dict(raw[index])
+        if item is None:
+            continue
+        recent.append((index, item))
+        if len(recent) >= limit:
+            break
+
+    _recent_cache_key = key
+    _recent_cache = recent
+    return list(recent)
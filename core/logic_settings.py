@@ -3,7 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass, asdict
 from typing import Any, Dict
 
-from .storage import load_json, save_json
+from .codec import DEFAULT_FORMAT
+from .storage import load_json, save_json, set_storage_format
 
 
 _SETTINGS_FILENAME = "settings.json"
@@ -19,6 +20,7 @@ class Settings:
     font_size: str = "medium"  # small, medium, large, or numeric point size
     open_on_startup: bool = False
     theme: str = "anki_auto"  # anki_auto, light, zen, high_contrast, japanese_pastel
+    storage_format: str = DEFAULT_FORMAT  # pretty, compact, or binary (see core.codec)
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -32,20 +34,24 @@ def load_settings() -> Settings:
     """Load settings from JSON, falling back to sensible defaults.
 
     Any missing keys are filled with default values so new fields are
-    backward-compatible with older settings.json versions.
+    backward-compatible with older settings.json versions. The storage
+    format is applied to core.storage as a side effect.
     """
 
     raw = load_json(_SETTINGS_FILENAME, default=_default_settings().to_dict())
     if not isinstance(raw, dict):
-        return _default_settings()
+        settings = _default_settings()
+    else:
+        base = _default_settings().to_dict()
+        base.update({k: v for k, v in raw.items() if k in base})
+        settings = Settings(**base)
 
-    base = _default_settings().to_dict()
-    base.update({k: v for k, v in raw.items() if k in base})
-
-    return Settings(**base)
+    set_storage_format(settings.storage_format)
+    return settings
 
 
 def save_settings(settings: Settings) -> None:
     """Persist settings to JSON."""
 
+    set_storage_format(settings.storage_format)
     save_json(_SETTINGS_FILENAME, settings.to_dict())
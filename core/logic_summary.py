@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .logic_goals import GOALS_DOCUMENT, get_current_month_id
+from .logic_profiles import get_active_profile_id
+from .logic_resources import RESOURCES_DOCUMENT
+from .logic_tracker import TRACKER_DOCUMENT
+from .skills import mask_from_mapping
+from .storage import get_profile_file_signature, load_profile_json, save_profile_json
+from .store import add_document_listener, get_document, get_document_revision
+
+
+# A small per-profile sidecar (summary.json) with the numbers profile lists
+# show: last active day, streak, this month's goal progress and resource
+# count. It is kept up to date from store saves of the active profile, so a
+# list of profiles reads one tiny file each instead of every profile's data.
+#
+# Saves update it incrementally: a tracker save only looks at the changed
+# days (and walks back along the streak), a goals save only recounts the
+# current month, a resources save only takes the new length. The sidecar
+# also records the (mtime_ns, size) of the files it was computed from; if
+# they no longer match (files restored, imported or edited outside the
+# add-on) or the month rolled over, it is stale: profile lists show it as it
+# is (peek_profile_stats) and rebuild it from disk in the background.
+
+SUMMARY_FILENAME = "summary.json"
+SUMMARY_VERSION = 1
+_SOURCES = (TRACKER_DOCUMENT, GOALS_DOCUMENT, RESOURCES_DOCUMENT)
+
+
+class ProfileStats:
+    __slots__ = ("last_active", "streak", "month", "goals_done", "goals_set", "resources", "sources")
+
+    def __init__(self) -> None:
+        # Last day with any practice ("YYYY-MM-DD") and the length of the
+        # run of consecutive practice days ending on it.
+        self.last_active: Optional[str] = None
+        self.streak = 0
+        self.month = ""
+        self.goals_done = 0
+        self.goals_set = 0
+        self.resources = 0
+        # Signatures of _SOURCES the numbers were computed from.
+        self.sources: List[Any] = [None] * len(_SOURCES)
+
+    @classmethod
+    def from_dict(cls, raw: Any) -> Optional[ProfileStats]:
+        if not isinstance(raw, dict) or raw.get("version") != SUMMARY_VERSION:
+            return None
+        stats = cls()
+        try:
+            stats.last_active = raw.get("last_active") or None
+            stats.streak = int(raw.get("streak", 0))
+            stats.month = str(raw.get("month", ""))
+            stats.goals_done = int(raw.get("goals_done", 0))
+            stats.goals_set = int(raw.get("goals_set", 0))
+            stats.resources = int(raw.get("resources", 0))
+            sources = raw.get("sources") or []
+            stats.sources = [tuple(s) if isinstance(s, list) else None for s in sources]
+        except (TypeError, ValueError):
+            return None
+        return stats
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": SUMMARY_VERSION,
+            "last_active": self.last_active,
+            "streak": self.streak,
+            "month": self.month,
+            "goals_done": self.goals_done,
+            "goals_set": self.goals_set,
+            "resources": self.resources,
+            "sources": [list(s) if s is not None else None for s in self.sources],
+        }
+
+    def current_streak(self, today: Optional[date] = None) -> int:
+        """The streak as of ``today``; it survives a day not yet practised."""
+
+        if self.last_active is None:
+            return 0
+        today = today or date.today()
+        try:
+            last = date.fromisoformat(self.last_active)
+        except ValueError:
+            return 0
+        return self.streak if (today - last).days <= 1 else 0
+
+    def describe(self) -> str:
+        """One-line summary for profile lists."""
+
+        parts = [f"🔥 {self.current_streak()}"]
+        parts.append(f"last {self.last_active}" if self.last_active else "no practice yet")
+        if self.goals_set:
+            parts.append(f"goals {self.goals_done}/{self.goals_set}")
+        parts.append(f"{self.resources} resource{'s' if self.resources != 1 else ''}")
+        return " · ".join(parts)
+
+
+# Computation -------------------------------------------------------------
+
+def _is_active(tracker: Dict[str, Any], day: str) -> bool:
+    skills = tracker.get(day)
+    return isinstance(skills, dict) and mask_from_mapping(skills) != 0
+
+
+def _run_ending(tracker: Dict[str, Any], last: str) -> int:
+    day = date.fromisoformat(last)
+    run = 0
+    while _is_active(tracker, day.isoformat()):
+        run += 1
+        day -= timedelta(days=1)
+    return run
+
+
+def _latest_active(tracker: Dict[str, Any]) -> Optional[str]:
+    active = [day for day in tracker if _is_active(tracker, day)]
+    return max(active) if active else None
+
+
+def _streak_start(stats: ProfileStats) -> str:
+    if not stats.last_active or not stats.streak:
+        return stats.last_active or ""
+    start = date.fromisoformat(stats.last_active) - timedelta(days=stats.streak)
+    # One day before the run: ticking it joins the run.
+    return start.isoformat()
+
+
+def _apply_tracker(stats: ProfileStats, tracker: Any, changed: Optional[Iterable[str]]) -> None:
+    """Update last_active/streak; ``changed`` None means recompute fully."""
+
+    if not isinstance(tracker, dict):
+        stats.last_active, stats.streak = None, 0
+        return
+    if changed is None:
+        last = _latest_active(tracker)
+    else:
+        last = stats.last_active
+        for day in changed:
+            if (last is None or day > last) and _is_active(tracker, day):
+                last = day
+        if last is not None and not _is_active(tracker, last):
+            # The latest practice day was un-ticked: the only case that
+            # needs a scan.
+            last = _latest_active(tracker)
+        elif last == stats.last_active and not any(
+            _streak_start(stats) <= day <= (last or "") for day in changed
+        ):
+            # Nothing inside the current run changed.
+            return
+    stats.last_active = last
+    try:
+        stats.streak = _run_ending(tracker, last) if last else 0
+    except ValueError:
+        stats.streak = 0
+
+
+def _apply_goals(stats: ProfileStats, goals: Any) -> None:
+    stats.month = get_current_month_id()
+    month = goals.get(stats.month) if isinstance(goals, dict) else None
+    texts = month.get("goals") or [] if isinstance(month, dict) else []
+    completed = month.get("completed") or [] if isinstance(month, dict) else []
+    stats.goals_set = sum(1 for text in texts if str(text).strip())
+    stats.goals_done = sum(
+        1 for i, text in enumerate(texts) if str(text).strip() and i < len(completed) and completed[i]
+    )
+
+
+def _apply_resources(stats: ProfileStats, resources: Any) -> None:
+    stats.resources = len(resources) if isinstance(resources, list) else 0
+
+
+def _sources(profile_id: str) -> List[Any]:
+    return [get_profile_file_signature(name, profile_id) for name in _SOURCES]
+
+
+def rebuild_profile_stats(profile_id: str) -> ProfileStats:
+    """Recompute a profile's sidecar from its files and write it."""
+
+    stats = ProfileStats()
+    _apply_tracker(stats, load_profile_json(TRACKER_DOCUMENT, {}, profile_id), None)
+    _apply_goals(stats, load_profile_json(GOALS_DOCUMENT, {}, profile_id))
+    _apply_resources(stats, load_profile_json(RESOURCES_DOCUMENT, [], profile_id))
+    stats.sources = _sources(profile_id)
+    save_profile_json(SUMMARY_FILENAME, stats.to_dict(), profile_id)
+    return stats
+
+
+def peek_profile_stats(profile_id: str) -> Tuple[Optional[ProfileStats], bool]:
+    """Read the sidecar as it is: ``(stats or None, stale)``.
+
+    Costs one small read and three stat() calls and never rebuilds, so
+    profile lists can call it on the main thread and hand stale ids to
+    rebuild_profile_stats in the background.
+    """
+
+    stats = ProfileStats.from_dict(load_profile_json(SUMMARY_FILENAME, None, profile_id))
+    stale = (
+        stats is None
+        or stats.month != get_current_month_id()
+        or stats.sources != _sources(profile_id)
+    )
+    return stats, stale
+
+
+def read_profile_stats(profile_id: str) -> ProfileStats:
+    """Return the profile's sidecar, rebuilding it first if it is stale."""
+
+    stats, stale = peek_profile_stats(profile_id)
+    if stats is None or stale:
+        stats = rebuild_profile_stats(profile_id)
+    return stats
+
+
+# Incremental updates from store saves -------------------------------------
+
+# Sidecar of the active profile as last written: (profile id, stats).
+_active: Optional[Tuple[str, ProfileStats]] = None
+
+
+def _on_document_changed(document: str, keys: Optional[List[str]]) -> None:
+    global _active
+    if document not in _SOURCES:
+        return
+    if keys is None and not get_document_revision(document):
+        # Sent by invalidate_documents (profile switch, restore): nothing
+        # was saved, but files may have been replaced under us.
+        _active = None
+        return
+    profile_id = get_active_profile_id()
+    if _active is None or _active[0] != profile_id:
+        # First save since a profile switch: count from the store's copies
+        # (already in memory, and they include this save) rather than
+        # parsing the files again.
+        stats = ProfileStats()
+        _apply_tracker(stats, get_document(TRACKER_DOCUMENT, {}), None)
+        _apply_goals(stats, get_document(GOALS_DOCUMENT, {}))
+        _apply_resources(stats, get_document(RESOURCES_DOCUMENT, []))
+        _active = (profile_id, stats)
+    elif document == TRACKER_DOCUMENT:
+        stats = _active[1]
+        _apply_tracker(stats, get_document(TRACKER_DOCUMENT, {}), keys)
+    elif document == GOALS_DOCUMENT:
+        stats = _active[1]
+        if keys is None or stats.month in keys or stats.month != get_current_month_id():
+            _apply_goals(stats, get_document(GOALS_DOCUMENT, {}))
+    else:
+        stats = _active[1]
+        _apply_resources(stats, get_document(RESOURCES_DOCUMENT, []))
+    stats.sources = _sources(profile_id)
+    save_profile_json(SUMMARY_FILENAME, stats.to_dict(), profile_id)
+
+
+def install_summary_listener() -> None:
+    """Keep the active profile's sidecar current as documents are saved."""
+
+    add_document_listener(_on_document_changed)
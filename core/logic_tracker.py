@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Dict
+from typing import Any, Dict
 
 from .models import DailyActivity
-from .storage import load_profile_json, save_profile_json
+from .skills import mask_from_mapping, mask_has, mask_to_mapping
+from .store import get_document, put_document
 
 
 _FILENAME = "tracker.json"
+# Store document name; change notifications carry the affected dates.
+TRACKER_DOCUMENT = _FILENAME
 
 
 def _default() -> DailyActivity:
@@ -14,11 +17,73 @@ def _default() -> DailyActivity:
 
 
 def load_daily_activity() -> DailyActivity:
-    data = load_profile_json(_FILENAME, _default())
+    """Load tracker data as ``{date: skill bitmask}``.
+
+    The file keeps the readable ``{date: {skill: bool}}`` layout; masks are
+    only the in-memory form.
+    """
+
+    data = get_document(_FILENAME, {})
     if not isinstance(data, dict):
         return _default()
-    return data
+    return {
+        day: mask_from_mapping(skills)
+        for day, skills in data.items()
+        if isinstance(skills, dict)
+    }
 
 
 def save_daily_activity(activity: DailyActivity) -> None:
-    save_profile_json(_FILENAME, activity)
+    previous = get_document(_FILENAME, {})
+    if not isinstance(previous, dict):
+        previous = {}
+    data: Dict[str, Any] = {}
+    for day, mask in activity.items():
+        skills = mask_to_mapping(mask)
+        old = previous.get(day)
+        if isinstance(old, dict) and not old.keys() <= skills.keys():
+            # Keep keys that are not registered skills (written by a newer
+            # version or by hand); only the skill flags are ours to set.
+            skills = {**old, **skills}
+        data[day] = skills
+    changed = [day for day, skills in data.items() if previous.get(day) != skills]
+    for day, old in previous.items():
+        if day in data:
+            continue
+        if isinstance(old, dict):
+            changed.append(day)
+        else:
+            # Not a skill mapping, so load_daily_activity never showed it.
+            data[day] = old
+    put_document(_FILENAME, data, changed)
+
+
+def merge_daily_activity(masks: DailyActivity) -> int:
+    """Mark the skills in ``{date: mask}`` as done, in a single write.
+
+    Bulk counterpart of toggle_skill for imports: skills are only ever
+    added, never cleared. Returns the number of days that changed.
+    """
+
+    activity = load_daily_activity()
+    changed = 0
+    for day, mask in masks.items():
+        current = activity.get(day, 0)
+        if current | mask != current:
+            activity[day] = current | mask
+            changed += 1
+    if changed:
+        save_daily_activity(activity)
+    return changed
+
+
+def is_skill_done(activity: DailyActivity, day: str, index: int) -> bool:
+    return mask_has(activity.get(day, 0), index)
+
+
+def toggle_skill(activity: DailyActivity, day: str, index: int) -> bool:
+    """Flip one skill for ``day`` in place and return its new state."""
+
+    mask = activity.get(day, 0) ^ (1 << index)
+    activity[day] = mask
+    return mask_has(mask, index)
@@ -1,55 +1,250 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any, Sequence
+
+from .skills import SKILL_COUNT, skill_index, values_from_mapping, values_to_mapping
+
+
+# The hot-path models below are plain ``__slots__`` classes rather than
+# dataclasses. ``dataclasses.asdict`` deep-copies every list on each call,
+# which adds up when a whole resources list or goals file is re-serialized on
+# every save; the hand-written ``to_dict`` methods only copy what they must.
+
+
+def _pad_list(lst: Any, default: Any, target_len: int = 3) -> List[Any]:
+    lst = list(lst) if isinstance(lst, list) else []
+    while len(lst) < target_len:
+        lst.append(default)
+    return lst[:target_len]
 
 
-@dataclass
 class RadarSnapshot:
-    month: str
-    reading: int
-    listening: int
-    speaking: int
-    writing: int
+    """Per-skill ratings for one month, indexed by ``Skill.index``."""
+
+    __slots__ = ("month", "values")
+
+    def __init__(self, month: str, values: Sequence[int]) -> None:
+        self.month = month
+        self.values: List[int] = _pad_list(list(values), 0, SKILL_COUNT)
+
+    @classmethod
+    def from_dict(cls, month: str, raw: Any) -> "RadarSnapshot":
+        if not isinstance(raw, dict):
+            raw = {}
+        return cls(month, values_from_mapping(raw))
+
+    def get(self, skill: str, default: int = 0) -> int:
+        index = skill_index(skill)
+        return self.values[index] if index is not None else default
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        data: Dict[str, Any] = {"month": self.month}
+        data.update(values_to_mapping(self.values))
+        return data
 
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RadarSnapshot):
+            return NotImplemented
+        return self.month == other.month and self.values == other.values
 
-DailyActivity = Dict[str, Dict[str, bool]]
+    def __repr__(self) -> str:
+        return f"RadarSnapshot({self.to_dict()!r})"
+
+
+# Date ("YYYY-MM-DD") -> bitmask of skills done that day (see core.skills).
+DailyActivity = Dict[str, int]
 
 
-@dataclass
 class MonthlyGoals:
-    month: str
-    goals: List[str]
-    completed: List[bool]
-    notes: str = ""
-    archived: bool = False
-    # Per-goal metadata (all lists kept at length 3)
-    categories: List[str] = field(default_factory=list)
-    reflections: List[str] = field(default_factory=list)
-    subtasks: List[List[str]] = field(default_factory=list)
-    subtasks_done: List[List[bool]] = field(default_factory=list)
-    created_at: List[str] = field(default_factory=list)
-    completed_at: List[str] = field(default_factory=list)
+    __slots__ = (
+        "month",
+        "goals",
+        "completed",
+        "notes",
+        "archived",
+        "categories",
+        "reflections",
+        "subtasks",
+        "subtasks_done",
+        "created_at",
+        "completed_at",
+    )
+
+    def __init__(
+        self,
+        month: str,
+        goals: List[str],
+        completed: List[bool],
+        notes: str = "",
+        archived: bool = False,
+        # Per-goal metadata (all lists kept at length 3)
+        categories: Optional[List[str]] = None,
+        reflections: Optional[List[str]] = None,
+        subtasks: Optional[List[List[str]]] = None,
+        subtasks_done: Optional[List[List[bool]]] = None,
+        created_at: Optional[List[str]] = None,
+        completed_at: Optional[List[str]] = None,
+    ) -> None:
+        self.month = month
+        self.goals = goals
+        self.completed = completed
+        self.notes = notes
+        self.archived = archived
+        self.categories = categories if categories is not None else []
+        self.reflections = reflections if reflections is not None else []
+        self.subtasks = subtasks if subtasks is not None else []
+        self.subtasks_done = subtasks_done if subtasks_done is not None else []
+        self.created_at = created_at if created_at is not None else []
+        self.completed_at = completed_at if completed_at is not None else []
+
+    @classmethod
+    def blank(cls, month: str) -> MonthlyGoals:
+        """Return empty goals for a month with default metadata."""
+
+        return cls(
+            month=month,
+            goals=["", "", ""],
+            completed=[False, False, False],
+            notes="",
+            archived=False,
+            categories=["General", "General", "General"],
+            reflections=["", "", ""],
+            subtasks=[[], [], []],
+            subtasks_done=[[], [], []],
+            created_at=["", "", ""],
+            completed_at=["", "", ""],
+        )
+
+    @classmethod
+    def from_dict(cls, month: str, raw: Any) -> MonthlyGoals:
+        """Build goals from stored JSON, normalising to exactly three goals.
+
+        Backwards compatible with older JSON that may not have the archived
+        field or any of the per-goal metadata lists.
+        """
+
+        if not isinstance(raw, dict):
+            return cls.blank(month)
+
+        goals = _pad_list(raw.get("goals") or [], "")
+        completed = _pad_list(raw.get("completed") or [], False)
+        categories = _pad_list(raw.get("categories") or [], "General")
+        reflections = _pad_list(raw.get("reflections") or [], "")
+        created_at = _pad_list(raw.get("created_at") or [], "")
+        completed_at = _pad_list(raw.get("completed_at") or [], "")
+
+        # Subtasks are lists-of-lists; ensure outer list has 3 entries and
+        # each inner list has matching length for done flags.
+        subtasks = _pad_list(raw.get("subtasks") or [], [])
+        subtasks_done = _pad_list(raw.get("subtasks_done") or [], [])
+        norm_subtasks: List[List[str]] = []
+        norm_subtasks_done: List[List[bool]] = []
+        for st_list, done_list in zip(subtasks, subtasks_done):
+            st_list = st_list if isinstance(st_list, list) else []
+            done_list = list(done_list) if isinstance(done_list, list) else []
+            while len(done_list) < len(st_list):
+                done_list.append(False)
+            norm_subtasks.append([str(s) for s in st_list])
+            norm_subtasks_done.append([bool(d) for d in done_list[: len(st_list)]])
+
+        return cls(
+            month=month,
+            goals=goals,
+            completed=completed,
+            notes=raw.get("notes") or "",
+            archived=bool(raw.get("archived", False)),
+            categories=categories,
+            reflections=reflections,
+            subtasks=norm_subtasks,
+            subtasks_done=norm_subtasks_done,
+            created_at=created_at,
+            completed_at=completed_at,
+        )
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "month": self.month,
+            "goals": list(self.goals),
+            "completed": list(self.completed),
+            "notes": self.notes,
+            "archived": self.archived,
+            "categories": list(self.categories),
+            "reflections": list(self.reflections),
+            "subtasks": [list(s) for s in self.subtasks],
+            "subtasks_done": [list(d) for d in self.subtasks_done],
+            "created_at": list(self.created_at),
+            "completed_at": list(self.completed_at),
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MonthlyGoals):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"MonthlyGoals({self.to_dict()!r})"
 
 
-@dataclass
 class ResourceItem:
-    id: str
-    type: str
-    name: str
-    link: str
-    notes: str
-    deck_name: Optional[str]
-    tags: List[str] = field(default_factory=list)
+    __slots__ = ("id", "type", "name", "link", "notes", "deck_name", "tags")
+
+    def __init__(
+        self,
+        id: str,
+        type: str,
+        name: str,
+        link: str,
+        notes: str,
+        deck_name: Optional[str],
+        tags: Optional[List[str]] = None,
+    ) -> None:
+        self.id = id
+        self.type = type
+        self.name = name
+        self.link = link
+        self.notes = notes
+        self.deck_name = deck_name
+        self.tags = tags if tags is not None else []
+
+    @classmethod
+    def from_dict(cls, obj: Any) -> Optional[ResourceItem]:
+        """Build a resource from stored JSON, or None if it is unusable."""
+
+        if not isinstance(obj, dict):
+            return None
+        tags_raw = obj.get("tags") or []
+        if not isinstance(tags_raw, list):
+            tags_raw = []
+        deck_name = obj.get("deck_name")
+        return cls(
+            id=str(obj.get("id", "")),
+            type=str(obj.get("type", "")),
+            name=str(obj.get("name", "")),
+            link=str(obj.get("link", "")),
+            notes=str(obj.get("notes", "")),
+            deck_name=str(deck_name) if deck_name is not None else None,
+            tags=[str(t) for t in tags_raw if str(t).strip()],
+        )
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "type": self.type,
+            "name": self.name,
+            "link": self.link,
+            "notes": self.notes,
+            "deck_name": self.deck_name,
+            "tags": list(self.tags),
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ResourceItem):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"ResourceItem({self.to_dict()!r})"
 
 
 @dataclass
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import functools
+import threading
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, ContextManager, Deque, Dict, List, Optional, Tuple, TypeVar
+
+
+# Opt-in timing spans and counters for finding out where time goes when the
+# dock is slow. Recording is off by default (see the hidden Diagnostics panel
+# in SettingsView); while it is off, span() returns a shared no-op context,
+# @timed functions make one extra call and a flag check, and count() returns
+# immediately. Storage calls also run on worker threads (profile summaries
+# are read in parallel), so records and snapshots take a lock.
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Durations kept per span name for the rolling percentiles.
+WINDOW = 256
+
+_enabled = False
+_samples: Dict[str, Deque[float]] = {}
+_calls: Dict[str, int] = {}
+_counters: Dict[str, int] = {}
+_profiler: Any = None
+_lock = threading.Lock()
+_NULL_SPAN = nullcontext()
+
+
+def set_enabled(enabled: bool) -> None:
+    global _enabled
+    _enabled = bool(enabled)
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _record(name: str, elapsed_ms: float) -> None:
+    with _lock:
+        samples = _samples.get(name)
+        if samples is None:
+            samples = _samples[name] = deque(maxlen=WINDOW)
+        samples.append(elapsed_ms)
+        _calls[name] = _calls.get(name, 0) + 1
+
+
+class _Span:
+    __slots__ = ("_name", "_start")
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = perf_counter()
+
+    def __exit__(self, *_exc: Any) -> None:
+        _record(self._name, (perf_counter() - self._start) * 1000)
+
+
+def span(name: str) -> ContextManager[None]:
+    """Time the enclosed block under ``name`` when recording is on."""
+
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def timed(name: Optional[str] = None) -> Callable[[F], F]:
+    """Decorator form of :func:`span`; defaults to the function's qualname."""
+
+    def decorate(fn: F) -> F:
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _record(label, (perf_counter() - start) * 1000)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def count(name: str, amount: int = 1) -> None:
+    if _enabled:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + amount
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def span_stats() -> List[Tuple[str, int, float, float, float, float]]:
+    """Return ``(name, calls, p50, p90, p99, max)`` per span, slowest first.
+
+    Percentiles and max (in ms) cover the last ``WINDOW`` samples; calls is
+    the total since the last reset.
+    """
+
+    with _lock:
+        snapshot = [
+            (name, _calls.get(name, 0), list(samples)) for name, samples in _samples.items()
+        ]
+    rows = []
+    for name, calls, samples in snapshot:
+        ordered = sorted(samples)
+        rows.append(
+            (
+                name,
+                calls,
+                _percentile(ordered, 0.5),
+                _percentile(ordered, 0.9),
+                _percentile(ordered, 0.99),
+                ordered[-1] if ordered else 0.0,
+            )
+        )
+    rows.sort(key=lambda row: row[4], reverse=True)
+    return rows
+
+
+def counters() -> Dict[str, int]:
+    with _lock:
+        return dict(_counters)
+
+
+def reset() -> None:
+    with _lock:
+        _samples.clear()
+        _calls.clear()
+        _counters.clear()
+
+
+# cProfile capture ---------------------------------------------------------
+
+def is_profiling() -> bool:
+    return _profiler is not None
+
+
+def start_profiler() -> bool:
+    """Start a cProfile capture; returns False if one is already running."""
+
+    global _profiler
+    if _profiler is not None:
+        return False
+    import cProfile
+
+    _profiler = cProfile.Profile()
+    _profiler.enable()
+    return True
+
+
+def stop_profiler(path: Path) -> Optional[Path]:
+    """Stop the running capture and write it to ``path`` (pstats format)."""
+
+    global _profiler
+    profiler = _profiler
+    if profiler is None:
+        return None
+    _profiler = None
+    profiler.disable()
+    try:
+        profiler.dump_stats(str(path))
+    except Exception:
+        return None
+    return path
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+
+class Skill:
+    """A tracked language skill.
+
+    ``index`` is stable: it is the skill's position in per-skill value
+    arrays (radar snapshots) and its bit in daily tracker masks, so new
+    skills must only ever be appended to ``SKILLS``.
+    """
+
+    __slots__ = ("index", "key", "label", "emoji")
+
+    def __init__(self, index: int, key: str, label: str, emoji: str) -> None:
+        self.index = index
+        self.key = key
+        self.label = label
+        self.emoji = emoji
+
+    def __repr__(self) -> str:
+        return f"Skill({self.index}, {self.key!r})"
+
+
+SKILLS: Tuple[Skill, ...] = (
+    Skill(0, "reading", "Reading", "📖"),
+    Skill(1, "listening", "Listening", "🎧"),
+    Skill(2, "speaking", "Speaking", "🗣️"),
+    Skill(3, "writing", "Writing", "✍️"),
+)
+
+SKILL_KEYS: Tuple[str, ...] = tuple(s.key for s in SKILLS)
+SKILL_COUNT = len(SKILLS)
+
+_BY_KEY: Dict[str, Skill] = {s.key: s for s in SKILLS}
+
+
+def get_skill(key: str) -> Optional[Skill]:
+    return _BY_KEY.get(key)
+
+
+def skill_index(key: str) -> Optional[int]:
+    skill = _BY_KEY.get(key)
+    return skill.index if skill is not None else None
+
+
+# Fixed-width per-skill values -----------------------------------------
+
+def values_from_mapping(raw: Mapping, default: int = 0) -> List[int]:
+    """Read ``{skill_key: value}`` into a list indexed by skill index."""
+
+    values = []
+    for key in SKILL_KEYS:
+        try:
+            values.append(int(raw.get(key, default)))
+        except (TypeError, ValueError):
+            values.append(default)
+    return values
+
+
+def values_to_mapping(values: Sequence[int]) -> Dict[str, int]:
+    return {key: values[i] for i, key in enumerate(SKILL_KEYS)}
+
+
+# Daily tracker masks: bit ``skill.index`` is set when the skill was done ---
+
+def mask_from_mapping(raw: Mapping) -> int:
+    mask = 0
+    for skill in SKILLS:
+        if raw.get(skill.key):
+            mask |= 1 << skill.index
+    return mask
+
+
+def mask_to_mapping(mask: int) -> Dict[str, bool]:
+    return {skill.key: bool(mask & (1 << skill.index)) for skill in SKILLS}
+
+
+def mask_has(mask: int, index: int) -> bool:
+    return bool(mask & (1 << index))
@@ -1,68 +1,366 @@
 from __future__ import annotations
 
+import os
+import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional
+from time import monotonic, perf_counter, sleep
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from aqt import mw
 
+from .codec import DEFAULT_FORMAT, FORMATS, PRETTY, decode, detect_format, encode
+from .io_stats import LOG_FILENAME, record as record_io
+from .perf import count, timed
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None  # type: ignore[assignment]
+
+
+# Encoding used when profile documents are written (see core.codec). Loads
+# detect the format of each file, so changing this never strands old files.
+# Set from Settings.storage_format by core.logic_settings.
+_storage_format = DEFAULT_FORMAT
+
+
+# Concurrent writers (Anki open twice on the same add-on folder, a sync tool
+# touching user_data) are handled in three layers:
+#
+# * Every write goes to a temporary file that is renamed over the target,
+#   so readers never see a half-written document.
+# * Writes to a directory hold an advisory lock on its LOCK_FILENAME
+#   (fcntl.flock / msvcrt.locking). If the lock cannot be had within
+#   LOCK_TIMEOUT seconds the write goes ahead anyway rather than freezing
+#   Anki behind a crashed process.
+# * Profile documents carry a revision number: on disk they are wrapped as
+#   ``{REVISION_KEY: n, DATA_KEY: data}`` (older unwrapped files count as
+#   revision 0). save_profile_document takes the revision the caller's copy
+#   was based on and, if the file has moved on since, hands both versions
+#   to a merge function instead of overwriting the other writer's changes.
+#
+# The revision of the last file this process read or wrote is remembered
+# with the file's (mtime_ns, size), so a save normally costs one stat()
+# before writing; the file is only re-read when someone else changed it.
+
+LOCK_FILENAME = ".lock"
+LOCK_TIMEOUT = 5.0
+_LOCK_POLL = 0.02
+REVISION_KEY = "_revision"
+DATA_KEY = "_data"
+
+# merge(theirs, ours) -> document to write; see save_profile_document.
+MergeFunction = Callable[[Any, Any], Any]
+
+# path -> ((mtime_ns, size), revision) as of our last read or write
+_known_revisions: Dict[str, Tuple[Tuple[int, int], int]] = {}
+
 
 def get_addon_dir() -> Path:
     return Path(mw.addonManager.addonsFolder()) / "languageforge"
 
 
+def get_storage_format() -> str:
+    return _storage_format
+
+
+def set_storage_format(fmt: str) -> None:
+    global _storage_format
+    _storage_format = fmt if fmt in FORMATS else DEFAULT_FORMAT
+
+
 def get_data_dir() -> Path:
     data_dir = get_addon_dir() / "user_data"
     data_dir.mkdir(parents=True, exist_ok=True)
     return data_dir
 
 
+# Locking and atomic writes -----------------------------------------------
+
+def _try_lock(f) -> bool:
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        elif msvcrt is not None:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def _unlock(f) -> None:
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+    except OSError:
+        pass
+
+
+@contextmanager
+def directory_lock(directory: Path) -> Iterator[bool]:
+    """Hold the advisory write lock of ``directory``.
+
+    Yields whether the lock was acquired (False after LOCK_TIMEOUT, or if
+    the lock file cannot be opened). Not reentrant: do not nest for the
+    same directory.
+    """
+
+    try:
+        f = open(directory / LOCK_FILENAME, "a+b")
+    except OSError:
+        yield False
+        return
+    try:
+        deadline = monotonic() + LOCK_TIMEOUT
+        locked = _try_lock(f)
+        while not locked and monotonic() < deadline:
+            sleep(_LOCK_POLL)
+            locked = _try_lock(f)
+        if not locked:
+            count("storage.lock_timeout")
+        try:
+            yield locked
+        finally:
+            if locked:
+                _unlock(f)
+    finally:
+        f.close()
+
+
+def profile_lock(profile_id: Optional[str] = None):
+    """directory_lock for a profile's folder (default: the active one)."""
+    from .logic_profiles import get_active_profile_id, get_profile_data_dir
+
+    return directory_lock(get_profile_data_dir(profile_id or get_active_profile_id()))
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    # A unique temporary name per write: writers that went ahead after a
+    # lock timeout must not truncate or rename each other's half-written
+    # files.
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False
+    ) as f:
+        tmp = f.name
+        try:
+            f.write(payload)
+        except BaseException:
+            f.close()
+            os.unlink(tmp)
+            raise
+    try:
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def unwrap_document(raw: Any) -> Tuple[Any, int]:
+    """Split a decoded profile file into ``(data, revision)``."""
+
+    if (
+        isinstance(raw, dict)
+        and len(raw) == 2
+        and DATA_KEY in raw
+        and isinstance(raw.get(REVISION_KEY), int)
+    ):
+        return raw[DATA_KEY], raw[REVISION_KEY]
+    return raw, 0
+
+
+def _encode_document(data: Any, revision: int) -> bytes:
+    if _storage_format != PRETTY:
+        return encode({REVISION_KEY: revision, DATA_KEY: data}, _storage_format)
+    # Splice the wrapper around the data instead of nesting it: indented
+    # encoding runs in pure Python and one more level of indent on every
+    # line makes it markedly slower. Re-indenting the encoded payload gives
+    # the same layout; newlines inside JSON strings are escaped, so every
+    # raw newline is a line break between values.
+    return b"".join(
+        (
+            b'{\n  "%s": %d,\n  "%s": ' % (REVISION_KEY.encode(), revision, DATA_KEY.encode()),
+            encode(data, PRETTY).replace(b"\n", b"\n  "),
+            b"\n}",
+        )
+    )
+
+
 def load_json(filename: str, default: Any) -> Any:
-    path = get_data_dir() / filename
+    data_dir = get_data_dir()
+    path = data_dir / filename
     if not path.exists():
         return default
+    start = perf_counter()
+    size = 0
+    error: Optional[Exception] = None
     try:
-        import json
-
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+        raw = path.read_bytes()
+        size = len(raw)
+        return decode(raw)
+    except Exception as exc:
+        error = exc
         return default
+    finally:
+        record_io("read", filename, data_dir, start, size, error)
 
 
 def save_json(filename: str, data: Any) -> None:
-    path = get_data_dir() / filename
+    data_dir = get_data_dir()
+    path = data_dir / filename
+    start = perf_counter()
+    size = 0
+    error: Optional[Exception] = None
     try:
-        import json
-
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except Exception:
-        pass
+        # Add-on wide files (settings, profile registry) stay readable JSON.
+        payload = encode(data)
+        size = len(payload)
+        with directory_lock(data_dir):
+            _write_atomic(path, payload)
+    except Exception as exc:
+        error = exc
+    finally:
+        record_io("write", filename, data_dir, start, size, error)
 
 
 # Profile-aware storage functions
+@timed("load_profile_json")
+def load_profile_document(
+    filename: str, default: Any, profile_id: Optional[str] = None
+) -> Tuple[Any, int]:
+    """Load a document from a profile's directory with its revision.
+
+    Returns ``(default, 0)`` if the file is missing or unreadable. If
+    profile_id is None, uses the currently active profile.
+    """
+    from .logic_profiles import get_active_profile_id, get_profile_data_dir
+
+    if profile_id is None:
+        profile_id = get_active_profile_id()
+
+    profile_dir = get_profile_data_dir(profile_id)
+    path = profile_dir / filename
+
+    # Stat before reading: if the file is replaced in between, the
+    # remembered signature is the older one and the next save re-reads.
+    signature = _signature(path)
+    if signature is None:
+        return default, 0
+    start = perf_counter()
+    size = 0
+    error: Optional[Exception] = None
+    try:
+        raw = path.read_bytes()
+        size = len(raw)
+        count("bytes_read", size)
+        data, revision = unwrap_document(decode(raw))
+        _known_revisions[str(path)] = (signature, revision)
+        return data, revision
+    except Exception as exc:
+        error = exc
+        return default, 0
+    finally:
+        record_io("read", filename, profile_dir, start, size, error)
+
+
 def load_profile_json(filename: str, default: Any, profile_id: Optional[str] = None) -> Any:
     """Load JSON from a specific profile's directory.
     
     If profile_id is None, uses the currently active profile.
     """
+    return load_profile_document(filename, default, profile_id)[0]
+
+
+def _disk_revision(path: Path) -> Tuple[Optional[Tuple[int, int]], int]:
+    """Return (signature, revision) of ``path``, reading it only if needed."""
+
+    signature = _signature(path)
+    if signature is None:
+        return None, 0
+    known = _known_revisions.get(str(path))
+    if known is not None and known[0] == signature:
+        return signature, known[1]
+    try:
+        return signature, unwrap_document(decode(path.read_bytes()))[1]
+    except Exception:
+        return signature, 0
+
+
+@timed("save_profile_json")
+def save_profile_document(
+    filename: str,
+    data: Any,
+    base_revision: Optional[int] = None,
+    merge: Optional[MergeFunction] = None,
+    profile_id: Optional[str] = None,
+) -> Tuple[Any, Optional[int]]:
+    """Write a document to a profile's directory, compare-and-swap style.
+
+    ``base_revision`` is the revision ``data`` was derived from (see
+    load_profile_document); None skips the check. If the file on disk has
+    a different revision, another writer got there first: with ``merge``
+    the document written is ``merge(their data, data)``, without it
+    ``data`` still wins. Either way the conflict is counted in perf as
+    ``storage.conflict``.
+
+    Returns ``(written data, new revision)``, or ``(data, None)`` if the
+    write failed. If profile_id is None, uses the currently active profile.
+    """
     from .logic_profiles import get_active_profile_id, get_profile_data_dir
-    
+
     if profile_id is None:
         profile_id = get_active_profile_id()
-    
+
     profile_dir = get_profile_data_dir(profile_id)
     path = profile_dir / filename
-    
-    if not path.exists():
-        return default
-    try:
-        import json
 
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return default
+    start = perf_counter()
+    size = 0
+    error: Optional[Exception] = None
+    revision: Optional[int] = None
+    try:
+        with directory_lock(profile_dir):
+            signature, disk_revision = _disk_revision(path)
+            if base_revision is not None and disk_revision != base_revision:
+                count("storage.conflict")
+                if merge is not None and signature is not None:
+                    try:
+                        theirs = unwrap_document(decode(path.read_bytes()))[0]
+                    except Exception:
+                        # Unreadable: nothing to merge with.
+                        pass
+                    else:
+                        data = merge(theirs, data)
+            revision = disk_revision + 1
+            payload = _encode_document(data, revision)
+            size = len(payload)
+            _write_atomic(path, payload)
+            signature = _signature(path)
+            if signature is not None:
+                _known_revisions[str(path)] = (signature, revision)
+        count("bytes_written", size)
+    except Exception as exc:
+        error = exc
+        revision = None
+    finally:
+        record_io("write", filename, profile_dir, start, size, error)
+    return data, revision
 
 
 def save_profile_json(filename: str, data: Any, profile_id: Optional[str] = None) -> None:
@@ -70,18 +368,75 @@ def save_profile_json(filename: str, data: Any, profile_id: Optional[str] = None
     
     If profile_id is None, uses the currently active profile.
     """
+    save_profile_document(filename, data, profile_id=profile_id)
+
+
+def get_profile_file_signature(
+    filename: str, profile_id: Optional[str] = None
+) -> Optional[Tuple[int, int]]:
+    """Return a cheap (mtime_ns, size) signature for a profile file.
+
+    Used by callers that cache parsed data to detect on-disk changes with a
+    single stat() call. Returns None if the file does not exist.
+    """
     from .logic_profiles import get_active_profile_id, get_profile_data_dir
-    
+
     if profile_id is None:
         profile_id = get_active_profile_id()
-    
-    profile_dir = get_profile_data_dir(profile_id)
-    path = profile_dir / filename
-    
+
+    path = get_profile_data_dir(profile_id) / filename
     try:
-        import json
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except Exception:
-        pass
+
+def list_profile_documents(profile_id: str) -> List[Path]:
+    """Return the paths of a profile's stored documents (any format)."""
+    from .logic_profiles import get_profile_data_dir
+
+    return sorted(
+        path for path in get_profile_data_dir(profile_id).glob("*.json")
+        if path.is_file() and path.name != LOG_FILENAME
+    )
+
+
+def convert_profile_files(profile_id: str, fmt: Optional[str] = None) -> int:
+    """Rewrite a profile's documents in ``fmt`` (default: the current format).
+
+    Files already in that format, and files that do not parse, are left
+    alone; revisions are kept. Returns the number of files rewritten.
+    """
+    fmt = fmt if fmt in FORMATS else _storage_format
+    converted = 0
+    with profile_lock(profile_id):
+        for path in list_profile_documents(profile_id):
+            try:
+                raw = path.read_bytes()
+                if detect_format(raw) == fmt:
+                    continue
+                _write_atomic(path, encode(decode(raw), fmt))
+                converted += 1
+            except Exception:
+                continue
+    return converted
+
+
+def export_profile_json(profile_id: str, target_dir: Path) -> List[Path]:
+    """Write readable (indented) JSON copies of a profile's documents.
+
+    Works whatever format the files are stored in; the copies hold just the
+    data, without the revision wrapper. Returns the written paths.
+    """
+    target_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    for path in list_profile_documents(profile_id):
+        try:
+            data = unwrap_document(decode(path.read_bytes()))[0]
+        except Exception:
+            continue
+        out = target_dir / path.name
+        out.write_bytes(encode(data))
+        written.append(out)
+    return written
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .perf import count
+from .storage import MergeFunction, load_profile_document, save_profile_document
+
+
+# Shared in-memory copy of the active profile's JSON documents (goals,
+# tracker, resources, ...). Each document is read from disk once per profile;
+# saves go through put_document, which writes the file, bumps the document's
+# revision and notifies listeners with the keys that changed (months, dates,
+# ...) so views can update without re-reading anything.
+#
+# Cached values are shared: callers must not mutate what get_document
+# returns except to pass the modified copy straight back to put_document.
+#
+# Each cached document also remembers the on-disk revision it is based on
+# (see core.storage). If another process saved the file in the meantime,
+# put_document keeps that process's version of every top-level key (month,
+# date, ...) except the ones this save changed, and listeners are told the
+# whole document changed.
+
+DocumentListener = Callable[[str, Optional[List[str]]], None]
+
+_profile_id: Optional[str] = None
+_documents: Dict[str, Any] = {}
+_revisions: Dict[str, int] = {}
+# document -> on-disk revision of the cached copy
+_bases: Dict[str, int] = {}
+# Revisions come from one global counter so they never repeat, even across
+# profile switches.
+_revision_counter = 0
+_listeners: List[DocumentListener] = []
+
+
+def add_document_listener(callback: DocumentListener) -> None:
+    """Call ``callback(document, keys)`` after a document changes.
+
+    ``keys`` lists the top-level keys that changed, or is None when the
+    whole document may have changed (e.g. after a profile switch).
+    """
+
+    if callback not in _listeners:
+        _listeners.append(callback)
+
+
+def remove_document_listener(callback: DocumentListener) -> None:
+    if callback in _listeners:
+        _listeners.remove(callback)
+
+
+def _bump(document: str) -> int:
+    global _revision_counter
+    _revision_counter += 1
+    _revisions[document] = _revision_counter
+    return _revision_counter
+
+
+def _notify(document: str, keys: Optional[List[str]]) -> None:
+    for callback in list(_listeners):
+        try:
+            callback(document, keys)
+        except Exception:
+            pass
+
+
+def _check_profile() -> None:
+    global _profile_id
+    from .logic_profiles import get_active_profile_id
+
+    profile_id = get_active_profile_id()
+    if profile_id != _profile_id:
+        _profile_id = profile_id
+        _documents.clear()
+        _bases.clear()
+
+
+def get_document(document: str, default: Any) -> Any:
+    """Return the cached contents of a profile document, loading it once."""
+
+    _check_profile()
+    if document not in _documents:
+        count("store.miss")
+        _documents[document], _bases[document] = load_profile_document(
+            document, default, _profile_id
+        )
+        _bump(document)
+    else:
+        count("store.hit")
+    return _documents[document]
+
+
+def _merge_keys(keys: List[str]) -> MergeFunction:
+    def merge(theirs: Any, ours: Any) -> Any:
+        if not isinstance(theirs, dict) or not isinstance(ours, dict):
+            return ours
+        merged = dict(theirs)
+        for key in keys:
+            if key in ours:
+                merged[key] = ours[key]
+            else:
+                merged.pop(key, None)
+        return merged
+
+    return merge
+
+
+def put_document(document: str, data: Any, keys: Optional[Iterable[str]] = None) -> Optional[int]:
+    """Replace a document, write it to disk and notify listeners.
+
+    Without ``keys`` a conflicting save on disk is overwritten. Returns the
+    document's new revision, or None if the file could not be written; the
+    cached copy is then left as it was and listeners are not called.
+    """
+
+    _check_profile()
+    changed = list(keys) if keys is not None else None
+    merge = _merge_keys(changed) if changed is not None else None
+    written, disk_revision = save_profile_document(
+        document, data, _bases.get(document), merge, _profile_id
+    )
+    if disk_revision is None:
+        return None
+    _bases[document] = disk_revision
+    _documents[document] = written
+    revision = _bump(document)
+    # A merge brought in other keys too.
+    _notify(document, changed if written is data else None)
+    return revision
+
+
+def get_document_revision(document: str) -> int:
+    """Return a number that changes whenever ``document`` changes.
+
+    Returns 0 if the document has not been loaded (see get_document).
+    """
+
+    _check_profile()
+    if document not in _documents:
+        return 0
+    return _revisions.get(document, 0)
+
+
+def invalidate_documents() -> None:
+    """Drop all cached documents and tell listeners to reload everything.
+
+    Call after the active profile changes or files are replaced on disk.
+    """
+
+    global _profile_id
+    _profile_id = None
+    _documents.clear()
+    _bases.clear()
+    for document in list(_revisions):
+        _bump(document)
+        _notify(document, None)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 
 @dataclass
@@ -316,6 +316,11 @@ _THEMES: Dict[str, ThemeColors] = {
 }
 
 
+# Resolved palettes keyed by (theme_name, is_anki_dark). Palettes are shared,
+# so callers must treat the returned ThemeColors as read-only.
+_resolved: Dict[Tuple[str, bool], ThemeColors] = {}
+
+
 def get_theme_colors(theme_name: str, is_anki_dark: bool = False) -> ThemeColors:
     """Get theme colors for the specified theme.
     
@@ -324,9 +329,19 @@ def get_theme_colors(theme_name: str, is_anki_dark: bool = False) -> ThemeColors
         is_anki_dark: Whether Anki is currently in dark mode (only used for "anki_auto")
     
     Returns:
-        ThemeColors object with the color palette
+        ThemeColors object with the color palette. The same object is
+        returned for the same arguments.
     """
     
+    key = (theme_name, bool(is_anki_dark))
+    colors = _resolved.get(key)
+    if colors is None:
+        colors = _resolve_theme_colors(theme_name, is_anki_dark)
+        _resolved[key] = colors
+    return colors
+
+
+def _resolve_theme_colors(theme_name: str, is_anki_dark: bool) -> ThemeColors:
     if theme_name == "anki_auto":
         # Follow Anki's theme: use a dark variant for dark mode, light for light mode
         if is_anki_dark:
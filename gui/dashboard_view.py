@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta
-from typing import Optional, List, Dict, TYPE_CHECKING
+from html import escape as html_escape
+from typing import Dict, Optional, TYPE_CHECKING
 import webbrowser
 
 if TYPE_CHECKING:
     from ..core.themes import ThemeColors
 
+from aqt import mw
 from aqt.qt import (
     QWidget,
     QVBoxLayout,
@@ -22,23 +24,45 @@ from aqt.qt import (
     QProgressBar,
     QToolButton,
     QScrollArea,
+    QTimer,
 )
 
 from .radar_view import RadarView
-from ..core.logic_tracker import load_daily_activity, save_daily_activity
-from ..core.logic_dailyplan import load_daily_plan, save_daily_plan
+from ..core.logic_tracker import (
+    TRACKER_DOCUMENT,
+    is_skill_done,
+    load_daily_activity,
+    save_daily_activity,
+    toggle_skill,
+)
+from ..core.logic_dailyplan import DAILY_PLAN_DOCUMENT, load_daily_plan, save_daily_plan
 from ..core.logic_goals import (
     load_goals_for_month,
     save_goals_for_month,
     get_current_month_id,
     auto_archive_past_goals,
+    GOALS_DOCUMENT,
+)
+from ..core.logic_resources import RESOURCES_DOCUMENT, load_recent_resources
+from ..core.logic_aggregate import (
+    cache_profile_summaries,
+    combined_stats,
+    profile_streaks,
+    read_profile_summaries,
+    stale_profile_summaries,
 )
-from ..core.logic_resources import load_resources
-from ..core.models import DailyPlan, MonthlyGoals
-from .widgets import CircleIndicator, get_skill_emoji, get_skill_label
+from ..core.models import DailyPlan, MonthlyGoals, ResourceItem
+from ..core.skills import SKILLS
+from ..core.store import get_document_revision
+from ..core.perf import timed
+from .data_bus import affects, get_data_bus
+from .widgets import CircleIndicator, suspended_updates
 
 
 class DashboardView(QWidget):
+    # Number of most recent resources shown in the Resources preview.
+    _RESOURCES_PREVIEW_LIMIT = 5
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
 
@@ -48,6 +72,10 @@ class DashboardView(QWidget):
         # Theme colors (will be set by main window)
         self._theme_colors: Optional['ThemeColors'] = None
 
+        # Store revision each section was last rendered from (see
+        # _sync_sections).
+        self._section_revisions: Dict[str, int] = {}
+
         layout = QVBoxLayout(self)
         # Remove outer horizontal margins so the dashboard cards sit flush with
         # the dock content area (no grey gutters on the left/right).
@@ -60,8 +88,80 @@ class DashboardView(QWidget):
         layout.addWidget(self._create_tracker_section())
         layout.addWidget(self._create_goals_section())
         layout.addWidget(self._create_resources_section())
+        layout.addWidget(self._create_profiles_section())
         layout.addStretch(1)
 
+        # Keep the sections in sync with edits made in other tabs without
+        # re-reading anything on tab switches. Each section remembers the
+        # store revision it was rendered from; while the dashboard is hidden,
+        # changes only leave that stamp behind and showEvent refreshes just
+        # the sections whose document actually moved on.
+        for section in self._SECTION_DOCUMENTS:
+            self._stamp_section(section)
+        get_data_bus().documentChanged.connect(self._on_document_changed)
+
+    # section -> store document it is rendered from
+    _SECTION_DOCUMENTS = {
+        "goals": GOALS_DOCUMENT,
+        "week": TRACKER_DOCUMENT,
+        "plan": DAILY_PLAN_DOCUMENT,
+        "resources": RESOURCES_DOCUMENT,
+    }
+
+    def _stamp_section(self, section: str) -> None:
+        self._section_revisions[section] = get_document_revision(
+            self._SECTION_DOCUMENTS[section]
+        )
+
+    def _refresh_section(self, section: str) -> None:
+        if section == "goals":
+            self.refresh_goals_from_storage()
+        elif section == "week":
+            self.refresh_week_from_storage()
+        elif section == "plan":
+            self.refresh_daily_plan_from_storage()
+        elif section == "resources":
+            self.refresh_resources_from_storage()
+
+    def _section_affected(self, section: str, keys) -> bool:
+        if section == "goals":
+            return affects(keys, getattr(self, "_goals_month_id", ""))
+        if section == "week":
+            start = getattr(self, "_weekly_start_date", None)
+            return start is not None and affects(
+                keys,
+                *((start + timedelta(days=d)).strftime("%Y-%m-%d") for d in range(7)),
+            )
+        return True
+
+    def _on_document_changed(self, document: str, keys, origin) -> None:
+        if document in (TRACKER_DOCUMENT, GOALS_DOCUMENT) and self.isVisible():
+            self._schedule_profiles_refresh()
+        for section, section_document in self._SECTION_DOCUMENTS.items():
+            if section_document != document:
+                continue
+            if origin is self or not self._section_affected(section, keys):
+                # Our own save, or keys this section does not show: what is
+                # on screen still matches the new revision.
+                if self._section_revisions.get(section) is not None:
+                    self._stamp_section(section)
+            elif self.isVisible():
+                self._refresh_section(section)
+
+    def _sync_sections(self) -> None:
+        """Refresh only sections whose document revision changed."""
+
+        if getattr(self, "_goals_month_id", None) != get_current_month_id():
+            self._section_revisions.pop("goals", None)
+        for section, document in self._SECTION_DOCUMENTS.items():
+            if self._section_revisions.get(section) != get_document_revision(document):
+                self._refresh_section(section)
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        self._sync_sections()
+        self._schedule_profiles_refresh()
+
     # helpers to reach main window and tabs
     def _main_window(self):
         w = self.parent()
@@ -116,6 +216,7 @@ class DashboardView(QWidget):
             color = "#d0d7de"
         underline.setStyleSheet(f"color: {color}; background-color: {color};")
 
+    @timed()
     def apply_theme(self, colors: 'ThemeColors') -> None:
         """Apply theme colors to dashboard components."""
         self._theme_colors = colors
@@ -134,20 +235,7 @@ class DashboardView(QWidget):
         # Update all buttons
         for button in self.findChildren(QPushButton):
             if button.objectName() == "dashboard_resource_open_btn":
-                # Compact style for Resources preview Open buttons, same hover as other buttons
-                button.setStyleSheet(
-                    f"QPushButton {{"
-                    f"  border: 1px solid {colors.button_border};"
-                    f"  border-radius: 4px;"
-                    f"  padding: 2px 10px;"
-                    f"  background-color: {colors.button_bg};"
-                    f"  color: {colors.button_text};"
-                    f"}}"
-                    f"QPushButton:hover {{"
-                    f"  background-color: {colors.button_hover_bg};"
-                    f"  border-color: {colors.button_hover_border};"
-                    f"}}"
-                )
+                self._style_resource_open_button(button, colors)
             else:
                 # Regular dashboard buttons
                 button.setStyleSheet(
@@ -231,6 +319,22 @@ class DashboardView(QWidget):
             if hasattr(circle, 'set_theme_colors'):
                 circle.set_theme_colors(colors)
 
+    def _style_resource_open_button(self, button: QPushButton, colors: 'ThemeColors') -> None:
+        # Compact style for Resources preview Open buttons, same hover as other buttons
+        button.setStyleSheet(
+            f"QPushButton {{"
+            f"  border: 1px solid {colors.button_border};"
+            f"  border-radius: 4px;"
+            f"  padding: 2px 10px;"
+            f"  background-color: {colors.button_bg};"
+            f"  color: {colors.button_text};"
+            f"}}"
+            f"QPushButton:hover {{"
+            f"  background-color: {colors.button_hover_bg};"
+            f"  border-color: {colors.button_hover_border};"
+            f"}}"
+        )
+
     def refresh_week_from_storage(self) -> None:
         """Reload weekly activity from storage into the dashboard preview.
 
@@ -244,12 +348,9 @@ class DashboardView(QWidget):
             return
 
         activity = load_daily_activity()
+        self._stamp_section("week")
         start = self._weekly_start_date
-        skills = getattr(
-            self,
-            "_weekly_skills",
-            ["reading", "listening", "speaking", "writing"],
-        )
+        skills = getattr(self, "_weekly_skills", SKILLS)
 
         # Update circles from the latest activity data.
         active_days = 0
@@ -262,8 +363,7 @@ class DashboardView(QWidget):
             for col, indicator in enumerate(row_indicators):
                 day = start + timedelta(days=col)
                 day_str = day.strftime("%Y-%m-%d")
-                day_data = activity.get(day_str, {})
-                done = bool(day_data.get(skill, False))
+                done = is_skill_done(activity, day_str, skill.index)
                 indicator.set_completed(done)
                 if done:
                     any_active_row = True
@@ -275,15 +375,105 @@ class DashboardView(QWidget):
             self._weekly_consistency_label.setText(
                 f"This Week: {percent}% consistency — {active_days} active days"
             )
-        
-        # Also refresh daily plan tasks from storage
-        if hasattr(self, "_daily_plan_edits"):
-            plan = load_daily_plan()
-            for idx, edit in enumerate(self._daily_plan_edits):
-                if idx < len(plan.tasks):
-                    edit.setText(plan.tasks[idx] or "")
-                else:
-                    edit.setText("")
+
+    def refresh_daily_plan_from_storage(self) -> None:
+        """Reload the inline Daily Plan tasks from storage."""
+
+        if not hasattr(self, "_daily_plan_edits"):
+            return
+        plan = load_daily_plan()
+        self._stamp_section("plan")
+        for idx, edit in enumerate(self._daily_plan_edits):
+            text = (plan.tasks[idx] or "") if idx < len(plan.tasks) else ""
+            # Leave untouched edits alone so the cursor does not jump.
+            if edit.text() != text:
+                edit.setText(text)
+
+    # ALL PROFILES (only shown with two or more profiles)
+    # Number of profiles listed by name; the rest are only counted.
+    _PROFILES_LISTED = 5
+
+    def _create_profiles_section(self) -> QFrame:
+        frame = self._create_section_frame("All Profiles")
+        layout = frame.layout()  # type: ignore[assignment]
+
+        self._profiles_summary_label = QLabel("", frame)
+        self._profiles_summary_label.setWordWrap(True)
+        self._profiles_summary_label.setTextFormat(Qt.TextFormat.RichText)
+        layout.addWidget(self._profiles_summary_label)
+
+        self._profiles_frame = frame
+        self._profiles_refresh_pending = False
+        self._profiles_loading = False
+        frame.setVisible(False)
+        return frame
+
+    def _schedule_profiles_refresh(self) -> None:
+        # Bursts of saves (e.g. several circle clicks) refresh once.
+        if not self._profiles_refresh_pending:
+            self._profiles_refresh_pending = True
+            QTimer.singleShot(0, self.refresh_profiles_summary)
+
+    @timed()
+    def refresh_profiles_summary(self) -> None:
+        """Show practice and goal totals across every profile."""
+
+        self._profiles_refresh_pending = False
+        if self._profiles_loading:
+            # The running read ends with another refresh.
+            return
+        stale = stale_profile_summaries()
+        if stale:
+            # Profiles not read yet, or changed on disk: parse them off the
+            # main thread and refresh when done. Only stat() calls run here.
+            self._profiles_loading = True
+            mw.taskman.run_in_background(
+                lambda: read_profile_summaries(stale), self._on_profiles_read
+            )
+            return
+        stats = combined_stats()
+        if len(stats.profiles) < 2:
+            self._profiles_frame.setVisible(False)
+            return
+
+        rate = int(round(100 * stats.completion_rate))
+        skills = " · ".join(
+            f"{skill.emoji} {stats.skill_days[skill.index]:,}" for skill in SKILLS
+        )
+        lines = [
+            f"<b>{len(stats.profiles)} profiles</b> · {stats.active_days:,} active days · "
+            f"🔥 {stats.current_streak}-day streak (longest {stats.longest_streak})",
+            f"Skill days: {skills}",
+            f"Goals: {stats.goals_done:,} / {stats.goals_set:,} done ({rate}%)",
+        ]
+        # Most recently practised profiles first.
+        ranked = sorted(
+            stats.profiles,
+            key=lambda entry: entry[2].days[-1] if entry[2].days else 0,
+            reverse=True,
+        )
+        for _profile_id, name, summary in ranked[: self._PROFILES_LISTED]:
+            current, _longest = profile_streaks(summary)
+            lines.append(
+                f"&nbsp;&nbsp;{html_escape(name)}: {len(summary.days):,} days, "
+                f"streak {current}, goals {summary.goals_done}/{summary.goals_set}"
+            )
+        if len(ranked) > self._PROFILES_LISTED:
+            lines.append(f"&nbsp;&nbsp;… and {len(ranked) - self._PROFILES_LISTED} more")
+
+        text = "<br>".join(lines)
+        if self._profiles_summary_label.text() != text:
+            self._profiles_summary_label.setText(text)
+        self._profiles_frame.setVisible(True)
+
+    def _on_profiles_read(self, future) -> None:
+        self._profiles_loading = False
+        try:
+            cache_profile_summaries(future.result())
+        except Exception:
+            return
+        if self.isVisible():
+            self._schedule_profiles_refresh()
 
     # RADAR PREVIEW (Fluency Snapshot)
     def _create_radar_section(self) -> QFrame:
@@ -305,7 +495,7 @@ class DashboardView(QWidget):
         frame = self._create_section_frame("This Week's Activity")
         layout = frame.layout()  # type: ignore[assignment]
 
-        skills = ["reading", "listening", "speaking", "writing"]
+        skills = SKILLS
         # Load current activity once to set the initial state of the circles.
         # Subsequent updates always reload from storage on demand.
         activity = load_daily_activity()
@@ -320,7 +510,7 @@ class DashboardView(QWidget):
         self._weekly_start_date = start
         self._weekly_skills = skills
 
-        # Grid: row 0 = headers, rows 1-4 = skills
+        # Grid: row 0 = headers, then one row per skill
         grid_container = QWidget(self)
         grid = QGridLayout(grid_container)
         grid.setContentsMargins(0, 0, 0, 0)
@@ -384,8 +574,7 @@ class DashboardView(QWidget):
             for offset in range(7):
                 day = start + timedelta(days=offset)
                 day_str = day.strftime("%Y-%m-%d")
-                day_data = activity_current.get(day_str, {})
-                if any(bool(day_data.get(sk, False)) for sk in skills):
+                if activity_current.get(day_str, 0):
                     active += 1
             percent = int(100 * active / total_days) if total_days else 0
             consistency_label.setText(
@@ -393,12 +582,11 @@ class DashboardView(QWidget):
             )
 
         for row, skill in enumerate(skills, start=1):
-            emoji = get_skill_emoji(skill)
-            skill_label = QLabel(emoji)
+            skill_label = QLabel(skill.emoji)
             skill_label.setAlignment(
                 Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
             )
-            skill_label.setToolTip(get_skill_label(skill))
+            skill_label.setToolTip(skill.label)
             skill_label.setMinimumWidth(40)
             grid.addWidget(skill_label, row, 0)
 
@@ -407,8 +595,7 @@ class DashboardView(QWidget):
             for col in range(7):
                 day = start + timedelta(days=col)
                 day_str = day.strftime("%Y-%m-%d")
-                day_data = activity.get(day_str, {})
-                done = bool(day_data.get(skill, False))
+                done = is_skill_done(activity, day_str, skill.index)
                 indicator = CircleIndicator(done, size=16, parent=grid_container)
 
                 def make_handler(d, s, w):
@@ -418,15 +605,12 @@ class DashboardView(QWidget):
                         # overwriting changes made elsewhere (e.g. Monthly
                         # Tracker) with a stale in-memory copy.
                         activity_current = load_daily_activity()
-                        day_data_inner = activity_current.setdefault(
-                            day_s, {sk: False for sk in skills}
-                        )
-                        new_val = not bool(day_data_inner.get(s, False))
-                        day_data_inner[s] = new_val
-                        save_daily_activity(activity_current)
+                        new_val = toggle_skill(activity_current, day_s, s.index)
+                        with get_data_bus().publishing(self):
+                            save_daily_activity(activity_current)
                         w.set_completed(new_val)
                         status_label.setText(
-                            f"Updated: {get_skill_label(s)} on {d.strftime('%a %d %b')}"
+                            f"Updated: {s.label} on {d.strftime('%a %d %b')}"
                         )
                         update_consistency_label()
 
@@ -508,7 +692,8 @@ class DashboardView(QWidget):
             tasks = tasks[:4]
 
         updated = DailyPlan(tasks=tasks, show_on_startup=plan.show_on_startup)
-        save_daily_plan(updated)
+        with get_data_bus().publishing(self):
+            save_daily_plan(updated)
 
     # GOALS PREVIEW
     def _create_goals_section(self) -> QFrame:
@@ -640,6 +825,10 @@ class DashboardView(QWidget):
         self._resources_rows_layout = QVBoxLayout(resources_container)
         self._resources_rows_layout.setContentsMargins(0, 0, 0, 0)
         self._resources_rows_layout.setSpacing(4)
+        # Reusable preview rows and the (index, item) pairs they display.
+        self._resources_preview_rows: list[tuple[QWidget, QLabel, QLabel]] = []
+        self._resources_preview_items: list[tuple[int, ResourceItem]] = []
+        self._resources_empty_label: Optional[QLabel] = None
 
         scroll = QScrollArea(self)
         scroll.setWidgetResizable(True)
@@ -675,66 +864,74 @@ class DashboardView(QWidget):
         return frame
 
     def _populate_resources_preview(self) -> None:
-        """Populate the dashboard's mini resources list from storage."""
+        """Show the most recent resources in the dashboard's mini list.
+
+        Only the newest ``_RESOURCES_PREVIEW_LIMIT`` resources are queried and
+        the row widgets are created once and reused, so refreshing the
+        preview does not depend on the size of the resources library.
+        """
 
         rows_layout = getattr(self, "_resources_rows_layout", None)
         if rows_layout is None:
             return
 
-        # Clear existing row layouts/widgets.
-        while rows_layout.count():
-            item = rows_layout.takeAt(0)
-            inner = item.layout()
-            w = item.widget()
-            if inner is not None:
-                while inner.count():
-                    child_item = inner.takeAt(0)
-                    child_widget = child_item.widget()
-                    if child_widget is not None:
-                        child_widget.deleteLater()
-            if w is not None:
-                w.deleteLater()
-
-        raw = load_resources()
-        items: List[Dict] = raw
-
-        if not items:
-            rows_layout.addWidget(QLabel("No resources added yet"))
-            return
-
-        main_window = self._main_window()
-        main_font = main_window.font() if main_window is not None else None
-
-        for idx, obj in enumerate(items):
-            row = QHBoxLayout()
-            type_label = QLabel(str(obj.get("type", "")))
-            name_label = QLabel(str(obj.get("name", "")))
-            name_label.setWordWrap(True)
-
-            if main_font is not None:
-                type_label.setFont(main_font)
-                name_label.setFont(main_font)
-
-            row.addWidget(type_label)
-            row.addWidget(name_label, 1)
-
-            btn = QPushButton("Open", self)
-            # Tag for themed styling in apply_theme
-            btn.setObjectName("dashboard_resource_open_btn")
-            if main_font is not None:
-                btn.setFont(main_font)
-            btn.clicked.connect(lambda _=False, i=idx: self._go_resource(i))
-            row.addWidget(btn)
-
-            rows_layout.addLayout(row)
+        recent = load_recent_resources(self._RESOURCES_PREVIEW_LIMIT)
+        self._resources_preview_items = recent
+
+        if self._resources_empty_label is None:
+            self._resources_empty_label = QLabel("No resources added yet")
+            rows_layout.addWidget(self._resources_empty_label)
+        self._resources_empty_label.setVisible(not recent)
+
+        with suspended_updates(rows_layout.parentWidget()):
+            # Grow the row pool on demand; rows are never destroyed.
+            while len(self._resources_preview_rows) < len(recent):
+                rows_layout.addWidget(self._create_resource_preview_row())
+
+            for slot, (row, type_label, name_label) in enumerate(self._resources_preview_rows):
+                if slot >= len(recent):
+                    row.setVisible(False)
+                    continue
+                _index, item = recent[slot]
+                type_label.setText(item.type)
+                name_label.setText(item.name)
+                row.setVisible(True)
+
+    def _create_resource_preview_row(self) -> QWidget:
+        """Create one reusable preview row (type, name, Open button)."""
+
+        slot = len(self._resources_preview_rows)
+        row = QWidget(self)
+        row_layout = QHBoxLayout(row)
+        row_layout.setContentsMargins(0, 0, 0, 0)
+        type_label = QLabel("", row)
+        name_label = QLabel("", row)
+        name_label.setWordWrap(True)
+
+        row_layout.addWidget(type_label)
+        row_layout.addWidget(name_label, 1)
+
+        btn = QPushButton("Open", row)
+        # Tag for themed styling in apply_theme
+        btn.setObjectName("dashboard_resource_open_btn")
+        if self._theme_colors is not None:
+            self._style_resource_open_button(btn, self._theme_colors)
+        btn.clicked.connect(lambda _=False, s=slot: self._on_resource_preview_open(s))
+        row_layout.addWidget(btn)
+
+        self._resources_preview_rows.append((row, type_label, name_label))
+        return row
+
+    def _on_resource_preview_open(self, slot: int) -> None:
+        if 0 <= slot < len(self._resources_preview_items):
+            index, item = self._resources_preview_items[slot]
+            self._go_resource(index, item.link)
 
     def refresh_resources_from_storage(self) -> None:
-        """Public hook: refresh the dashboard Resources preview from disk."""
+        """Public hook: refresh the dashboard Resources preview from storage."""
 
         self._populate_resources_preview()
-        # Reapply theme to newly created Open buttons
-        if hasattr(self, '_current_theme_colors'):
-            self.apply_theme(self._current_theme_colors)
+        self._stamp_section("resources")
 
     # navigation helpers
     def _go_tracker(self) -> None:
@@ -757,18 +954,16 @@ class DashboardView(QWidget):
         if mw is not None and hasattr(mw, "show_resources_tab"):
             mw.show_resources_tab()
 
-    def _go_resource(self, index: int) -> None:
+    def _go_resource(self, index: int, link: str = "") -> None:
         """Open the Resources tab, select the resource, and open its link."""
 
         # Try to open the link in the system browser first.
         try:
-            raw = load_resources()
-            if 0 <= index < len(raw):
-                link = str(raw[index].get("link", "") or "").strip()
-                if link:
-                    webbrowser.open(link)
+            link = (link or "").strip()
+            if link:
+                webbrowser.open(link)
         except Exception:
-            # Fail silently if anything goes wrong with loading or opening.
+            # Fail silently if anything goes wrong with opening.
             pass
 
         # Also navigate to the Resources tab and select the item, as before.
@@ -834,7 +1029,8 @@ class DashboardView(QWidget):
         self._dashboard_goals.goals = texts[:3]
         self._dashboard_goals.completed = checks[:3]
 
-        save_goals_for_month(self._dashboard_goals, source="dashboard_view")
+        with get_data_bus().publishing(self):
+            save_goals_for_month(self._dashboard_goals, source="dashboard_view")
         self._refresh_dashboard_goals_progress()
         self._refresh_dashboard_goal_colors()
 
@@ -857,6 +1053,7 @@ class DashboardView(QWidget):
 
         self._goals_month_id = get_current_month_id()
         self._dashboard_goals = load_goals_for_month(self._goals_month_id)
+        self._stamp_section("goals")
 
         # Block signals while loading to prevent partial updates from triggering saves
         for idx in range(3):
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from aqt.qt import QObject, pyqtSignal
+
+from ..core.store import add_document_listener
+
+
+class DataBus(QObject):
+    """Qt-side relay for core.store change notifications.
+
+    ``documentChanged(document, keys, origin)`` is emitted after a profile
+    document is saved. ``keys`` is the list of changed top-level keys (month
+    ids, dates, ...) or None for "everything"; ``origin`` is the view that
+    made the change (see :meth:`publishing`), so it can skip its own echo.
+    """
+
+    documentChanged = pyqtSignal(str, object, object)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._origin: Optional[object] = None
+        add_document_listener(self._on_document_changed)
+
+    @contextmanager
+    def publishing(self, origin: object) -> Iterator[None]:
+        """Tag saves made inside the block as coming from ``origin``."""
+
+        previous = self._origin
+        self._origin = origin
+        try:
+            yield
+        finally:
+            self._origin = previous
+
+    def _on_document_changed(self, document: str, keys: Optional[List[str]]) -> None:
+        self.documentChanged.emit(document, keys, self._origin)
+
+
+_bus: Optional[DataBus] = None
+
+
+def get_data_bus() -> DataBus:
+    global _bus
+    if _bus is None:
+        _bus = DataBus()
+    return _bus
+
+
+def affects(keys: Optional[List[str]], *wanted: str) -> bool:
+    """True if a change to ``keys`` touches any of ``wanted``."""
+
+    if keys is None:
+        return True
+    return any(key in keys for key in wanted)
@@ -29,9 +29,12 @@ from ..core.logic_goals import (
     get_all_goals,
     get_current_month_id,
     auto_archive_past_goals,
+    GOALS_DOCUMENT,
 )
-from .widgets import CircleIndicator
+from .data_bus import affects, get_data_bus
+from .widgets import CircleIndicator, suspended_updates
 from ..core.models import MonthlyGoals
+from ..core.perf import timed
 
 
 class GoalsView(QWidget):
@@ -234,6 +237,11 @@ class GoalsView(QWidget):
         self.month_combo.currentTextChanged.connect(self._on_month_changed)
         self.show_archived_checkbox.toggled.connect(self._on_show_archived_toggled)
 
+        # Goals edited elsewhere (e.g. the dashboard) arrive via the data bus;
+        # while hidden we only note that the current month is stale.
+        self._stale = False
+        get_data_bus().documentChanged.connect(self._on_document_changed)
+
         self._load_month()
 
     def _current_month_str(self) -> str:
@@ -284,107 +292,103 @@ class GoalsView(QWidget):
         # Entries for archived months are of the form "YYYY-MM (archived)".
         return text.split()[0]
 
+    @timed()
     def _load_month(self) -> None:
         month = self._combo_month_value()
         goals: MonthlyGoals = load_month_goals(month)
         self._current_goals = goals
 
         # Block signals while loading data to prevent premature auto-save
-        # that would read partially updated widgets and overwrite fresh data
-        for i in range(3):
-            self.goal_edits[i].blockSignals(True)
-            self.goal_checks[i].blockSignals(True)
-            self.category_combos[i].blockSignals(True)
-            self.reflection_edits[i].blockSignals(True)
-
-        for i in range(3):
-            text = goals.goals[i] if i < len(goals.goals) else ""
-            done = goals.completed[i] if i < len(goals.completed) else False
-            category = goals.categories[i] if i < len(goals.categories) else "General"
-            reflection = goals.reflections[i] if i < len(goals.reflections) else ""
-
-            self.goal_edits[i].setText(text)
-            self.goal_checks[i].setChecked(done)
-            if i < len(self.goal_state_indicators):
-                self.goal_state_indicators[i].set_completed(done)
-
-            idx = self.category_combos[i].findText(category)
-            self.category_combos[i].setCurrentIndex(idx if idx >= 0 else 0)
-            self.reflection_edits[i].setPlainText(reflection)
-
-            # Clear and repopulate subtasks (both layouts and child widgets)
-            layout = self.subtasks_layouts[i]
-            while layout.count():
-                item = layout.takeAt(0)
-                w = item.widget()
-                inner = item.layout()
-                if inner is not None:
-                    while inner.count():
-                        inner_item = inner.takeAt(0)
-                        iw = inner_item.widget()
-                        if iw is not None:
-                            iw.deleteLater()
-                if w is not None:
-                    w.deleteLater()
-
-            subtasks = goals.subtasks[i] if i < len(goals.subtasks) else []
-            subtasks_done = goals.subtasks_done[i] if i < len(goals.subtasks_done) else []
-            for s_idx, s_text in enumerate(subtasks):
-                row = QHBoxLayout()
-
-                # CircleIndicator as the visible completion control for the
-                # subtask, backed by a hidden checkbox for logic.
-                initial_done = (
-                    subtasks_done[s_idx] if s_idx < len(subtasks_done) else False
-                )
-                circle = CircleIndicator(
-                    initial_done, size=14, parent=self.subtasks_containers[i], theme_colors=self._theme_colors
-                )
-                chk = QCheckBox(self.subtasks_containers[i])
-                chk.setTristate(False)
-                # Block signals before setting values to prevent premature auto-save
-                chk.blockSignals(True)
-                chk.setChecked(initial_done)
-                chk.setStyleSheet(
-                    "QCheckBox::indicator { width: 0px; height: 0px; "
-                    "border: none; background-color: transparent; }"
-                )
+        # that would read partially updated widgets and overwrite fresh data,
+        # and lay out and paint the rebuilt subtask rows once at the end.
+        quiet = (
+            *self.goal_edits,
+            *self.goal_checks,
+            *self.category_combos,
+            *self.reflection_edits,
+        )
+        with suspended_updates(self, *quiet):
+            for i in range(3):
+                text = goals.goals[i] if i < len(goals.goals) else ""
+                done = goals.completed[i] if i < len(goals.completed) else False
+                category = goals.categories[i] if i < len(goals.categories) else "General"
+                reflection = goals.reflections[i] if i < len(goals.reflections) else ""
+
+                self.goal_edits[i].setText(text)
+                self.goal_checks[i].setChecked(done)
+                if i < len(self.goal_state_indicators):
+                    self.goal_state_indicators[i].set_completed(done)
+
+                idx = self.category_combos[i].findText(category)
+                self.category_combos[i].setCurrentIndex(idx if idx >= 0 else 0)
+                self.reflection_edits[i].setPlainText(reflection)
+
+                # Clear and repopulate subtasks (both layouts and child widgets)
+                layout = self.subtasks_layouts[i]
+                while layout.count():
+                    item = layout.takeAt(0)
+                    w = item.widget()
+                    inner = item.layout()
+                    if inner is not None:
+                        while inner.count():
+                            inner_item = inner.takeAt(0)
+                            iw = inner_item.widget()
+                            if iw is not None:
+                                iw.deleteLater()
+                    if w is not None:
+                        w.deleteLater()
+
+                subtasks = goals.subtasks[i] if i < len(goals.subtasks) else []
+                subtasks_done = goals.subtasks_done[i] if i < len(goals.subtasks_done) else []
+                for s_idx, s_text in enumerate(subtasks):
+                    row = QHBoxLayout()
+
+                    # CircleIndicator as the visible completion control for the
+                    # subtask, backed by a hidden checkbox for logic.
+                    initial_done = (
+                        subtasks_done[s_idx] if s_idx < len(subtasks_done) else False
+                    )
+                    circle = CircleIndicator(
+                        initial_done, size=14, parent=self.subtasks_containers[i], theme_colors=self._theme_colors
+                    )
+                    chk = QCheckBox(self.subtasks_containers[i])
+                    chk.setTristate(False)
+                    # Block signals before setting values to prevent premature auto-save
+                    chk.blockSignals(True)
+                    chk.setChecked(initial_done)
+                    chk.setStyleSheet(
+                        "QCheckBox::indicator { width: 0px; height: 0px; "
+                        "border: none; background-color: transparent; }"
+                    )
 
-                edit = QLineEdit(self.subtasks_containers[i])
-                # Block signals before setting text to prevent premature auto-save
-                edit.blockSignals(True)
-                edit.setText(str(s_text))
-
-                delete_btn = QPushButton("🗑", self.subtasks_containers[i])
-                delete_btn.setFixedSize(26, 26)
-                delete_btn.setToolTip("Delete subtask")
-                delete_btn.setObjectName("subtask_delete_btn")
-
-                row.addWidget(circle)
-                row.addWidget(chk)
-                row.addWidget(edit, 1)
-                row.addWidget(delete_btn)
-                layout.addLayout(row)
-
-                chk.toggled.connect(lambda checked, circ=circle: circ.set_completed(checked))
-
-                chk.toggled.connect(self._auto_save)
-                edit.textChanged.connect(self._auto_save)
-                circle.clicked.connect(lambda _=False, c=chk: c.toggle())
-                delete_btn.clicked.connect(
-                    lambda _=False, gi=i, rl=row: self._remove_subtask_row(gi, rl)
-                )
+                    edit = QLineEdit(self.subtasks_containers[i])
+                    # Block signals before setting text to prevent premature auto-save
+                    edit.blockSignals(True)
+                    edit.setText(str(s_text))
+
+                    delete_btn = QPushButton("🗑", self.subtasks_containers[i])
+                    delete_btn.setFixedSize(26, 26)
+                    delete_btn.setToolTip("Delete subtask")
+                    delete_btn.setObjectName("subtask_delete_btn")
+
+                    row.addWidget(circle)
+                    row.addWidget(chk)
+                    row.addWidget(edit, 1)
+                    row.addWidget(delete_btn)
+                    layout.addLayout(row)
+
+                    chk.toggled.connect(lambda checked, circ=circle: circ.set_completed(checked))
+
+                    chk.toggled.connect(self._auto_save)
+                    edit.textChanged.connect(self._auto_save)
+                    circle.clicked.connect(lambda _=False, c=chk: c.toggle())
+                    delete_btn.clicked.connect(
+                        lambda _=False, gi=i, rl=row: self._remove_subtask_row(gi, rl)
+                    )
                 
-                # Unblock signals after connections are made
-                chk.blockSignals(False)
-                edit.blockSignals(False)
-
-        # Unblock signals after all widgets are updated
-        for i in range(3):
-            self.goal_edits[i].blockSignals(False)
-            self.goal_checks[i].blockSignals(False)
-            self.category_combos[i].blockSignals(False)
-            self.reflection_edits[i].blockSignals(False)
+                    # Unblock signals after connections are made
+                    chk.blockSignals(False)
+                    edit.blockSignals(False)
 
         self._update_banner_and_readonly()
         self._update_progress_label()
@@ -520,7 +524,8 @@ class GoalsView(QWidget):
         goals.subtasks = new_subtasks
         goals.subtasks_done = new_subtasks_done
 
-        save_month_goals(goals, source="goals_view")
+        with get_data_bus().publishing(self):
+            save_month_goals(goals, source="goals_view")
         self._update_progress_label()
         self._update_banner_and_readonly()
         self._update_card_styles()
@@ -540,8 +545,24 @@ class GoalsView(QWidget):
     def refresh_current_month(self) -> None:
         """Reload the currently selected month from storage."""
 
+        self._stale = False
         self._load_month()
 
+    def _on_document_changed(self, document: str, keys, origin) -> None:
+        if document != GOALS_DOCUMENT or origin is self:
+            return
+        if not affects(keys, self._combo_month_value()):
+            return
+        if self.isVisible():
+            self.refresh_current_month()
+        else:
+            self._stale = True
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        if self._stale:
+            self.refresh_current_month()
+
     # helpers ---------------------------------------------------------
 
     def focus_goal_index(self, index: int) -> None:
@@ -757,10 +778,12 @@ class GoalsView(QWidget):
             if w is not None:
                 w.deleteLater()
 
-        save_month_goals(goals, source="goals_view_clear")
+        with get_data_bus().publishing(self):
+            save_month_goals(goals, source="goals_view_clear")
         self._update_progress_label()
         self._update_card_styles()
 
+    @timed()
     def apply_theme(self, colors: 'ThemeColors') -> None:
         """Apply theme colors to goals view components."""
         self._theme_colors = colors
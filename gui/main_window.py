@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from aqt import mw
 from aqt.qt import (
@@ -26,12 +26,20 @@ from .resources_view import ResourcesView
 from .settings_view import SettingsView
 from ..core.logic_settings import load_settings, Settings
 from ..core.themes import get_theme_colors, ThemeColors
+from ..core.store import invalidate_documents
+from ..core.logic_summary import (
+    install_summary_listener,
+    peek_profile_stats,
+    rebuild_profile_stats,
+)
+from .widgets import suspended_updates
 from ..core.logic_profiles import (
     list_profiles,
     get_active_profile_id,
     set_active_profile,
     get_profile_display_name,
 )
+from ..core.perf import timed
 
 
 class LanguageForgeWindow(QWidget):
@@ -55,12 +63,23 @@ class LanguageForgeWindow(QWidget):
 
         # Settings/state
         self._settings: Settings = load_settings()
+        # Keep each profile's summary sidecar current for the profile lists.
+        install_summary_listener()
+        # Profile ids whose summary is being rebuilt in the background, and
+        # stale ids asked for while this window is being built (the rebuilds
+        # start once every widget they update exists).
+        self._stats_rebuilding: set = set()
+        self._stats_queued: Optional[List[str]] = []
         # Remember the initial base font size so Small/Medium/Large can be
         # applied symmetrically regardless of how many times the user toggles.
         initial_font = self.font()
         self._base_font_size = initial_font.pointSize() or 10
+        self._applied_font_size: Optional[int] = None
         
         # Theme colors
+        self._anki_dark_mode: Optional[bool] = None
+        # (main, tabs) stylesheets last set by _apply_tab_styles.
+        self._applied_tab_styles: Optional[tuple] = None
         self._current_theme_colors: ThemeColors = self._get_current_theme_colors()
 
         # Start directly with the tab bar inside a scroll area so tall
@@ -147,6 +166,9 @@ class LanguageForgeWindow(QWidget):
 
         # Always start on Dashboard tab (index 0)
         self.tabs.setCurrentIndex(0)
+
+        queued, self._stats_queued = self._stats_queued, None
+        self.rebuild_profile_stats(queued)
     
     def _populate_profile_combo(self) -> None:
         """Populate the profile combo box with all available profiles."""
@@ -156,9 +178,20 @@ class LanguageForgeWindow(QWidget):
         profiles = list_profiles()
         active_id = get_active_profile_id()
         
+        stale = []
         for profile in profiles:
             display_name = profile.get("display_name", profile["id"])
             self.profile_combo.addItem(display_name, profile["id"])
+            stats, is_stale = peek_profile_stats(profile["id"])
+            if stats is not None:
+                self.profile_combo.setItemData(
+                    self.profile_combo.count() - 1,
+                    stats.describe(),
+                    Qt.ItemDataRole.ToolTipRole,
+                )
+            if is_stale:
+                stale.append(profile["id"])
+        self.rebuild_profile_stats(stale)
         
         # Set current profile
         for i in range(self.profile_combo.count()):
@@ -168,6 +201,41 @@ class LanguageForgeWindow(QWidget):
         
         self.profile_combo.blockSignals(False)
     
+    def rebuild_profile_stats(self, profile_ids) -> None:
+        """Rebuild stale profile summaries off the main thread.
+
+        The profile list and the dropdown show the new numbers when done;
+        they are not re-read, so a rebuild that cannot write its file does
+        not loop.
+        """
+        if self._stats_queued is not None:
+            self._stats_queued.extend(
+                pid for pid in profile_ids if pid not in self._stats_queued
+            )
+            return
+        pending = [pid for pid in profile_ids if pid not in self._stats_rebuilding]
+        if not pending:
+            return
+        self._stats_rebuilding.update(pending)
+
+        def done(future) -> None:
+            self._stats_rebuilding.difference_update(pending)
+            try:
+                stats = future.result()
+            except Exception:
+                return
+            for i in range(self.profile_combo.count()):
+                profile_stats = stats.get(self.profile_combo.itemData(i))
+                if profile_stats is not None:
+                    self.profile_combo.setItemData(
+                        i, profile_stats.describe(), Qt.ItemDataRole.ToolTipRole
+                    )
+            self.settings_view.show_profile_stats(stats)
+
+        mw.taskman.run_in_background(
+            lambda: {pid: rebuild_profile_stats(pid) for pid in pending}, done
+        )
+
     def _on_profile_changed(self, display_name: str) -> None:
         """Handle profile switch from combo box."""
         # Get profile ID from combo box
@@ -193,34 +261,13 @@ class LanguageForgeWindow(QWidget):
         # Reload all views with data from the new profile
         self._reload_all_views_for_profile()
     
+    @timed("profile_switch")
     def _reload_all_views_for_profile(self) -> None:
         """Reload all views with data from the currently active profile."""
-        # Dashboard
-        if hasattr(self.dashboard_view, "refresh_goals_from_storage"):
-            self.dashboard_view.refresh_goals_from_storage()
-        if hasattr(self.dashboard_view, "refresh_resources_from_storage"):
-            self.dashboard_view.refresh_resources_from_storage()
-        if hasattr(self.dashboard_view, "refresh_week_from_storage"):
-            self.dashboard_view.refresh_week_from_storage()
-        
-        # Goals
-        if hasattr(self.goals_view, "refresh_current_month"):
-            self.goals_view.refresh_current_month()
-        
-        # Tracker
-        if hasattr(self.tracker_view, "refresh_from_storage"):
-            self.tracker_view.refresh_from_storage()
-        
-        # Resources
-        if hasattr(self.resources_view, "_load_items"):
-            self.resources_view._load_items()
-            if hasattr(self.resources_view, "_apply_filter_and_refresh"):
-                self.resources_view._apply_filter_and_refresh()
-        
-        # Radar (embedded in dashboard)
-        if hasattr(self.radar_view, "_load_current_month_values"):
-            self.radar_view._load_current_month_values()
-        
+        # Dropping the cached documents notifies every subscribed view
+        # (dashboard, goals, tracker, resources, radar) through the data bus.
+        invalidate_documents()
+
         # Settings - refresh profile list to show new active profile
         if hasattr(self.settings_view, "_load_profile_list"):
             self.settings_view._load_profile_list()
@@ -234,21 +281,13 @@ class LanguageForgeWindow(QWidget):
         self.status_label.setText(f"{text} – {now}")
 
     def _on_tab_changed(self, index: int) -> None:
-        # When switching tabs, refresh any views that cache data from disk and
-        # re-apply tab styles in case the Anki theme changed.
+        # Re-apply tab styles in case the Anki theme changed. Profile data
+        # does not need reloading here: views are kept in sync through the
+        # data bus (see gui/data_bus.py).
         self._apply_tab_styles()
         widget = self.tabs.widget(index)
-        if widget is self.dashboard_view:
-            if hasattr(self.dashboard_view, "refresh_goals_from_storage"):
-                self.dashboard_view.refresh_goals_from_storage()
-            if hasattr(self.dashboard_view, "refresh_resources_from_storage"):
-                self.dashboard_view.refresh_resources_from_storage()
-            if hasattr(self.dashboard_view, "refresh_week_from_storage"):
-                self.dashboard_view.refresh_week_from_storage()
-        elif widget is self.goals_view and hasattr(self.goals_view, "refresh_current_month"):
-            self.goals_view.refresh_current_month()
-        elif widget is self.tracker_view and hasattr(self.tracker_view, "refresh_from_storage"):
-            self.tracker_view.refresh_from_storage()
+        if widget is self.resources_view and hasattr(self.resources_view, "refresh_deck_activity"):
+            self.resources_view.refresh_deck_activity()
         elif widget is self.settings_view and hasattr(self.settings_view, "_load_profile_list"):
             # Refresh profile list to show current active profile
             self.settings_view._load_profile_list()
@@ -278,15 +317,16 @@ class LanguageForgeWindow(QWidget):
         if hasattr(self.resources_view, "select_row"):
             self.resources_view.select_row(index_row)
 
+    @timed()
     def _apply_font_size(self) -> None:
         """Apply the configured font size to the LanguageForge UI.
 
-        We adjust the base font on the main window and propagate it to all
-        children so that Dashboard/Tracker/Goals/Resources/Settings update
-        immediately when the user changes the size in Settings.
+        The font is set once on the main window; Qt propagates it to every
+        child that has not set its own font, including widgets created
+        later (dashboard Open buttons, tracker circles, ...), so there is no
+        need to visit the children. Nothing happens if the size is unchanged.
         """
 
-        font = self.font()
         base = self._base_font_size
 
         # New representation: a point size stored as a string (e.g. "11").
@@ -306,11 +346,13 @@ class LanguageForgeWindow(QWidget):
             new_size = legacy_map.get(str(raw), base)
 
         new_size = max(6, min(24, new_size))
-        font.setPointSize(new_size)
+        if new_size == self._applied_font_size:
+            return
+        self._applied_font_size = new_size
 
+        font = self.font()
+        font.setPointSize(new_size)
         self.setFont(font)
-        for child in self.findChildren(QWidget):
-            child.setFont(font)
 
         # After resizing fonts, keep the right edge of the content visible by
         # scrolling horizontally to the maximum extent if needed.
@@ -326,7 +368,20 @@ class LanguageForgeWindow(QWidget):
         return get_theme_colors(self._settings.theme, is_anki_dark)
 
     def _is_anki_dark_mode(self) -> bool:
-        """Detect if Anki is currently in dark mode."""
+        """Detect if Anki is currently in dark mode.
+
+        The answer is cached until Anki reports a theme change (see
+        on_anki_theme_changed).
+        """
+        if self._anki_dark_mode is None:
+            self._anki_dark_mode = self._probe_anki_dark_mode()
+        return self._anki_dark_mode
+
+    def on_anki_theme_changed(self) -> None:
+        """Forget the cached dark-mode state; called from theme_did_change."""
+        self._anki_dark_mode = None
+
+    def _probe_anki_dark_mode(self) -> bool:
         is_dark = False
         try:
             if hasattr(mw, "pm"):
@@ -441,7 +496,6 @@ class LanguageForgeWindow(QWidget):
             f"  background-color: {colors.button_hover_bg};"
             f"}}"
         )
-        self.setStyleSheet(main_stylesheet)
 
         tabs_stylesheet = (
             "QTabWidget::pane {"
@@ -468,35 +522,45 @@ class LanguageForgeWindow(QWidget):
             " border-radius: 0px;"
             " }"
         )
+
+        # Re-setting an identical stylesheet still re-polishes every widget,
+        # and this runs on each tab change.
+        styles = (main_stylesheet, tabs_stylesheet)
+        if styles == self._applied_tab_styles:
+            return
+        self._applied_tab_styles = styles
+        self.setStyleSheet(main_stylesheet)
         self.tabs.setStyleSheet(tabs_stylesheet)
 
     def _apply_theme_to_all_views(self) -> None:
         """Apply current theme colors to all child views."""
         colors = self._current_theme_colors
-        
-        # Update dashboard
-        if hasattr(self.dashboard_view, 'apply_theme'):
-            self.dashboard_view.apply_theme(colors)
-        
-        # Update radar
-        if hasattr(self.radar_view, 'apply_theme'):
-            self.radar_view.apply_theme(colors)
-        
-        # Update tracker
-        if hasattr(self.tracker_view, 'apply_theme'):
-            self.tracker_view.apply_theme(colors)
-        
-        # Update goals
-        if hasattr(self.goals_view, 'apply_theme'):
-            self.goals_view.apply_theme(colors)
-        
-        # Update resources
-        if hasattr(self.resources_view, 'apply_theme'):
-            self.resources_view.apply_theme(colors)
-        
-        # Update settings
-        if hasattr(self.settings_view, 'apply_theme'):
-            self.settings_view.apply_theme(colors)
+
+        # Every view restyles dozens of widgets; repaint the dock once.
+        with suspended_updates(self):
+            # Update dashboard
+            if hasattr(self.dashboard_view, 'apply_theme'):
+                self.dashboard_view.apply_theme(colors)
+
+            # Update radar
+            if hasattr(self.radar_view, 'apply_theme'):
+                self.radar_view.apply_theme(colors)
+
+            # Update tracker
+            if hasattr(self.tracker_view, 'apply_theme'):
+                self.tracker_view.apply_theme(colors)
+
+            # Update goals
+            if hasattr(self.goals_view, 'apply_theme'):
+                self.goals_view.apply_theme(colors)
+
+            # Update resources
+            if hasattr(self.resources_view, 'apply_theme'):
+                self.resources_view.apply_theme(colors)
+
+            # Update settings
+            if hasattr(self.settings_view, 'apply_theme'):
+                self.settings_view.apply_theme(colors)
 
     def _on_settings_changed(self, settings: Settings) -> None:
         """Callback from SettingsView when settings are updated."""
@@ -509,16 +573,10 @@ class LanguageForgeWindow(QWidget):
         # Re-apply tab bar style (for text/background).
         self._apply_tab_styles()
         
-        # First rebuild dashboard previews that create widgets dynamically so
-        # that newly created widgets are present when we apply theme & font.
-        if hasattr(self.dashboard_view, "refresh_resources_from_storage"):
-            self.dashboard_view.refresh_resources_from_storage()
-
-        # Apply theme to all views, including the rebuilt dashboard.
+        # Apply theme to all views.
         self._apply_theme_to_all_views()
 
-        # Now apply the font size to the entire LanguageForge UI, including the
-        # freshly rebuilt dashboard resources preview.
+        # Now apply the font size to the entire LanguageForge UI.
         self._apply_font_size()
 
     # dock helpers -----------------------------------------------------
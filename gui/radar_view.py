@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from datetime import datetime
 from typing import Optional, Dict, TYPE_CHECKING
 
@@ -21,16 +22,19 @@ from aqt.qt import (
     pyqtSignal,
     QFont,
 )
-from aqt.qt import QPainter, QPen, QColor, QPointF
+from aqt.qt import QPainter, QPen, QColor, QPointF, QPixmap, QFontMetricsF, QEvent
 
 from ..core.logic_radar import (
+    RADAR_DOCUMENT,
     load_radar_snapshots,
     save_radar_snapshot,
-    compute_balance_index,
-    compute_trends,
     get_days_since_last_snapshot,
 )
+from ..core.logic_radar_analytics import RadarHistory, get_radar_history
 from ..core.models import RadarSnapshot
+from .data_bus import get_data_bus
+from ..core.skills import SKILL_KEYS, get_skill, values_from_mapping, values_to_mapping
+from ..core.perf import timed
 
 
 class RadarChartWidget(QWidget):
@@ -93,12 +97,16 @@ class InteractiveRadarWidget(QWidget):
 
     valueChanged = pyqtSignal(str, int)
 
+    _MAX_VALUE = 5.0
+    # Upper bound on history polygons drawn at once (level of detail)
+    _HISTORY_MAX_POLYGONS = 12
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
         policy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setSizePolicy(policy)
 
-        self.skills = ["reading", "listening", "speaking", "writing"]
+        self.skills = list(SKILL_KEYS)
         self.skill_values: Dict[str, int] = {s: 1 for s in self.skills}
         # per-skill trend: "up", "down", or "same"
         self.skill_trends: Dict[str, str] = {s: "same" for s in self.skills}
@@ -113,6 +121,25 @@ class InteractiveRadarWidget(QWidget):
         # Theme colors
         self._theme_colors: Optional['ThemeColors'] = None
 
+        # Cached paint layers (see _render_background/_render_ghost)
+        self._background_layer: Optional[QPixmap] = None
+        self._ghost_layer: Optional[QPixmap] = None
+        self._label_origins: list[QPointF] = []
+
+        # History overlay: snapshot arrays plus the [start, stop) index range
+        # to draw. Polygons are built lazily per month and cached until the
+        # geometry or history changes.
+        self._history: Optional[RadarHistory] = None
+        self._history_range = (0, 0)
+        self._history_polygons: Dict[str, list[QPointF]] = {}
+        self._history_layer: Optional[QPixmap] = None
+
+        # Geometry tables rebuilt by _update_geometry on resize
+        self._axis_step = 0.0
+        self._axis_units: list[tuple[float, float]] = []
+        self._step_points: list[list[QPointF]] = []
+        self._update_geometry()
+
         self.setMouseTracking(True)
 
     # public helpers -------------------------------------------------
@@ -125,6 +152,17 @@ class InteractiveRadarWidget(QWidget):
     def get_values_dict(self) -> Dict[str, int]:
         return dict(self.skill_values)
 
+    def set_skills(self, skills: list[str]) -> None:
+        """Chart a different set of skills (one axis per skill)."""
+        self.skills = list(skills)
+        self.skill_values = {s: self.skill_values.get(s, 1) for s in self.skills}
+        self.skill_trends = {s: self.skill_trends.get(s, "same") for s in self.skills}
+        self.prev_skill_values = {s: self.prev_skill_values.get(s, 0) for s in self.skills}
+        self._hover_axis = None
+        self._update_geometry()
+        self._invalidate_layers()
+        self.update()
+
     def set_trends(self, trends: Dict[str, str]) -> None:
         """Update per-skill trend directions used for axis labels."""
         for s in self.skills:
@@ -141,33 +179,70 @@ class InteractiveRadarWidget(QWidget):
         """
 
         if not values:
-            self.prev_skill_values = {s: 0 for s in self.skills}
+            new_prev = {s: 0 for s in self.skills}
         else:
-            new_prev: Dict[str, int] = {}
+            new_prev = {}
             for s in self.skills:
                 v = int(values.get(s, 0))
                 new_prev[s] = max(0, min(5, v))
+        if new_prev != self.prev_skill_values:
             self.prev_skill_values = new_prev
+            self._ghost_layer = None
+        self.update()
+
+    def set_history(self, history: Optional[RadarHistory], start: int = 0, stop: int = 0) -> None:
+        """Overlay snapshots ``start``..``stop - 1`` of ``history``.
+
+        Pass None (or an empty range) to turn the history overlay off.
+        """
+
+        if history is None or stop <= start:
+            history, start, stop = None, 0, 0
+        if history is not self._history:
+            self._history_polygons.clear()
+        elif (start, stop) == self._history_range:
+            return
+        self._history = history
+        self._history_range = (start, stop)
+        self._history_layer = None
         self.update()
 
     def set_theme_colors(self, colors: 'ThemeColors') -> None:
         """Update theme colors and repaint."""
         self._theme_colors = colors
+        self._invalidate_layers()
         self.update()
 
     # drawing --------------------------------------------------------
-    def paintEvent(self, event) -> None:  # type: ignore[override]
-        from math import cos, sin, pi
-
-        if not self.skill_values:
-            return
+    # The chart is painted in layers: axes, step dots and skill emojis are
+    # rendered once into a background pixmap and the ghost polygon into a
+    # second one. Both are only rebuilt on resize, theme/font change or (for
+    # the ghost) new previous-month values, so hover and drag repaint just
+    # the value polygon, the highlighted axis and the value labels.
+    def _invalidate_layers(self) -> None:
+        self._background_layer = None
+        self._ghost_layer = None
+        self._history_layer = None
+
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        self._update_geometry()
+        self._invalidate_layers()
+
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        super().changeEvent(event)
+        if event.type() in (QEvent.Type.FontChange, QEvent.Type.PaletteChange):
+            self._invalidate_layers()
+            self.update()
+
+    def _update_geometry(self) -> None:
+        """Precompute axis directions and step positions for the current size.
+
+        Axis i points at angle 2*pi*i/N - pi/2 (axis 0 straight up), for any
+        number N of skills. Painting and hit-testing only read these tables.
+        """
 
-        painter = QPainter(self)
-        try:
-            hint = QPainter.RenderHint.Antialiasing
-        except AttributeError:
-            hint = QPainter.Antialiasing  # type: ignore[attr-defined]
-        painter.setRenderHint(hint)
+        from math import cos, sin, pi
 
         width = self.width()
         height = self.height()
@@ -175,116 +250,219 @@ class InteractiveRadarWidget(QWidget):
         # Slightly reduced radius so labels on vertical axes remain visible.
         self._radius = min(width, height) * 0.40
 
-        max_value = 5.0
-        axes = len(self.skills)
+        axes = max(1, len(self.skills))
+        self._axis_step = 2.0 * pi / axes
+        self._axis_units = [
+            (cos(i * self._axis_step - pi / 2.0), sin(i * self._axis_step - pi / 2.0))
+            for i in range(axes)
+        ]
+        self._history_polygons.clear()
+        steps = int(self._MAX_VALUE)
+        self._step_points = [
+            [self._point_at(i, step) for step in range(1, steps + 1)]
+            for i in range(axes)
+        ]
+
+    def _point_at(self, i: int, value: float) -> QPointF:
+        ux, uy = self._axis_units[i]
+        r = self._radius * max(0.0, min(value / self._MAX_VALUE, 1.0))
+        return QPointF(self._center.x() + r * ux, self._center.y() + r * uy)
+
+    def _axis_pens(self) -> tuple[QPen, QPen]:
+        if self._theme_colors:
+            return (
+                QPen(QColor(self._theme_colors.radar_axes)),
+                QPen(QColor(self._theme_colors.radar_axes_hover)),
+            )
+        return QPen(QColor(180, 180, 180)), QPen(QColor(220, 220, 220))
 
-        # axes - use theme colors if available
+    def _label_font(self) -> QFont:
+        font = QFont(self.font())
+        font.setPointSize(max(8, font.pointSize() - 2))
+        return font
+
+    def _new_layer(self) -> QPixmap:
+        # Match the device pixel ratio so cached layers stay sharp on
+        # high-DPI screens.
+        ratio = self.devicePixelRatioF()
+        layer = QPixmap(max(1, int(self.width() * ratio)), max(1, int(self.height() * ratio)))
+        layer.setDevicePixelRatio(ratio)
+        layer.fill(Qt.GlobalColor.transparent)
+        return layer
+
+    @staticmethod
+    def _begin_painter(device) -> QPainter:
+        painter = QPainter(device)
+        try:
+            hint = QPainter.RenderHint.Antialiasing
+        except AttributeError:
+            hint = QPainter.Antialiasing  # type: ignore[attr-defined]
+        painter.setRenderHint(hint)
+        return painter
+
+    def _render_background(self) -> QPixmap:
+        layer = self._new_layer()
+        painter = self._begin_painter(layer)
+        base_pen, _hover_pen = self._axis_pens()
         if self._theme_colors:
-            base_pen = QPen(QColor(self._theme_colors.radar_axes))
-            hover_pen = QPen(QColor(self._theme_colors.radar_axes_hover))
+            dot_pen = QPen(QColor(self._theme_colors.radar_dots))
         else:
-            base_pen = QPen(QColor(180, 180, 180))
-            hover_pen = QPen(QColor(220, 220, 220))
-        # Emojis for the four skills (same order as self.skills)
-        axis_emojis = ["📖", "🎧", "🗣️", "✍️"]
-        arrow_map = {"up": "↑", "down": "↓", "same": "="}
+            dot_pen = QPen(QColor(140, 140, 140))
 
-        font = painter.font()
-        font.setPointSize(max(8, font.pointSize() - 2))
+        font = self._label_font()
         painter.setFont(font)
+        metrics = QFontMetricsF(font)
+        self._label_origins = []
 
-        for i in range(axes):
-            angle = 2.0 * pi * i / axes - pi / 2.0
-            end_x = self._center.x() + self._radius * cos(angle)
-            end_y = self._center.y() + self._radius * sin(angle)
-            painter.setPen(hover_pen if i == self._hover_axis else base_pen)
-            painter.drawLine(self._center, QPointF(end_x, end_y))
+        for i in range(len(self.skills)):
+            step_points = self._step_points[i]
+            painter.setPen(base_pen)
+            painter.drawLine(self._center, step_points[-1])
 
             # Small dots for each discrete step (1–5) along the axis
-            # Highlight only the closest dot on the hovered axis.
-            hovered_step = None
-            if self._hover_axis == i and self._hover_value is not None:
-                hovered_step = max(1, min(5, int(round(self._hover_value))))
-
-            for step in range(1, int(max_value) + 1):
-                r_step = self._radius * (step / max_value)
-                sx = self._center.x() + r_step * cos(angle)
-                sy = self._center.y() + r_step * sin(angle)
-
-                if hovered_step is not None and step == hovered_step:
-                    # Highlighted dot
-                    if self._theme_colors:
-                        dot_pen = QPen(QColor(self._theme_colors.radar_dots_hover))
-                    else:
-                        dot_pen = QPen(QColor(220, 220, 220))
-                    painter.setPen(dot_pen)
-                    painter.drawEllipse(QPointF(sx, sy), 3, 3)
-                else:
-                    if self._theme_colors:
-                        dot_pen = QPen(QColor(self._theme_colors.radar_dots))
-                    else:
-                        dot_pen = QPen(QColor(140, 140, 140))
-                    painter.setPen(dot_pen)
-                    painter.drawEllipse(QPointF(sx, sy), 2, 2)
-
-            # Emoji + numeric value + trend arrow label slightly outside the circle
-            painter.setPen(hover_pen if i == self._hover_axis else base_pen)
-            if i < len(axis_emojis):
-                # Give horizontal axes (right/left) a bit more spacing so
-                # labels don't overlap the line endpoints.
-                if i in (1, 3):  # right and left axes
-                    label_r = self._radius + 22
-                else:
-                    label_r = self._radius + 12
-                label_x = self._center.x() + label_r * cos(angle)
-                label_y = self._center.y() + label_r * sin(angle)
-                skill = self.skills[i]
-                value = self.skill_values.get(skill, 1)
-                trend = self.skill_trends.get(skill, "same")
-                arrow = arrow_map.get(trend, "=")
-                text = f"{axis_emojis[i]} {value} {arrow}"
-                painter.drawText(
-                    QPointF(label_x - 14, label_y + 4),
-                    text,
-                )
-
-        # polygon (ghost previous-month outline + filled current area)
+            painter.setPen(dot_pen)
+            for point in step_points:
+                painter.drawEllipse(point, 2, 2)
+
+            # Emoji slightly outside the circle; the value and trend arrow
+            # are drawn after it on every paint. Unregistered skills are
+            # labelled by name.
+            skill = get_skill(self.skills[i])
+            emoji = skill.emoji if skill is not None else self.skills[i].capitalize()
+            ux, uy = self._axis_units[i]
+            # Give horizontal axes a bit more spacing so labels don't
+            # overlap the line endpoints.
+            label_r = self._radius + (22 if abs(ux) > 0.7 else 12)
+            origin = QPointF(
+                self._center.x() + label_r * ux - 14,
+                self._center.y() + label_r * uy + 4,
+            )
+            painter.setPen(base_pen)
+            painter.drawText(origin, emoji)
+            self._label_origins.append(
+                QPointF(origin.x() + metrics.horizontalAdvance(emoji), origin.y())
+            )
+
+        painter.end()
+        return layer
+
+    def _render_ghost(self) -> Optional[QPixmap]:
         points_prev = []
-        points = []
         for i, skill in enumerate(self.skills):
             # previous values (may be 0 to indicate "no data")
             prev_val = float(self.prev_skill_values.get(skill, 0))
-            angle = 2.0 * pi * i / axes - pi / 2.0
             if prev_val > 0:
-                r_prev = self._radius * max(0.0, min(prev_val / max_value, 1.0))
-                x_prev = self._center.x() + r_prev * cos(angle)
-                y_prev = self._center.y() + r_prev * sin(angle)
-                points_prev.append(QPointF(x_prev, y_prev))
-
-            # current values
-            val = float(self.skill_values.get(skill, 1))
-            r = self._radius * max(0.0, min(val / max_value, 1.0))
-            x = self._center.x() + r * cos(angle)
-            y = self._center.y() + r * sin(angle)
-            points.append(QPointF(x, y))
+                points_prev.append(self._point_at(i, prev_val))
+        if len(points_prev) < 3:
+            return None
 
-        # Ghost polygon for previous month
-        if len(points_prev) >= 3:
-            painter.setBrush(Qt.BrushStyle.NoBrush)
-            if self._theme_colors:
-                ghost_color = QColor(self._theme_colors.radar_ghost)
-                ghost_color.setAlpha(160)
-                ghost_pen = QPen(ghost_color, 1)
-            else:
-                ghost_pen = QPen(QColor(120, 120, 120, 160), 1)
-            ghost_pen.setStyle(Qt.PenStyle.DashLine)
-            painter.setPen(ghost_pen)
-            for i in range(len(points_prev)):
-                p1 = points_prev[i]
-                p2 = points_prev[(i + 1) % len(points_prev)]
-                painter.drawLine(p1, p2)
+        layer = self._new_layer()
+        painter = self._begin_painter(layer)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        if self._theme_colors:
+            ghost_color = QColor(self._theme_colors.radar_ghost)
+            ghost_color.setAlpha(160)
+            ghost_pen = QPen(ghost_color, 1)
+        else:
+            ghost_pen = QPen(QColor(120, 120, 120, 160), 1)
+        ghost_pen.setStyle(Qt.PenStyle.DashLine)
+        painter.setPen(ghost_pen)
+        for i in range(len(points_prev)):
+            painter.drawLine(points_prev[i], points_prev[(i + 1) % len(points_prev)])
+        painter.end()
+        return layer
+
+    def _history_indices(self) -> list[int]:
+        """Indices of the history months to draw, oldest first.
+
+        Long ranges are decimated to at most _HISTORY_MAX_POLYGONS evenly
+        spaced months, always keeping the oldest and the newest one.
+        """
+
+        start, stop = self._history_range
+        count = stop - start
+        limit = self._HISTORY_MAX_POLYGONS
+        if count <= limit:
+            return list(range(start, stop))
+        picked = {stop - 1 - round(k * (count - 1) / (limit - 1)) for k in range(limit)}
+        return sorted(picked)
+
+    def _history_polygon(self, index: int) -> list[QPointF]:
+        history = self._history
+        assert history is not None
+        month = history.months[index]
+        points = self._history_polygons.get(month)
+        if points is None:
+            values = history.skill_values(index)
+            points = [
+                self._point_at(i, float(values.get(skill, 0)))
+                for i, skill in enumerate(self.skills)
+            ]
+            self._history_polygons[month] = points
+        return points
+
+    def _render_history(self) -> Optional[QPixmap]:
+        indices = self._history_indices() if self._history is not None else []
+        if not indices or len(self.skills) < 3:
+            return None
+
+        layer = self._new_layer()
+        painter = self._begin_painter(layer)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        if self._theme_colors:
+            base_color = QColor(self._theme_colors.radar_ghost)
+        else:
+            base_color = QColor(120, 120, 120)
+        # Older months fade out; the newest is as strong as the ghost.
+        for n, index in enumerate(indices):
+            color = QColor(base_color)
+            color.setAlpha(int(50 + 110 * (n + 1) / len(indices)))
+            painter.setPen(QPen(color, 1))
+            painter.drawPolygon(self._history_polygon(index))
+        painter.end()
+        return layer
+
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        if not self.skill_values:
+            return
+
+        if self._background_layer is None:
+            self._update_geometry()
+            self._background_layer = self._render_background()
+            self._ghost_layer = None
+        if self._ghost_layer is None:
+            self._ghost_layer = self._render_ghost() or QPixmap()
+        if self._history_layer is None:
+            self._history_layer = self._render_history() or QPixmap()
+
+        painter = self._begin_painter(self)
+        painter.drawPixmap(0, 0, self._background_layer)
+        base_pen, hover_pen = self._axis_pens()
+
+        # Highlighted axis and the dot closest to the cursor
+        if self._hover_axis is not None and self._hover_axis < len(self.skills):
+            painter.setPen(hover_pen)
+            step_points = self._step_points[self._hover_axis]
+            painter.drawLine(self._center, step_points[-1])
+            if self._hover_value is not None:
+                hovered_step = max(1, min(len(step_points), int(round(self._hover_value))))
+                if self._theme_colors:
+                    painter.setPen(QPen(QColor(self._theme_colors.radar_dots_hover)))
+                else:
+                    painter.setPen(QPen(QColor(220, 220, 220)))
+                painter.drawEllipse(step_points[hovered_step - 1], 3, 3)
+
+        # History overlay replaces the single previous-month ghost polygon
+        if not self._history_layer.isNull():
+            painter.drawPixmap(0, 0, self._history_layer)
+        elif not self._ghost_layer.isNull():
+            painter.drawPixmap(0, 0, self._ghost_layer)
 
         # Filled polygon for current month
+        points = [
+            self._point_at(i, float(self.skill_values.get(skill, 1)))
+            for i, skill in enumerate(self.skills)
+        ]
         if len(points) >= 3:
             if self._theme_colors:
                 fill_color = QColor(self._theme_colors.radar_polygon)
@@ -296,7 +474,7 @@ class InteractiveRadarWidget(QWidget):
                 fill_color = QColor(80, 120, 200, 80)
                 edge_color = QColor(80, 120, 200, 160)
                 outline_color = QColor(80, 120, 200)
-            
+
             painter.setBrush(fill_color)
             painter.setPen(QPen(edge_color, 1))
             painter.drawPolygon(points)
@@ -305,38 +483,39 @@ class InteractiveRadarWidget(QWidget):
             painter.setBrush(Qt.BrushStyle.NoBrush)
             painter.setPen(QPen(outline_color, 2))
             for i in range(len(points)):
-                p1 = points[i]
-                p2 = points[(i + 1) % len(points)]
-                painter.drawLine(p1, p2)
+                painter.drawLine(points[i], points[(i + 1) % len(points)])
+
+        # Numeric value + trend arrow next to each emoji
+        arrow_map = {"up": "↑", "down": "↓", "same": "="}
+        painter.setFont(self._label_font())
+        for i, origin in enumerate(self._label_origins):
+            skill = self.skills[i]
+            value = self.skill_values.get(skill, 1)
+            arrow = arrow_map.get(self.skill_trends.get(skill, "same"), "=")
+            painter.setPen(hover_pen if i == self._hover_axis else base_pen)
+            painter.drawText(origin, f" {value} {arrow}")
 
+        painter.end()
         # No hover guide circle: keep interaction but avoid extra visual clutter
 
     # interaction ----------------------------------------------------
     def _axis_and_value_from_pos(self, pos) -> Optional[tuple[int, int, float]]:
-        from math import atan2, hypot, pi
+        from math import atan2, floor, hypot, pi
 
-        if self._radius <= 0:
+        if self._radius <= 0 or not self._axis_units:
             return None
 
         dx = pos.x() - self._center.x()
         dy = pos.y() - self._center.y()
-        angle = atan2(dy, dx)
 
-        axes = len(self.skills)
-        best_axis = 0
-        best_diff = None
-        for i in range(axes):
-            axis_angle = 2.0 * pi * i / axes - pi / 2.0
-            diff = (angle - axis_angle + pi) % (2 * pi) - pi
-            ad = abs(diff)
-            if best_diff is None or ad < best_diff:
-                best_diff = ad
-                best_axis = i
-
-        dist = hypot(dx, dy)
-        raw = (dist / self._radius) * 5.0
-        value = max(1, min(5, int(round(raw))))
-        return best_axis, value, raw
+        # Axes are evenly spaced, so the nearest one is the angular bucket
+        # (one axis step wide, centred on the axis) containing the cursor.
+        turns = (atan2(dy, dx) + pi / 2.0) / self._axis_step
+        axis = int(floor(turns + 0.5)) % len(self._axis_units)
+
+        raw = (hypot(dx, dy) / self._radius) * self._MAX_VALUE
+        value = max(1, min(int(self._MAX_VALUE), int(round(raw))))
+        return axis, value, raw
 
     def mouseMoveEvent(self, event) -> None:  # type: ignore[override]
         info = self._axis_and_value_from_pos(event.position())  # type: ignore[attr-defined]
@@ -375,17 +554,20 @@ class InteractiveRadarWidget(QWidget):
 
 
 class RadarView(QWidget):
+    # (label, number of earlier months to overlay); 0 = off, -1 = all
+    _HISTORY_SPANS = [
+        ("No history", 0),
+        ("6 months", 6),
+        ("12 months", 12),
+        ("All history", -1),
+    ]
+
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
 
         self.snapshots = load_radar_snapshots()
         # current in-memory values for the selected month
-        self.values: Dict[str, int] = {
-            "reading": 1,
-            "listening": 1,
-            "speaking": 1,
-            "writing": 1,
-        }
+        self.values: Dict[str, int] = {key: 1 for key in SKILL_KEYS}
 
         main_layout = QHBoxLayout(self)
         main_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
@@ -430,6 +612,18 @@ class RadarView(QWidget):
         )
         month_row.addWidget(self.save_button)
 
+        # History overlay: how many months before the selected one to draw.
+        self.history_combo = QComboBox(self)
+        self.history_combo.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.history_combo.setSizeAdjustPolicy(
+            QComboBox.SizeAdjustPolicy.AdjustToContents
+        )
+        self.history_combo.setStyleSheet(self.month_combo.styleSheet())
+        for label, span in self._HISTORY_SPANS:
+            self.history_combo.addItem(label, span)
+        self.history_combo.setToolTip("Overlay earlier snapshots on the chart")
+        month_row.addWidget(self.history_combo)
+
         # Balance index text on the same header row, right-aligned so the row
         # spans the full width of the Fluency Snapshot card.
         month_row.addStretch(1)
@@ -462,7 +656,11 @@ class RadarView(QWidget):
 
         self.month_combo.currentTextChanged.connect(self._on_month_changed)
         self.save_button.clicked.connect(self._on_save)
+        self.history_combo.currentIndexChanged.connect(self._on_history_span_changed)
         self.chart.valueChanged.connect(self._on_chart_value_changed)
+        # The dashboard and the Radar tab each host a RadarView; keep them
+        # in sync through the data bus.
+        get_data_bus().documentChanged.connect(self._on_document_changed)
 
         self._load_current_month_values()
         self._update_banner()
@@ -503,12 +701,9 @@ class RadarView(QWidget):
     def _load_current_month_values(self) -> None:
         month = self.month_combo.currentText() or self._current_month_str()
         data = self.snapshots.get(month)
-        if isinstance(data, dict):
+        if data is not None:
             self.values = {
-                "reading": int(data.get("reading", 1)),
-                "listening": int(data.get("listening", 1)),
-                "speaking": int(data.get("speaking", 1)),
-                "writing": int(data.get("writing", 1)),
+                key: max(1, value) for key, value in values_to_mapping(data.values).items()
             }
         else:
             self.values = {s: 1 for s in self.values.keys()}
@@ -521,21 +716,34 @@ class RadarView(QWidget):
         self._refresh_value_labels()
         self._update_analysis()
 
+    def _on_document_changed(self, document: str, _keys, origin) -> None:
+        if document != RADAR_DOCUMENT or origin is self:
+            return
+        self.snapshots = load_radar_snapshots()
+        month = self.month_combo.currentText()
+        self.month_combo.blockSignals(True)
+        self._populate_months()
+        index = self.month_combo.findText(month)
+        if index >= 0:
+            self.month_combo.setCurrentIndex(index)
+        self.month_combo.blockSignals(False)
+        self._update_month_label_prefix()
+        if self.save_button.isEnabled():
+            # Keep unsaved edits; only refresh balance/trends/history.
+            self._update_analysis()
+        else:
+            self._load_current_month_values()
+        self._update_banner()
+
     def _on_month_changed(self, _text: str) -> None:
         self._update_month_label_prefix()
         self._load_current_month_values()
 
     def _on_save(self) -> None:
         month = self.month_combo.currentText() or self._current_month_str()
-        snapshot = RadarSnapshot(
-            month=month,
-            reading=self.values["reading"],
-            listening=self.values["listening"],
-            speaking=self.values["speaking"],
-            writing=self.values["writing"],
-        )
-        save_radar_snapshot(snapshot)
-        self.snapshots = load_radar_snapshots()
+        snapshot = RadarSnapshot(month, values_from_mapping(self.values, default=1))
+        with get_data_bus().publishing(self):
+            self.snapshots = save_radar_snapshot(snapshot)
         self._populate_months()
         self._update_chart()
         self._update_banner()
@@ -551,58 +759,49 @@ class RadarView(QWidget):
         # Labels removed - values now displayed directly on radar chart
         pass
 
-    def _update_analysis(self) -> None:
-        """Update balance index and trend labels based on snapshots."""
+    def _on_history_span_changed(self, _index: int) -> None:
+        self._update_history_overlay(get_radar_history())
 
-        if not self.snapshots:
-            self.balance_label.setText("Balance Index: -")
-            self.chart.set_previous_values(None)
+    def _update_history_overlay(self, history: RadarHistory) -> None:
+        """Overlay the chosen number of snapshots before the selected month."""
+
+        span = self.history_combo.currentData() if hasattr(self, "history_combo") else 0
+        if not span:
+            self.chart.set_history(None)
             return
+        month = self.month_combo.currentText() or self._current_month_str()
+        stop = bisect_left(history.months, month)
+        start = 0 if span < 0 else max(0, stop - int(span))
+        self.chart.set_history(history, start, stop)
+
+    def _update_analysis(self) -> None:
+        """Update balance index and trend labels based on snapshots."""
 
+        history = get_radar_history()
         month = self.month_combo.currentText() or self._current_month_str()
-        current = self.snapshots.get(month)
-        if not isinstance(current, dict):
+        self._update_history_overlay(history)
+        idx = history.index_of(month)
+        if idx is None:
             self.balance_label.setText("Balance Index: -")
             self.chart.set_previous_values(None)
             return
 
-        score = compute_balance_index(current)
+        score = history.balance[idx]
         if score is None:
             self.balance_label.setText("Balance Index: -")
         else:
             self.balance_label.setText(f"Balance Index: {score}%")
 
-        # Trends compared to previous month, if any
-        months_sorted = sorted(self.snapshots.keys())
-        try:
-            idx = months_sorted.index(month)
-        except ValueError:
-            idx = -1
-
-        if idx <= 0:
+        if idx == 0:
             # No previous month: reset trends on the chart to neutral
             self.chart.set_trends({})
             self.chart.set_previous_values(None)
             return
 
-        prev_month = months_sorted[idx - 1]
-        previous = self.snapshots.get(prev_month, {})
-        trends = compute_trends(current, previous)
-        # Feed trends into the interactive chart so axis arrows match
-        self.chart.set_trends(trends)
-
-        # Feed previous-month values into the chart for ghost polygon
-        if isinstance(previous, dict):
-            prev_values = {
-                "reading": int(previous.get("reading", 0)),
-                "listening": int(previous.get("listening", 0)),
-                "speaking": int(previous.get("speaking", 0)),
-                "writing": int(previous.get("writing", 0)),
-            }
-            self.chart.set_previous_values(prev_values)
-        else:
-            self.chart.set_previous_values(None)
-        # Trend arrows now shown directly on radar chart axes
+        # Feed trends into the interactive chart so axis arrows match, and
+        # previous-month values for the ghost polygon.
+        self.chart.set_trends(history.trends(idx))
+        self.chart.set_previous_values(history.skill_values(idx - 1))
 
     def _update_banner(self) -> None:
         days = get_days_since_last_snapshot()
@@ -621,6 +820,7 @@ class RadarView(QWidget):
             # No separate reminder row for now.
             self.reminder_label.setText("")
 
+    @timed()
     def apply_theme(self, colors: 'ThemeColors') -> None:
         """Apply theme colors to radar view components."""
         # Set background for the entire RadarView
@@ -634,9 +834,11 @@ class RadarView(QWidget):
         if hasattr(self.chart, 'set_theme_colors'):
             self.chart.set_theme_colors(colors)
         
-        # Update month combo styling
-        if hasattr(self, 'month_combo'):
-            self.month_combo.setStyleSheet(
+        # Update month/history combo styling
+        for combo in (getattr(self, 'month_combo', None), getattr(self, 'history_combo', None)):
+            if combo is None:
+                continue
+            combo.setStyleSheet(
                 f"QComboBox {{"
                 f"  border: 1px solid {colors.input_border};"
                 f"  border-radius: 4px;"
@@ -24,10 +24,21 @@ from aqt.qt import (
     QComboBox,
     QHeaderView,
     QColor,
+    QCompleter,
+    QStringListModel,
 )
 
-from ..core.logic_resources import load_resources, save_resources
+from ..core.logic_resources import RESOURCES_DOCUMENT, load_resources, save_resources
+from ..core.logic_decks import get_deck_id, invalidate_deck_cache, match_deck_names
+from ..core.logic_deck_stats import (
+    REVIEW_WINDOW_DAYS,
+    add_deck_activity_listener,
+    get_deck_activity,
+    request_deck_activity_refresh,
+)
 from ..core.models import ResourceItem
+from ..core.perf import timed
+from .data_bus import get_data_bus
 
 
 class ResourceDialog(QDialog):
@@ -52,9 +63,9 @@ class ResourceDialog(QDialog):
         self.name_edit = QLineEdit(self)
         self.link_edit = QLineEdit(self)
         self.notes_edit = QTextEdit(self)
-        self.deck_combo = QComboBox(self)
-        self.deck_combo.setEditable(True)
-        self._populate_decks()
+        self.deck_edit = QLineEdit(self)
+        self.deck_edit.setPlaceholderText("Start typing a deck name…")
+        self._setup_deck_completer()
         self.tags_edit = QLineEdit(self)
         self.tags_edit.setPlaceholderText(
             "Tags (comma-separated: listening, JLPT, grammar)"
@@ -64,7 +75,7 @@ class ResourceDialog(QDialog):
         layout.addRow("Name", self.name_edit)
         layout.addRow("Link", self.link_edit)
         layout.addRow("Notes", self.notes_edit)
-        layout.addRow("Deck", self.deck_combo)
+        layout.addRow("Deck", self.deck_edit)
         layout.addRow("Tags", self.tags_edit)
 
         button_row = QHBoxLayout()
@@ -90,7 +101,7 @@ class ResourceDialog(QDialog):
             self.name_edit.setText(item.name)
             self.link_edit.setText(item.link)
             self.notes_edit.setPlainText(item.notes)
-            self.deck_combo.setEditText(item.deck_name or "")
+            self.deck_edit.setText(item.deck_name or "")
             if item.tags:
                 self.tags_edit.setText(", ".join(tag for tag in item.tags if tag.strip()))
         
@@ -169,6 +180,13 @@ class ResourceDialog(QDialog):
             f"  background-color: {colors.accent};"
             f"  color: {colors.background};"
             f"}}"
+            f"QAbstractItemView {{"
+            f"  background-color: {colors.input_bg};"
+            f"  color: {colors.input_text};"
+            f"  border: 1px solid {colors.input_border};"
+            f"  selection-background-color: {colors.accent};"
+            f"  selection-color: {colors.background};"
+            f"}}"
             f"QPushButton {{"
             f"  border: 1px solid {colors.button_border};"
             f"  border-radius: 4px;"
@@ -192,34 +210,57 @@ class ResourceDialog(QDialog):
             name=self.name_edit.text(),
             link=self.link_edit.text(),
             notes=self.notes_edit.toPlainText(),
-            deck_name=(self.deck_combo.currentText() or "").strip() or None,
+            deck_name=(self.deck_edit.text() or "").strip() or None,
             tags=tags,
         )
 
-    def _populate_decks(self) -> None:
-        """Populate deck dropdown with installed Anki decks.
+    def _setup_deck_completer(self) -> None:
+        """Attach a fuzzy deck-name completer to the deck field.
 
-        Keeps the list simple (names only) and falls back silently if the
-        collection is not available, so the field remains usable as free text.
+        Deck names come from the shared deck cache, and only the best matches
+        for the current text are put in the popup, so the dialog opens
+        quickly even on collections with thousands of decks. The field stays
+        usable as free text if the collection is not available.
         """
 
-        self.deck_combo.clear()
+        self._deck_model = QStringListModel(self)
+        completer = QCompleter(self._deck_model, self)
+        # We filter and rank ourselves in match_deck_names; let Qt show the
+        # model as-is.
+        completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.deck_edit.setCompleter(completer)
+        self.deck_edit.textEdited.connect(self._on_deck_text_edited)
+
+    def _on_deck_text_edited(self, text: str) -> None:
         try:
-            if mw is None or mw.col is None:
-                return
-            for deck in mw.col.decks.all():
-                name = str(deck.get("name", "")).strip()
-                if name:
-                    self.deck_combo.addItem(name)
+            matches = match_deck_names(text)
         except Exception:
-            # If anything goes wrong, leave the combo empty; user can still
-            # type a deck name manually.
+            # Leave the previous suggestions in place; typing still works.
             return
+        self._deck_model.setStringList(matches)
+        completer = self.deck_edit.completer()
+        if matches and completer is not None:
+            completer.complete()
+
+
+class _ActivityItem(QTableWidgetItem):
+    """Table cell that sorts by deck activity rather than by its text."""
+
+    def __init__(self, text: str, sort_key: tuple[int, int]) -> None:
+        super().__init__(text)
+        self.sort_key = sort_key
+
+    def __lt__(self, other) -> bool:  # type: ignore[override]
+        if isinstance(other, _ActivityItem):
+            return self.sort_key < other.sort_key
+        return super().__lt__(other)
 
 
 class ResourcesView(QWidget):
-    # Columns: Icon, Name, Link, Deck, Tags
-    headers = ["", "Name", "Link", "Deck", "Tags"]
+    # Columns: Icon, Name, Link, Deck, Tags, Activity
+    headers = ["", "Name", "Link", "Deck", "Tags", "Activity"]
+    _ACTIVITY_COLUMN = 5
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -245,11 +286,8 @@ class ResourcesView(QWidget):
         container_layout.addLayout(search_row)
 
         self.table = QTableWidget(self)
-        # Slightly larger font for better readability in the resources list.
-        table_font = self.table.font()
-        if table_font.pointSize() > 0:
-            table_font.setPointSize(table_font.pointSize() + 2)
-            self.table.setFont(table_font)
+        # The table inherits the window font so it follows the font size
+        # setting; an explicit setFont here would pin it to the startup size.
         self.table.setColumnCount(len(self.headers))
         self.table.setHorizontalHeaderLabels(self.headers)
         self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
@@ -275,11 +313,13 @@ class ResourcesView(QWidget):
         link_width = fm.horizontalAdvance("https://example.com") + 16
         deck_width = fm.horizontalAdvance("My Deck Name") + 16
         tags_width = fm.horizontalAdvance("tag1, tag2, tag3") + 16
+        activity_width = fm.horizontalAdvance("9999 rev · 999 due") + 16
 
         self.table.setColumnWidth(0, icon_width)
         self.table.setColumnWidth(2, link_width)
         self.table.setColumnWidth(3, deck_width)
         self.table.setColumnWidth(4, tags_width)
+        self.table.setColumnWidth(5, activity_width)
 
         header = self.table.horizontalHeader()
         # Icon, Link, Deck, Tags columns fixed
@@ -287,6 +327,7 @@ class ResourcesView(QWidget):
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(3, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(4, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)
         # Name column stretches to fill remaining space
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
         container_layout.addWidget(self.table)
@@ -314,32 +355,34 @@ class ResourcesView(QWidget):
         self.table.cellEntered.connect(self._on_cell_entered)
         self.search_edit.textChanged.connect(self._on_search_changed)
 
+        # Deck activity is computed in the background; cells are filled in
+        # when the stats arrive.
+        add_deck_activity_listener(self._refresh_activity_column)
+        get_data_bus().documentChanged.connect(self._on_document_changed)
+
+        self._load_items()
+        request_deck_activity_refresh()
+
+    def _on_document_changed(self, document: str, _keys, origin) -> None:
+        # Reload when resources change outside this view (profile switch).
+        if document != RESOURCES_DOCUMENT or origin is self:
+            return
         self._load_items()
+        self._apply_filter_and_refresh()
 
     def _load_items(self) -> None:
         raw = load_resources()
         self.items = []
         for obj in raw:
-            try:
-                tags_raw = obj.get("tags") or []
-                if not isinstance(tags_raw, list):
-                    tags_raw = []
-                tags = [str(t) for t in tags_raw if str(t).strip()]
-                item = ResourceItem(
-                    id=str(obj.get("id", "")),
-                    type=str(obj.get("type", "")),
-                    name=str(obj.get("name", "")),
-                    link=str(obj.get("link", "")),
-                    notes=str(obj.get("notes", "")),
-                    deck_name=obj.get("deck_name"),
-                    tags=tags,
-                )
-            except Exception:
-                continue
-            self.items.append(item)
+            item = ResourceItem.from_dict(obj)
+            if item is not None:
+                self.items.append(item)
         self._refresh_table(self.items)
 
     def _refresh_table(self, items: List[ResourceItem]) -> None:
+        # Re-sorting while rows are being filled would move half-built rows
+        # around; sort once at the end instead.
+        self.table.setSortingEnabled(False)
         self.table.setRowCount(len(items))
         self._row_ids = []
         for row, item in enumerate(items):
@@ -376,14 +419,54 @@ class ResourcesView(QWidget):
                     cell.setToolTip(tags_str)
                 self.table.setItem(row, col, cell)
 
+            self._set_activity_cell(row, item)
             self._row_ids.append(item.id)
 
+        self.table.setSortingEnabled(True)
+
+    def _set_activity_cell(self, row: int, item: ResourceItem) -> None:
+        """Show cached review/due counts for the resource's deck."""
+
+        activity = get_deck_activity(item.deck_name)
+        if activity is None:
+            cell = _ActivityItem("", (-1, -1))
+        else:
+            cell = _ActivityItem(
+                f"{activity.reviews} rev · {activity.due} due", activity.sort_key()
+            )
+            cell.setToolTip(
+                f"{activity.reviews} reviews in the last {REVIEW_WINDOW_DAYS} days, "
+                f"{activity.due} cards due now (including subdecks)"
+            )
+        cell.setData(Qt.ItemDataRole.UserRole, item.id)
+        cell.setFlags(cell.flags() & ~Qt.ItemFlag.ItemIsEditable)
+        self.table.setItem(row, self._ACTIVITY_COLUMN, cell)
+
+    def _refresh_activity_column(self) -> None:
+        """Update only the Activity cells after new deck stats arrive."""
+
+        by_id = {item.id: item for item in self.items}
+        self.table.setSortingEnabled(False)
+        for row in range(self.table.rowCount()):
+            cell = self.table.item(row, 1)
+            res_id = cell.data(Qt.ItemDataRole.UserRole) if cell is not None else None
+            item = by_id.get(res_id) if res_id else None
+            if item is not None:
+                self._set_activity_cell(row, item)
+        self.table.setSortingEnabled(True)
+
+    def refresh_deck_activity(self) -> None:
+        """Public hook: re-query decks touched by reviews since last time."""
+
+        request_deck_activity_refresh()
+
     def _on_add(self) -> None:
         dialog = ResourceDialog(self, theme_colors=self._theme_colors)
         if dialog.exec():
             item = dialog.to_item()
             self.items.append(item)
-            save_resources(self.items)
+            with get_data_bus().publishing(self):
+                save_resources(self.items)
             self._apply_filter_and_refresh()
 
     def _selected_index(self) -> Optional[int]:
@@ -404,7 +487,8 @@ class ResourcesView(QWidget):
         dialog = ResourceDialog(self, item, theme_colors=self._theme_colors)
         if dialog.exec():
             self.items[index] = dialog.to_item()
-            save_resources(self.items)
+            with get_data_bus().publishing(self):
+                save_resources(self.items)
             self._apply_filter_and_refresh()
 
     def _on_delete(self) -> None:
@@ -412,7 +496,8 @@ class ResourcesView(QWidget):
         if index is None:
             return
         del self.items[index]
-        save_resources(self.items)
+        with get_data_bus().publishing(self):
+            save_resources(self.items)
         self._apply_filter_and_refresh()
 
     def _on_cell_double_clicked(self, row: int, column: int) -> None:
@@ -550,15 +635,21 @@ class ResourcesView(QWidget):
 
     def _open_deck(self, deck_name: str) -> None:
         try:
-            deck = mw.col.decks.byName(deck_name)
-            if not deck:
+            deck_id = get_deck_id(deck_name)
+            if deck_id is None:
+                # The deck may have been created or renamed by a change the
+                # cache's invalidation hooks did not see: reload once.
+                invalidate_deck_cache()
+                deck_id = get_deck_id(deck_name)
+            if deck_id is None:
                 return
-            mw.col.decks.select(deck["id"])
+            mw.col.decks.select(deck_id)
             mw.reset()
         except Exception:
             # Fail silently if deck cannot be opened.
             return
 
+    @timed()
     def apply_theme(self, colors: 'ThemeColors') -> None:
         """Apply theme colors to resources view components."""
         self._theme_colors = colors
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Callable, Optional, TYPE_CHECKING
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..core.themes import ThemeColors
@@ -19,9 +21,27 @@ from aqt.qt import (
     QPushButton,
     QInputDialog,
     QMessageBox,
+    QShortcut,
+    QKeySequence,
+    QTimer,
+    QFileDialog,
 )
 
+from ..core.codec import FORMATS, get_format_display_name
+from ..core.logic_archive import (
+    ArchiveCancelled,
+    ArchiveError,
+    export_archive,
+    export_csv,
+    read_manifest,
+    restore_archive,
+)
+from ..core.logic_aggregate import invalidate_profile_summaries
+from ..core.logic_import import ImportReport, read_resources_file, read_tracker_file
+from ..core.logic_resources import add_resources
 from ..core.logic_settings import load_settings, save_settings, Settings
+from ..core.logic_summary import ProfileStats, peek_profile_stats
+from ..core.logic_tracker import merge_daily_activity
 from ..core.themes import get_all_theme_names, get_theme_display_name
 from ..core.logic_profiles import (
     list_profiles,
@@ -29,8 +49,17 @@ from ..core.logic_profiles import (
     delete_profile,
     rename_profile,
     get_active_profile_id,
+    register_profile,
     MAX_PROFILE_NAME_LENGTH,
 )
+from ..core import perf
+from ..core.io_stats import get_file_stats
+from ..core.perf import timed
+from ..core.storage import convert_profile_files, export_profile_json, get_data_dir
+from .widgets import run_with_progress
+
+
+_IMPORT_FILTER = "CSV or JSON lines (*.csv *.tsv *.txt *.jsonl *.ndjson *.json);;All files (*)"
 
 
 class SettingsView(QWidget):
@@ -90,6 +119,84 @@ class SettingsView(QWidget):
 
         layout.addWidget(startup_group)
 
+        # Storage section ----------------------------------------------
+        storage_group = QGroupBox("Storage", self)
+        storage_layout = QVBoxLayout(storage_group)
+
+        storage_desc = QLabel(
+            "Compact JSON is the fastest to save and load; compact binary "
+            "gives the smallest files. Files in any format are read back "
+            "automatically, and readable JSON can always be exported.",
+            storage_group,
+        )
+        storage_desc.setWordWrap(True)
+        storage_layout.addWidget(storage_desc)
+
+        format_row = QHBoxLayout()
+        format_row.addWidget(QLabel("File format", storage_group))
+        self.storage_format_combo = QComboBox(storage_group)
+        self.storage_format_combo.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        for fmt in FORMATS:
+            self.storage_format_combo.addItem(get_format_display_name(fmt))
+        format_row.addWidget(self.storage_format_combo, 1)
+        storage_layout.addLayout(format_row)
+
+        export_row = QHBoxLayout()
+        self.export_json_btn = QPushButton("📤 Export readable JSON…", storage_group)
+        export_row.addWidget(self.export_json_btn)
+        export_row.addStretch(1)
+        storage_layout.addLayout(export_row)
+
+        layout.addWidget(storage_group)
+
+        # Import section -----------------------------------------------
+        import_group = QGroupBox("Import", self)
+        import_layout = QVBoxLayout(import_group)
+
+        import_desc = QLabel(
+            "Bring in history from a spreadsheet or another tracker (CSV or "
+            "JSON lines) into the active profile. Practice rows use a date "
+            "column plus either one column per skill or a skill column; "
+            "resource rows need a name. Existing entries are kept.",
+            import_group,
+        )
+        import_desc.setWordWrap(True)
+        import_layout.addWidget(import_desc)
+
+        import_buttons = QHBoxLayout()
+        self.import_tracker_btn = QPushButton("📥 Import practice history…", import_group)
+        self.import_resources_btn = QPushButton("📥 Import resources…", import_group)
+        import_buttons.addWidget(self.import_tracker_btn)
+        import_buttons.addWidget(self.import_resources_btn)
+        import_buttons.addStretch(1)
+        import_layout.addLayout(import_buttons)
+
+        layout.addWidget(import_group)
+
+        # Backup section -----------------------------------------------
+        backup_group = QGroupBox("Backup & Export", self)
+        backup_layout = QVBoxLayout(backup_group)
+
+        backup_desc = QLabel(
+            "Save every profile to one compressed archive and restore it "
+            "later, or export the active profile as one CSV file per dataset.",
+            backup_group,
+        )
+        backup_desc.setWordWrap(True)
+        backup_layout.addWidget(backup_desc)
+
+        backup_buttons = QHBoxLayout()
+        self.export_archive_btn = QPushButton("🗄️ Export archive…", backup_group)
+        self.restore_archive_btn = QPushButton("♻️ Restore archive…", backup_group)
+        self.export_csv_btn = QPushButton("📄 Export CSV…", backup_group)
+        backup_buttons.addWidget(self.export_archive_btn)
+        backup_buttons.addWidget(self.restore_archive_btn)
+        backup_buttons.addWidget(self.export_csv_btn)
+        backup_buttons.addStretch(1)
+        backup_layout.addLayout(backup_buttons)
+
+        layout.addWidget(backup_group)
+
         # Profile Management section -----------------------------------
         profiles_group = QGroupBox("Profile Management", self)
         profiles_layout = QVBoxLayout(profiles_group)
@@ -120,8 +227,17 @@ class SettingsView(QWidget):
         profiles_layout.addLayout(profile_buttons)
         
         layout.addWidget(profiles_group)
+
+        # Diagnostics section (hidden; Ctrl+Shift+D toggles it) ----------
+        self.diagnostics_group = self._build_diagnostics_group()
+        self.diagnostics_group.setVisible(False)
+        layout.addWidget(self.diagnostics_group)
         layout.addStretch(1)
 
+        diagnostics_shortcut = QShortcut(QKeySequence("Ctrl+Shift+D"), self)
+        diagnostics_shortcut.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+        diagnostics_shortcut.activated.connect(self._toggle_diagnostics)
+
         # Wire up initial values & signals
         self._load_into_widgets()
         self._connect_signals()
@@ -163,10 +279,21 @@ class SettingsView(QWidget):
         # Startup
         self.open_on_startup_checkbox.setChecked(self._settings.open_on_startup)
 
+        # Storage
+        fmt = self._settings.storage_format
+        self.storage_format_combo.setCurrentIndex(FORMATS.index(fmt) if fmt in FORMATS else 0)
+
     def _connect_signals(self) -> None:
         self.theme_combo.currentIndexChanged.connect(self._on_theme_changed)
         self.font_spin.valueChanged.connect(self._on_font_size_changed)
         self.open_on_startup_checkbox.toggled.connect(self._on_open_on_startup_toggled)
+        self.storage_format_combo.currentIndexChanged.connect(self._on_storage_format_changed)
+        self.export_json_btn.clicked.connect(self._on_export_json)
+        self.import_tracker_btn.clicked.connect(self._on_import_tracker)
+        self.import_resources_btn.clicked.connect(self._on_import_resources)
+        self.export_archive_btn.clicked.connect(self._on_export_archive)
+        self.restore_archive_btn.clicked.connect(self._on_restore_archive)
+        self.export_csv_btn.clicked.connect(self._on_export_csv)
         
         # Profile management signals
         self.add_profile_btn.clicked.connect(self._on_add_profile)
@@ -189,10 +316,347 @@ class SettingsView(QWidget):
         self._settings.open_on_startup = checked
         save_settings(self._settings)
 
+    def _on_storage_format_changed(self, index: int) -> None:
+        if not 0 <= index < len(FORMATS):
+            return
+        self._settings.storage_format = FORMATS[index]
+        save_settings(self._settings)
+        # Rewrite existing files now so the new format takes effect for the
+        # whole profile, not only for documents saved from here on. Loads
+        # detect each file's format, so a cancel leaves a usable mix.
+        fmt = FORMATS[index]
+        profile_ids = [profile["id"] for profile in list_profiles()]
+
+        def task(progress):
+            converted = 0
+            for done, profile_id in enumerate(profile_ids):
+                if not progress(done, len(profile_ids)):
+                    return converted, True
+                converted += convert_profile_files(profile_id, fmt)
+            return converted, False
+
+        def done(result) -> None:
+            converted, cancelled = result
+            text = f"Converted {converted} file(s) to {get_format_display_name(fmt)}"
+            if cancelled:
+                text += " (cancelled; the remaining files convert when next saved)"
+            main_window = self._get_main_window()
+            if main_window:
+                main_window.set_status(text)
+            QMessageBox.information(self, "Storage format", text + ".")
+
+        run_with_progress(self, "Converting profile files…", task, done)
+
+    def _on_export_json(self) -> None:
+        target = QFileDialog.getExistingDirectory(self, "Export profile as readable JSON")
+        if not target:
+            return
+        profile_id = get_active_profile_id()
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        written = export_profile_json(profile_id, Path(target) / f"languageforge-{profile_id}-{stamp}")
+        if written:
+            QMessageBox.information(
+                self,
+                "Export complete",
+                f"Exported {len(written)} file(s) to {written[0].parent}",
+            )
+        else:
+            QMessageBox.warning(self, "Export", "Nothing was exported.")
+
+    def _on_import_tracker(self) -> None:
+        path, _ = QFileDialog.getOpenFileName(self, "Import practice history", "", _IMPORT_FILTER)
+        if not path:
+            return
+
+        def done(result) -> None:
+            masks, report = result
+            changed = 0 if report.cancelled else merge_daily_activity(masks)
+            self._show_import_report(
+                "Import practice history", report, f"{changed:,} day(s) updated."
+            )
+
+        run_with_progress(
+            self,
+            "Importing practice history…",
+            lambda progress: read_tracker_file(Path(path), progress),
+            done,
+        )
+
+    def _on_import_resources(self) -> None:
+        path, _ = QFileDialog.getOpenFileName(self, "Import resources", "", _IMPORT_FILTER)
+        if not path:
+            return
+
+        def done(result) -> None:
+            items, report = result
+            added = 0 if report.cancelled else add_resources(items)
+            duplicates = len(items) - added if not report.cancelled else 0
+            detail = f"{added:,} resource(s) added"
+            if duplicates:
+                detail += f", {duplicates:,} already present"
+            self._show_import_report("Import resources", report, detail + ".")
+
+        run_with_progress(
+            self,
+            "Importing resources…",
+            lambda progress: read_resources_file(Path(path), progress),
+            done,
+        )
+
+    def _show_import_report(self, title: str, report: ImportReport, detail: str) -> None:
+        if report.cancelled:
+            QMessageBox.information(self, title, "Import cancelled; nothing was changed.")
+            return
+        text = f"{report.summary()}.\n{detail}"
+        if report.errors:
+            shown = report.errors[:10]
+            text += "\n\nSkipped rows:\n" + "\n".join(shown)
+            if report.error_count > len(shown):
+                text += f"\n… and {report.error_count - len(shown):,} more"
+        QMessageBox.information(self, title, text)
+
+    def _on_export_archive(self) -> None:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export archive",
+            str(Path.home() / f"languageforge-backup-{stamp}.zip"),
+            "Zip archives (*.zip)",
+        )
+        if not path:
+            return
+        profiles = list_profiles()
+
+        def task(progress):
+            try:
+                return export_archive(Path(path), profiles, progress)
+            except ArchiveCancelled:
+                return None
+
+        def done(count) -> None:
+            if count is not None:
+                QMessageBox.information(
+                    self,
+                    "Export archive",
+                    f"Saved {len(profiles)} profile(s), {count} file(s), to {path}",
+                )
+
+        run_with_progress(self, "Exporting archive…", task, done)
+
+    def _on_restore_archive(self) -> None:
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Restore archive", "", "Zip archives (*.zip);;All files (*)"
+        )
+        if not path:
+            return
+        try:
+            manifest = read_manifest(Path(path))
+        except ArchiveError as exc:
+            QMessageBox.warning(self, "Restore archive", str(exc))
+            return
+
+        names = [p.get("display_name", p["id"]) for p in manifest.get("profiles", [])]
+        reply = QMessageBox.question(
+            self,
+            "Restore archive",
+            f"Restore {len(names)} profile(s) from the archive created "
+            f"{manifest.get('created', '?')}?\n\n{', '.join(names)}\n\n"
+            "Their current data will be replaced. Other profiles are not touched.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No,
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+
+        def task(progress):
+            try:
+                return restore_archive(Path(path), progress)
+            except ArchiveCancelled:
+                return None
+
+        def done(profiles) -> None:
+            if profiles is None:
+                return
+            failed = [
+                profile.get("display_name", profile["id"])
+                for profile in profiles
+                if not register_profile(profile["id"], profile.get("display_name", profile["id"]))
+            ]
+            invalidate_profile_summaries(profile["id"] for profile in profiles)
+            self._load_profile_list()
+            main_window = self._get_main_window()
+            if main_window:
+                main_window._populate_profile_combo()
+                # Drops cached documents so every view reloads from disk.
+                main_window._reload_all_views_for_profile()
+                main_window.set_status(
+                    f"Restored {len(profiles) - len(failed)} profile(s) from archive"
+                )
+            if failed:
+                QMessageBox.warning(
+                    self,
+                    "Restore archive",
+                    f"Restored {len(profiles) - len(failed)} of {len(profiles)} profile(s). "
+                    f"These could not be added to the profile list: {', '.join(failed)}.\n\n"
+                    "Their files were restored on disk.",
+                )
+            else:
+                QMessageBox.information(
+                    self, "Restore archive", f"Restored {len(profiles)} profile(s)."
+                )
+
+        run_with_progress(self, "Restoring archive…", task, done)
+
+    def _on_export_csv(self) -> None:
+        target = QFileDialog.getExistingDirectory(self, "Export CSV files")
+        if not target:
+            return
+        profile_id = get_active_profile_id()
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        target_dir = Path(target) / f"languageforge-{profile_id}-{stamp}"
+
+        def task(progress):
+            try:
+                return export_csv(target_dir, profile_id, progress)
+            except ArchiveCancelled:
+                return None
+
+        def done(written) -> None:
+            if written is not None:
+                QMessageBox.information(
+                    self, "Export CSV", f"Exported {len(written)} file(s) to {target_dir}"
+                )
+
+        run_with_progress(self, "Exporting CSV…", task, done)
+
     def _apply_theme(self) -> None:
         if self._apply_theme_callback is not None:
             self._apply_theme_callback(self._settings)
     
+    # -----------------------------------------------------------------
+    # Diagnostics
+    # -----------------------------------------------------------------
+    def _build_diagnostics_group(self) -> QGroupBox:
+        group = QGroupBox("Diagnostics", self)
+        group_layout = QVBoxLayout(group)
+
+        desc = QLabel(
+            "Timings of storage, theme, font and month loads. Recording "
+            "adds a little overhead, so leave it off normally. File I/O is "
+            "always counted; slow or failed operations are logged to "
+            "io_log.jsonl in the profile folder.",
+            group,
+        )
+        desc.setWordWrap(True)
+        group_layout.addWidget(desc)
+
+        self.record_timings_checkbox = QCheckBox("Record timings", group)
+        self.record_timings_checkbox.setChecked(perf.is_enabled())
+        self.record_timings_checkbox.toggled.connect(self._on_record_timings_toggled)
+        group_layout.addWidget(self.record_timings_checkbox)
+
+        self.diagnostics_label = QLabel("", group)
+        self.diagnostics_label.setTextInteractionFlags(
+            Qt.TextInteractionFlag.TextSelectableByMouse
+        )
+        self.diagnostics_label.setStyleSheet("QLabel { font-family: monospace; }")
+        group_layout.addWidget(self.diagnostics_label)
+
+        buttons = QHBoxLayout()
+        refresh_btn = QPushButton("Refresh", group)
+        reset_btn = QPushButton("Reset", group)
+        self.profile_capture_btn = QPushButton("Start cProfile", group)
+        refresh_btn.clicked.connect(self._refresh_diagnostics)
+        reset_btn.clicked.connect(self._on_reset_diagnostics)
+        self.profile_capture_btn.clicked.connect(self._on_profile_capture_clicked)
+        buttons.addWidget(refresh_btn)
+        buttons.addWidget(reset_btn)
+        buttons.addWidget(self.profile_capture_btn)
+        buttons.addStretch(1)
+        group_layout.addLayout(buttons)
+
+        self.diagnostics_status = QLabel("", group)
+        self.diagnostics_status.setWordWrap(True)
+        self.diagnostics_status.setTextInteractionFlags(
+            Qt.TextInteractionFlag.TextSelectableByMouse
+        )
+        group_layout.addWidget(self.diagnostics_status)
+
+        # Rolling view while the panel is open.
+        self._diagnostics_timer = QTimer(self)
+        self._diagnostics_timer.setInterval(1000)
+        self._diagnostics_timer.timeout.connect(self._refresh_diagnostics)
+        return group
+
+    def _toggle_diagnostics(self) -> None:
+        visible = self.diagnostics_group.isHidden()
+        self.diagnostics_group.setVisible(visible)
+        if visible:
+            self._refresh_diagnostics()
+            self._diagnostics_timer.start()
+        else:
+            self._diagnostics_timer.stop()
+
+    def _on_record_timings_toggled(self, checked: bool) -> None:
+        perf.set_enabled(checked)
+        self._refresh_diagnostics()
+
+    def _on_reset_diagnostics(self) -> None:
+        perf.reset()
+        self._refresh_diagnostics()
+
+    def _refresh_diagnostics(self) -> None:
+        rows = perf.span_stats()
+        if not rows:
+            text = "No timings recorded yet." if perf.is_enabled() else "Recording is off."
+        else:
+            lines = [f"{'span':<40}{'calls':>7}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}  (ms)"]
+            for name, calls, p50, p90, p99, worst in rows:
+                lines.append(
+                    f"{name[:39]:<40}{calls:>7}{p50:>9.2f}{p90:>9.2f}{p99:>9.2f}{worst:>9.2f}"
+                )
+            text = "\n".join(lines)
+        counters = perf.counters()
+        if counters:
+            text += "\n\n" + "\n".join(
+                f"{name:<40}{value:>12,}" for name, value in sorted(counters.items())
+            )
+        file_stats = get_file_stats()
+        if file_stats:
+            lines = [f"{'file':<22}{'reads':>6}{'writes':>7}{'KiB in':>9}{'KiB out':>9}{'ms r/w':>14}{'errors':>7}"]
+            for name, st in sorted(file_stats.items()):
+                ms = f"{st.read_ms:.0f}/{st.write_ms:.0f}"
+                lines.append(
+                    f"{name[:21]:<22}{st.reads:>6}{st.writes:>7}{st.bytes_read / 1024:>9.1f}"
+                    f"{st.bytes_written / 1024:>9.1f}{ms:>14}{st.errors:>7}"
+                )
+                if st.writers:
+                    writers = ", ".join(
+                        f"{caller} ×{n}"
+                        for caller, n in sorted(st.writers.items(), key=lambda kv: -kv[1])[:3]
+                    )
+                    lines.append(f"  written by {writers}")
+                if st.last_error:
+                    lines.append(f"  last error: {st.last_error}")
+            text += "\n\n" + "\n".join(lines)
+        if self.diagnostics_label.text() != text:
+            self.diagnostics_label.setText(text)
+
+    def _on_profile_capture_clicked(self) -> None:
+        if not perf.is_profiling():
+            perf.start_profiler()
+            self.profile_capture_btn.setText("Stop && Save cProfile")
+            self.diagnostics_status.setText("cProfile capture running…")
+            return
+
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        path = perf.stop_profiler(get_data_dir() / f"languageforge-{stamp}.prof")
+        self.profile_capture_btn.setText("Start cProfile")
+        if path is None:
+            self.diagnostics_status.setText("Could not write the cProfile capture.")
+        else:
+            self.diagnostics_status.setText(f"cProfile capture saved to {path}")
+
     # -----------------------------------------------------------------
     # Profile management
     # -----------------------------------------------------------------
@@ -206,11 +670,15 @@ class SettingsView(QWidget):
             widget = widget.parent()
         return None
     
+    # Item role holding the label without the stats suffix.
+    _PROFILE_LABEL_ROLE = Qt.ItemDataRole.UserRole + 1
+
     def _load_profile_list(self) -> None:
         """Load all profiles into the list widget."""
         self.profile_list.clear()
         profiles = list_profiles()
         active_id = get_active_profile_id()
+        stale = []
         
         for profile in profiles:
             profile_id = profile["id"]
@@ -218,15 +686,39 @@ class SettingsView(QWidget):
             
             # Mark active profile
             if profile_id == active_id:
-                item_text = f"{display_name} ⭐ (active)"
+                label = f"{display_name} ⭐ (active)"
             else:
-                item_text = display_name
+                label = display_name
+            # Streak, goals and resources from the profile's summary sidecar,
+            # as it is; stale ones are rebuilt in the background.
+            stats, is_stale = peek_profile_stats(profile_id)
+            if is_stale:
+                stale.append(profile_id)
             
-            self.profile_list.addItem(item_text)
+            self.profile_list.addItem(self._profile_item_text(label, stats))
             # Store profile ID in item data
-            self.profile_list.item(self.profile_list.count() - 1).setData(
-                Qt.ItemDataRole.UserRole, profile_id
-            )
+            item = self.profile_list.item(self.profile_list.count() - 1)
+            item.setData(Qt.ItemDataRole.UserRole, profile_id)
+            item.setData(self._PROFILE_LABEL_ROLE, label)
+
+        main_window = self._get_main_window()
+        if main_window and hasattr(main_window, "rebuild_profile_stats"):
+            main_window.rebuild_profile_stats(stale)
+
+    @staticmethod
+    def _profile_item_text(label: str, stats: Optional[ProfileStats]) -> str:
+        summary = stats.describe() if stats is not None else "updating summary…"
+        return f"{label}  —  {summary}"
+
+    def show_profile_stats(self, stats: Dict[str, ProfileStats]) -> None:
+        """Update list entries with freshly rebuilt profile summaries."""
+        for i in range(self.profile_list.count()):
+            item = self.profile_list.item(i)
+            profile_stats = stats.get(item.data(Qt.ItemDataRole.UserRole))
+            if profile_stats is not None:
+                item.setText(
+                    self._profile_item_text(item.data(self._PROFILE_LABEL_ROLE), profile_stats)
+                )
     
     def _on_add_profile(self) -> None:
         """Handle adding a new profile."""
@@ -319,6 +811,7 @@ class SettingsView(QWidget):
         success, message = delete_profile(profile_id)
         
         if success:
+            invalidate_profile_summaries([profile_id])
             self._load_profile_list()
             # Refresh profile combo in main window
             main_window = self._get_main_window()
@@ -328,11 +821,14 @@ class SettingsView(QWidget):
         else:
             QMessageBox.warning(self, "Error", message)
     
+    @timed()
     def apply_theme(self, colors: 'ThemeColors') -> None:
         """Apply theme colors to settings view components."""
-        # Update theme combo styling
-        if hasattr(self, 'theme_combo'):
-            self.theme_combo.setStyleSheet(
+        # Update combo styling (theme and storage format)
+        for combo in (getattr(self, 'theme_combo', None), getattr(self, 'storage_format_combo', None)):
+            if combo is None:
+                continue
+            combo.setStyleSheet(
                 f"QComboBox {{"
                 f"  border: 1px solid {colors.input_border};"
                 f"  border-radius: 4px;"
@@ -19,13 +19,23 @@ from aqt.qt import (
     QFrame,
 )
 
-from ..core.logic_tracker import load_daily_activity, save_daily_activity
+from ..core.logic_tracker import (
+    TRACKER_DOCUMENT,
+    is_skill_done,
+    load_daily_activity,
+    save_daily_activity,
+    toggle_skill,
+)
 from ..core.models import DailyActivity
-from .widgets import CircleIndicator, get_skill_emoji, get_skill_label
+from ..core.skills import SKILLS, mask_has
+from ..core.perf import timed
+from .data_bus import get_data_bus
+from .widgets import CircleIndicator, suspended_updates
 
 
 class TrackerView(QWidget):
-    skills = ["reading", "listening", "speaking", "writing"]
+    # One row per registered skill, in registry order
+    skills = SKILLS
 
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -115,11 +125,17 @@ class TrackerView(QWidget):
         self._populate_months()
         self.month_combo.currentTextChanged.connect(self._on_month_changed)
 
+        # Days ticked elsewhere (e.g. the dashboard week) arrive via the data
+        # bus; while hidden we only note that the grid is stale.
+        self._stale = False
+        get_data_bus().documentChanged.connect(self._on_document_changed)
+
         self._load_month()
 
     def refresh_from_storage(self) -> None:
         """Reload daily activity from storage and refresh the current month view."""
 
+        self._stale = False
         self.activity = load_daily_activity()
         # Rebuild the month list (in case new months were added) and keep
         # the currently selected month when possible.
@@ -130,6 +146,25 @@ class TrackerView(QWidget):
             self.month_combo.setCurrentIndex(idx)
         self._load_month()
 
+    def _on_document_changed(self, document: str, keys, origin) -> None:
+        if document != TRACKER_DOCUMENT or origin is self:
+            return
+        month = self.month_combo.currentText() or self._current_month_str()
+        if keys is not None and not any(key.startswith(month) for key in keys):
+            # Only other months changed: keep the data current, the visible
+            # grid is unaffected.
+            self.activity = load_daily_activity()
+            return
+        if self.isVisible():
+            self.refresh_from_storage()
+        else:
+            self._stale = True
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        if self._stale:
+            self.refresh_from_storage()
+
     # --------------------
     # Monthly helpers
     # --------------------
@@ -158,7 +193,14 @@ class TrackerView(QWidget):
     def _on_month_changed(self, _text: str) -> None:
         self._load_month()
 
+    @timed()
     def _load_month(self) -> None:
+        # The month grid is rebuilt from scratch (hundreds of widgets), so
+        # lay it out and paint it once at the end.
+        with suspended_updates(self):
+            self._build_month_grid()
+
+    def _build_month_grid(self) -> None:
         month = self.month_combo.currentText() or self._current_month_str()
         year, month_num = map(int, month.split("-"))
         days_in_month = monthrange(year, month_num)[1]
@@ -257,9 +299,7 @@ class TrackerView(QWidget):
 
                 # Emoji + label in column 0 for this skill/week, so users can
                 # read the meaning without a separate legend.
-                emoji = get_skill_emoji(skill)
-                skill_name = get_skill_label(skill)
-                emoji_label = QLabel(f"{emoji} {skill_name}", week_card)
+                emoji_label = QLabel(f"{skill.emoji} {skill.label}", week_card)
                 emoji_label.setAlignment(
                     Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft
                 )
@@ -280,8 +320,7 @@ class TrackerView(QWidget):
                         continue
 
                     day_str = date(year, month_num, day_num).strftime("%Y-%m-%d")
-                    day_data = self.activity.get(day_str, {})
-                    done = bool(day_data.get(skill, False))
+                    done = is_skill_done(self.activity, day_str, skill.index)
                     # Slightly smaller circles so the monthly rows sit tighter
                     # together vertically.
                     indicator = CircleIndicator(
@@ -289,21 +328,18 @@ class TrackerView(QWidget):
                     )
 
                     def make_handler(
-                        d_str: str, s: str, w: CircleIndicator
+                        d_str: str, s: int, w: CircleIndicator
                     ) -> None:
                         def _on_clicked() -> None:
-                            day_data_inner = self.activity.setdefault(
-                                d_str, {sk: False for sk in self.skills}
-                            )
-                            new_val = not bool(day_data_inner.get(s, False))
-                            day_data_inner[s] = new_val
-                            save_daily_activity(self.activity)
+                            new_val = toggle_skill(self.activity, d_str, s)
+                            with get_data_bus().publishing(self):
+                                save_daily_activity(self.activity)
                             w.set_completed(new_val)
                             self._update_month_stats()
 
                         return _on_clicked
 
-                    indicator.clicked.connect(make_handler(day_str, skill, indicator))
+                    indicator.clicked.connect(make_handler(day_str, skill.index, indicator))
                     week_layout.addWidget(indicator, row, col + 1)
 
             self.grid_layout.addWidget(week_card)
@@ -319,37 +355,35 @@ class TrackerView(QWidget):
         active_days = 0
         longest_streak = 0
         current_streak = 0
-        per_skill_counts = {s: 0 for s in self.skills}
+        per_skill_counts = [0] * len(self.skills)
 
         for day in range(1, days_in_month + 1):
             day_str = date(year, month_num, day).strftime("%Y-%m-%d")
-            day_data = self.activity.get(day_str, {})
-            any_active = any(bool(day_data.get(s, False)) for s in self.skills)
-            if any_active:
+            mask = self.activity.get(day_str, 0)
+            if mask:
                 active_days += 1
                 current_streak += 1
                 longest_streak = max(longest_streak, current_streak)
+                for s in self.skills:
+                    if mask_has(mask, s.index):
+                        per_skill_counts[s.index] += 1
             else:
                 current_streak = 0
-            for s in self.skills:
-                if bool(day_data.get(s, False)):
-                    per_skill_counts[s] += 1
 
         if days_in_month == 0:
             days_in_month = 1
-        per_skill_pct = {
-            s: int(100 * per_skill_counts[s] / days_in_month) for s in self.skills
-        }
 
         lines = [
             f"Active days: {active_days} / {days_in_month}",
             f"Longest streak: {longest_streak} days",
         ]
         lines.extend(
-            f"{s.capitalize()}: {per_skill_pct[s]}%" for s in self.skills
+            f"{s.label}: {int(100 * per_skill_counts[s.index] / days_in_month)}%"
+            for s in self.skills
         )
         self.month_stats_label.setText("\n".join(lines))
 
+    @timed()
     def apply_theme(self, colors: 'ThemeColors') -> None:
         """Apply theme colors to tracker view components."""
         self._theme_colors = colors
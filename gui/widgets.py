@@ -1,8 +1,24 @@
 from __future__ import annotations
 
-from typing import Optional, TYPE_CHECKING
-
-from aqt.qt import QWidget, QSize, QPainter, QColor, QPen, Qt, QCursor, pyqtSignal
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, TYPE_CHECKING
+
+from aqt import mw
+from aqt.qt import (
+    QObject,
+    QWidget,
+    QSize,
+    QPainter,
+    QColor,
+    QPen,
+    Qt,
+    QCursor,
+    QMessageBox,
+    QProgressDialog,
+    pyqtSignal,
+)
+
+from ..core.skills import get_skill
 
 if TYPE_CHECKING:
     from ..core.themes import ThemeColors
@@ -121,24 +137,82 @@ class CircleIndicator(QWidget):
             pass
 
 
-_SKILL_EMOJIS = {
-    "reading": "📖",
-    "listening": "🎧",
-    "speaking": "🗣️",
-    "writing": "✍️",
-}
-
-_SKILL_LABELS = {
-    "reading": "Reading",
-    "listening": "Listening",
-    "speaking": "Speaking",
-    "writing": "Writing",
-}
-
-
 def get_skill_emoji(skill: str) -> str:
-    return _SKILL_EMOJIS.get(skill, "")
+    entry = get_skill(skill)
+    return entry.emoji if entry is not None else ""
 
 
 def get_skill_label(skill: str) -> str:
-    return _SKILL_LABELS.get(skill, skill.capitalize())
+    entry = get_skill(skill)
+    return entry.label if entry is not None else skill.capitalize()
+
+
+@contextmanager
+def suspended_updates(widget: QWidget, *quiet: QObject) -> Iterator[None]:
+    """Batch a burst of widget changes under ``widget``.
+
+    ``widget``'s layout is disabled for the duration of the block and
+    activated once at the end, and signals from ``widget`` and every object
+    in ``quiet`` are blocked. Painting is left alone on purpose: Qt already
+    holds paints until control returns to the event loop, and
+    ``setUpdatesEnabled(True)`` would repaint the whole subtree instead of
+    just what changed (see benchmarks/bench_layout.py). Nesting is safe;
+    inner blocks leave the state they found in place.
+    """
+
+    layout = widget.layout()
+    layout_enabled = layout is not None and layout.isEnabled()
+    blocked = [(obj, obj.blockSignals(True)) for obj in (widget, *quiet)]
+    if layout_enabled:
+        layout.setEnabled(False)
+    try:
+        yield
+    finally:
+        for obj, was_blocked in reversed(blocked):
+            obj.blockSignals(was_blocked)
+        if layout_enabled:
+            layout.setEnabled(True)
+            layout.activate()
+
+
+def run_with_progress(
+    parent: QWidget,
+    label: str,
+    task: Callable[[Callable[[int, int], bool]], Any],
+    on_done: Callable[[Any], None],
+) -> None:
+    """Run ``task(progress)`` on a background thread behind a progress dialog.
+
+    ``task`` must not touch widgets or the document store; it reports with
+    ``progress(done, total)``, which returns False once the user cancelled.
+    ``on_done(result)`` runs on the main thread afterwards (also after a
+    cancel, so partial work can be reported); if ``task`` raised, a warning
+    is shown instead.
+    """
+
+    dialog = QProgressDialog(label, "Cancel", 0, 1000, parent)
+    dialog.setWindowModality(Qt.WindowModality.WindowModal)
+    dialog.setMinimumDuration(300)
+    dialog.setValue(0)
+    cancelled = [False]
+    dialog.canceled.connect(lambda: cancelled.__setitem__(0, True))
+
+    def show_progress(done: int, total: int) -> None:
+        if total > 0 and not cancelled[0]:
+            dialog.setValue(min(999, int(done * 1000 / total)))
+
+    def progress(done: int, total: int) -> bool:
+        mw.taskman.run_on_main(lambda: show_progress(done, total))
+        return not cancelled[0]
+
+    def finished(future) -> None:
+        dialog.reset()
+        dialog.deleteLater()
+        try:
+            result = future.result()
+        except Exception as exc:
+            QMessageBox.warning(parent, "LanguageForge", f"{label.rstrip('…')} failed:\n{exc}")
+            return
+        on_done(result)
+
+    mw.taskman.run_in_background(lambda: task(progress), finished)
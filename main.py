@@ -7,6 +7,8 @@ from .gui.main_window import LanguageForgeWindow
 from .core.logic_dailyplan import load_daily_plan
 from .core.logic_settings import load_settings
 from .core.logic_profiles import initialize_profiles_system
+from .core.logic_decks import invalidate_deck_cache
+from .core.logic_deck_stats import invalidate_deck_activity, on_card_answered
 
 _ff_dock: Optional[QDockWidget] = None
 _ff_widget: Optional[LanguageForgeWindow] = None
@@ -66,6 +68,33 @@ def init_addon() -> None:
 
     gui_hooks.main_window_did_init.append(_maybe_show_on_startup)
 
+    # Keep the cached deck-name list and deck activity stats in sync with
+    # the collection: drop them whenever a (new) collection is loaded, a
+    # sync finishes, or an operation changes decks. Reviews only mark the
+    # answered card's deck for an incremental re-query.
+    def _invalidate_deck_caches() -> None:
+        invalidate_deck_cache()
+        invalidate_deck_activity()
+
+    try:
+        gui_hooks.collection_did_load.append(lambda _col: _invalidate_deck_caches())
+        if hasattr(gui_hooks, "operation_did_execute"):
+            def _on_operation_did_execute(changes, _handler) -> None:
+                if getattr(changes, "deck", True):
+                    _invalidate_deck_caches()
+
+            gui_hooks.operation_did_execute.append(_on_operation_did_execute)  # type: ignore[attr-defined]
+        if hasattr(gui_hooks, "sync_did_finish"):
+            gui_hooks.sync_did_finish.append(_invalidate_deck_caches)  # type: ignore[attr-defined]
+        if hasattr(gui_hooks, "reviewer_did_answer_card"):
+            gui_hooks.reviewer_did_answer_card.append(  # type: ignore[attr-defined]
+                lambda _reviewer, card, _ease: on_card_answered(card)
+            )
+    except Exception:
+        # Without hooks the cache is only refreshed on restart; resource
+        # dialogs still accept any typed deck name.
+        pass
+
     # When Anki's theme changes (light <-> dark), update LanguageForge theme
     # immediately if using "anki_auto" mode.
     try:
@@ -73,6 +102,10 @@ def init_addon() -> None:
             def _on_theme_changed() -> None:
                 global _ff_widget
                 if _ff_widget is not None:
+                    # Drop the cached dark-mode state whatever the theme
+                    # setting, so switching to anki_auto later sees it.
+                    if hasattr(_ff_widget, "on_anki_theme_changed"):
+                        _ff_widget.on_anki_theme_changed()
                     # Reload settings to check if we're in anki_auto mode
                     settings = load_settings()
                     if settings.theme == "anki_auto":
@@ -81,17 +114,6 @@ def init_addon() -> None:
                             _ff_widget._current_theme_colors = _ff_widget._get_current_theme_colors()  # type: ignore[attr-defined]
                         if hasattr(_ff_widget, "_apply_tab_styles"):
                             _ff_widget._apply_tab_styles()  # type: ignore[attr-defined]
-                        # First rebuild dashboard resources preview so new
-                        # Open buttons exist before we apply theme & font.
-                        try:
-                            dashboard = getattr(_ff_widget, "dashboard_view", None)
-                            if dashboard is not None and hasattr(dashboard, "refresh_resources_from_storage"):
-                                dashboard.refresh_resources_from_storage()  # type: ignore[attr-defined]
-                        except Exception:
-                            # If anything goes wrong, fall back to theme
-                            # application only.
-                            pass
-
                         if hasattr(_ff_widget, "_apply_theme_to_all_views"):
                             _ff_widget._apply_theme_to_all_views()  # type: ignore[attr-defined]
                         if hasattr(_ff_widget, "_apply_font_size"):